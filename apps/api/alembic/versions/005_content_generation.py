@@ -0,0 +1,37 @@
+"""005 add content generation counter
+
+Revision ID: 005_content_generation
+Revises: 004_embedding_dimension_768
+Create Date: 2026-10-17 00:00:00.000000
+
+Adds a single-row content_generation table. RAGRepository bumps it in the same
+transaction as every chunk insert/delete so API processes can invalidate their
+retrieval result caches when ingestion changes content.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_content_generation'
+down_revision = '004_embedding_dimension_768'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'content_generation',
+        sa.Column('id', sa.SmallInteger(), primary_key=True),
+        sa.Column('generation', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+    )
+    op.execute("INSERT INTO content_generation (id, generation) VALUES (1, 0)")
+
+
+def downgrade() -> None:
+    op.drop_table('content_generation')
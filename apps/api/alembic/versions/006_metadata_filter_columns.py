@@ -0,0 +1,75 @@
+"""006 promote metadata filter fields to indexed columns
+
+Revision ID: 006_metadata_filter_columns
+Revises: 005_content_generation
+Create Date: 2026-10-17 00:00:00.000000
+
+Adds stored generated columns doc_type, destination (text) and tags (text[])
+derived from content_embeddings.metadata, with btree indexes on the scalar
+columns and a GIN index on tags. Retrieval filters use these columns
+(tag filters via array containment) so filtered HNSW and full-text searches
+can prune with indexes instead of matching serialized JSONB text.
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006_metadata_filter_columns'
+down_revision = '005_content_generation'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Generated columns may only call immutable functions and cannot contain
+    # subqueries, so the JSONB -> text[] conversion lives in a SQL function.
+    # A bare string tag becomes a one-element array.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION content_metadata_tags(metadata jsonb)
+        RETURNS text[]
+        LANGUAGE sql
+        IMMUTABLE PARALLEL SAFE
+        AS $$
+            SELECT CASE jsonb_typeof(metadata -> 'tags')
+                WHEN 'array' THEN ARRAY(SELECT jsonb_array_elements_text(metadata -> 'tags'))
+                WHEN 'string' THEN ARRAY[metadata ->> 'tags']
+                ELSE '{}'::text[]
+            END
+        $$
+    """)
+
+    op.execute("""
+        ALTER TABLE content_embeddings
+        ADD COLUMN IF NOT EXISTS doc_type text
+            GENERATED ALWAYS AS (metadata ->> 'doc_type') STORED,
+        ADD COLUMN IF NOT EXISTS destination text
+            GENERATED ALWAYS AS (metadata ->> 'destination') STORED,
+        ADD COLUMN IF NOT EXISTS tags text[]
+            GENERATED ALWAYS AS (content_metadata_tags(metadata)) STORED
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_content_embeddings_doc_type
+        ON content_embeddings (doc_type)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_content_embeddings_destination
+        ON content_embeddings (destination)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_content_embeddings_tags
+        ON content_embeddings USING gin (tags)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_content_embeddings_tags")
+    op.execute("DROP INDEX IF EXISTS idx_content_embeddings_destination")
+    op.execute("DROP INDEX IF EXISTS idx_content_embeddings_doc_type")
+    op.execute("""
+        ALTER TABLE content_embeddings
+        DROP COLUMN IF EXISTS tags,
+        DROP COLUMN IF EXISTS destination,
+        DROP COLUMN IF EXISTS doc_type
+    """)
+    op.execute("DROP FUNCTION IF EXISTS content_metadata_tags(jsonb)")
@@ -0,0 +1,61 @@
+"""007 add half-precision and binary-quantized embedding columns
+
+Revision ID: 007_quantized_embeddings
+Revises: 006_metadata_filter_columns
+Create Date: 2026-10-17 00:00:00.000000
+
+Adds embedding_half (halfvec(768), 2 bytes/dim) and embedding_bit (bit(768),
+1 bit/dim) alongside the full vector, each with its own HNSW index. With
+RAG_VECTOR_SEARCH_MODE=halfvec|binary the retriever shortlists candidates on
+the compact index and re-ranks them with exact cosine on the full vector.
+Existing rows are backfilled; ingestion writes all three representations.
+
+Requires pgvector >= 0.7 (halfvec, bit indexes, binary_quantize).
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007_quantized_embeddings'
+down_revision = '006_metadata_filter_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE content_embeddings
+        ADD COLUMN IF NOT EXISTS embedding_half halfvec(768),
+        ADD COLUMN IF NOT EXISTS embedding_bit bit(768)
+    """)
+
+    op.execute("""
+        UPDATE content_embeddings
+        SET embedding_half = embedding::halfvec(768),
+            embedding_bit = binary_quantize(embedding)::bit(768)
+        WHERE embedding IS NOT NULL
+    """)
+
+    # Same graph parameters as idx_content_embeddings_hnsw (migration 004)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_content_embeddings_half_hnsw
+        ON content_embeddings
+        USING hnsw (embedding_half halfvec_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_content_embeddings_bit_hnsw
+        ON content_embeddings
+        USING hnsw (embedding_bit bit_hamming_ops)
+        WITH (m = 16, ef_construction = 64)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_content_embeddings_bit_hnsw")
+    op.execute("DROP INDEX IF EXISTS idx_content_embeddings_half_hnsw")
+    op.execute("""
+        ALTER TABLE content_embeddings
+        DROP COLUMN IF EXISTS embedding_bit,
+        DROP COLUMN IF EXISTS embedding_half
+    """)
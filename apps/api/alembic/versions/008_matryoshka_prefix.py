@@ -0,0 +1,52 @@
+"""008 add normalized 256-d Matryoshka prefix column
+
+Revision ID: 008_matryoshka_prefix
+Revises: 007_quantized_embeddings
+Create Date: 2026-10-17 00:00:00.000000
+
+text-embedding-004 vectors are Matryoshka-trained: their leading dimensions
+form a usable lower-dimensional embedding once re-normalized. embedding_256
+stores l2_normalize(subvector(embedding, 1, 256)) with its own HNSW index.
+With RAG_VECTOR_SEARCH_MODE=matryoshka the retriever shortlists on it and
+re-ranks with exact cosine on the full 768-d vector; the query prefix is
+derived locally, so there is still one embedding call per query.
+
+Requires pgvector >= 0.7 (subvector, l2_normalize).
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008_matryoshka_prefix'
+down_revision = '007_quantized_embeddings'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TABLE content_embeddings
+        ADD COLUMN IF NOT EXISTS embedding_256 vector(256)
+    """)
+
+    op.execute("""
+        UPDATE content_embeddings
+        SET embedding_256 = l2_normalize(subvector(embedding, 1, 256))::vector(256)
+        WHERE embedding IS NOT NULL
+    """)
+
+    # Same graph parameters as idx_content_embeddings_hnsw (migration 004)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_content_embeddings_256_hnsw
+        ON content_embeddings
+        USING hnsw (embedding_256 vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_content_embeddings_256_hnsw")
+    op.execute("""
+        ALTER TABLE content_embeddings
+        DROP COLUMN IF EXISTS embedding_256
+    """)
@@ -15,6 +15,7 @@ from app.core.config import settings
 from app.core.rate_limit import limiter
 from app.core.security import validate_message_safety
 from app.domain.orchestration import ChatOrchestrator
+from app.domain.orchestration.components import get_orchestration_components
 from app.domain.orchestration.types import ChatRequest
 from app.infrastructure.db.session import get_db
 
@@ -82,8 +83,8 @@ async def chat_endpoint(
             logger.warning(f"Security validation failed for message: {payload.message[:100]}")
             raise HTTPException(status_code=400, detail=security_error)
 
-        # Create orchestrator
-        orchestrator = ChatOrchestrator(db)
+        # Bind app-lifetime components to this request's DB session
+        orchestrator = ChatOrchestrator(db, components=get_orchestration_components())
 
         # Build request with sanitized message
         chat_request = ChatRequest(
@@ -148,7 +149,7 @@ async def chat_stream_endpoint(
                 yield _sse_data("error", "security_validation_failed", {"detail": security_error})
                 return
 
-            orchestrator = ChatOrchestrator(db)
+            orchestrator = ChatOrchestrator(db, components=get_orchestration_components())
             chat_request = ChatRequest(
                 message=clean_message,
                 session_id=payload.session_id,
@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.orchestration import ChatOrchestrator
+from app.domain.orchestration import SessionManager
 from app.infrastructure.db.session import get_db
 
 router = APIRouter()
@@ -67,8 +67,7 @@ async def get_session(
         HTTPException: If session not found
     """
     try:
-        orchestrator = ChatOrchestrator(db)
-        session = await orchestrator.get_session(session_id)
+        session = await SessionManager(db).get_session(session_id)
 
         if not session:
             raise HTTPException(
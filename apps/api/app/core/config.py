@@ -53,6 +53,7 @@ class Settings(BaseSettings):
     llm_max_retries: int = 3
     llm_retry_delay: float = 1.0
     llm_timeout_ms: int = 10000
+    llm_max_concurrency: int = 8  # Max in-flight Gemini generate requests per worker
     llm_rpm_limit: int = 15
     llm_tpm_limit: int = 250_000
     llm_rpd_limit: int = 1_000
@@ -64,12 +65,16 @@ class Settings(BaseSettings):
     embedding_batch_size: int = 100
     embedding_cache_size: int = 1000
     embedding_cache_ttl: int = 3600  # 1 hour in seconds
+    # SQLite file for the persistent embedding cache shared by workers and ingestion (unset: memory only)
+    embedding_cache_path: Optional[str] = None
     embedding_max_retries: int = 3
     embedding_retry_delay: float = 1.0
     embedding_timeout_ms: int = 10000
     embedding_rpm_limit: int = 100
     embedding_tpm_limit: int = 30_000
     embedding_rpd_limit: int = 1_000
+    # Max in-flight embedding requests per provider; unset derives it from embedding_rpm_limit
+    embedding_max_concurrency: Optional[int] = None
 
     # Shared quota/rate limiting
     rate_window_seconds: int = 60
@@ -80,12 +85,40 @@ class Settings(BaseSettings):
     enable_rag: bool = True
     rag_top_k: int = 8  # Increased to get more context for comprehensive answers
     rag_min_similarity: float = 0.5
+    # HNSW recall profile (fast | balanced | exact); iterative scans need pgvector >= 0.8
+    rag_recall_profile: Literal["fast", "balanced", "exact"] = "balanced"
+    rag_hnsw_iterative_scan: bool = True
+    # Vector leg: "full" searches vector(768); "halfvec"/"binary"/"matryoshka" (256-d prefix)
+    # shortlist on the compact column (top_k * multiplier candidates) and re-rank with exact
+    # cosine on the full vector
+    rag_vector_search_mode: Literal["full", "halfvec", "binary", "matryoshka"] = "full"
+    rag_shortlist_multiplier: int = 4
     rag_chunk_size: int = 512
+    # Context packing: drop overlapping chunks of one document, merge adjacent
+    # chunk_index runs, then fill the token budget by MMR (relevance vs redundancy)
+    rag_context_packing_enabled: bool = True
+    rag_context_token_budget: int = 2000
+    rag_context_dedup_overlap: float = 0.8
+    rag_context_mmr_lambda: float = 0.7
     rag_chunk_overlap: int = 50
+    # "pgvector": ANN in Postgres; "local": in-process NumPy index (requires the local-index extra)
+    rag_retriever_backend: Literal["pgvector", "local"] = "pgvector"
+    # Memory-mapped index artifact root for the local backend (ingest_content.py --export-index)
+    rag_local_index_path: Optional[str] = None
+    # Retrieval result cache, invalidated when ingestion bumps the content generation
+    rag_result_cache_enabled: bool = True
+    rag_result_cache_size: int = 512
+    rag_result_cache_ttl: int = 600  # seconds
+    rag_result_cache_negative_ttl: int = 60  # seconds, for NO_DATA results
+    rag_content_generation_check_seconds: float = 5.0
 
     # Hybrid Search Configuration
     rag_use_hybrid: bool = True
     rag_keyword_weight: float = 0.3  # 30% keyword, 70% semantic
+    rag_rrf_k: int = 60  # Reciprocal Rank Fusion constant
+    # Per-leg hybrid timeouts; an embedding timeout degrades to keyword-only results
+    rag_embedding_timeout_ms: int = 2500
+    rag_keyword_timeout_ms: int = 1500
 
     # Orchestration Configuration
     max_message_length: int = 2000
@@ -97,6 +130,22 @@ class Settings(BaseSettings):
     adk_router_timeout_ms: int = 5000
     adk_specialist_timeout_ms: int = 10000
     rag_timeout_ms: int = 4000
+    # Speculative RAG prefetch: retrieve for the raw message while the router runs
+    adk_rag_prefetch_enabled: bool = False
+    adk_rag_prefetch_max_distance: float = 0.15  # Cosine distance between query embeddings
+    # "tool": specialists call rag_search_tool; "pregrounded": orchestrator retrieves
+    # with route filters and injects the context into the first specialist prompt
+    adk_specialist_grounding_mode: Literal["tool", "pregrounded"] = "tool"
+    # Local keyword-model safety classifier; the LLM is consulted only below these confidences.
+    # Opt-in: its weights are only validated in-sample on the fixture
+    safety_local_classifier_enabled: bool = False
+    safety_local_medical_confidence: float = 0.85
+    safety_local_emergency_confidence: float = 0.95
+    # Temperature-0 classifier verdicts keyed by normalized message + prompt version
+    safety_classifier_cache_enabled: bool = True
+    safety_classifier_cache_size: int = 2000
+    safety_classifier_cache_ttl: int = 86400  # 24 hours
+    safety_classifier_cache_path: Optional[str] = None  # SQLite file to keep verdicts across restarts
     enable_agent_routing: bool = True
     default_agent: str = "retrieval"
 
@@ -74,6 +74,8 @@ class QuotaDecision:
     wait_seconds: float
     reason: str
     snapshot: QuotaSnapshot
+    reserved_at: Optional[float] = None
+    request_tokens: int = 0
 
     def to_dict(self) -> Dict[str, object]:
         return {
@@ -196,6 +198,8 @@ class _BucketLimiter:
                         wait_seconds=total_wait,
                         reason="allowed",
                         snapshot=updated_snapshot,
+                        reserved_at=now,
+                        request_tokens=request_tokens,
                     )
 
                 wait_for_rpm = 0.0
@@ -220,6 +224,22 @@ class _BucketLimiter:
             await asyncio.sleep(wait_seconds)
             total_wait += wait_seconds
 
+    def release(self, reserved_at: float, request_tokens: int) -> bool:
+        """
+        Return a reservation whose request was abandoned before completing.
+
+        Synchronous so it is safe to call from cancellation handlers.
+        """
+        try:
+            self._events.remove((reserved_at, request_tokens))
+        except ValueError:
+            return False
+        try:
+            self._daily_events.remove(reserved_at)
+        except ValueError:
+            pass
+        return True
+
 
 class QuotaManager:
     """Centralized process-level quota manager."""
@@ -277,6 +297,15 @@ class QuotaManager:
             wait_for_capacity=wait_for_capacity,
         )
 
+    def release(self, decision: Optional[QuotaDecision]) -> bool:
+        """Release an allowed reservation (e.g. a cancelled in-flight call)."""
+        if decision is None or not decision.allowed or decision.reserved_at is None:
+            return False
+        return self._limiters[decision.bucket].release(
+            decision.reserved_at,
+            decision.request_tokens,
+        )
+
     def snapshot(self, bucket: QuotaBucketName) -> QuotaSnapshot:
         return self._limiters[bucket]._snapshot(time.time())
 
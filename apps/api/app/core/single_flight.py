@@ -0,0 +1,116 @@
+"""
+Single-flight coalescing of identical concurrent calls.
+
+When a burst of users sends the same message, every concurrent request
+misses the embedding/classifier caches before the first response fills
+them, and each one spends RPM/RPD quota on an identical API call. A
+``SingleFlight`` table keyed like those caches lets the first caller run
+the call while later callers await the same task:
+
+- The result or exception of the shared call is delivered to every waiter.
+- Cancelling one waiter does not cancel the call for the others; the call
+  is cancelled only when every waiter has gone away.
+- The key is released when the call finishes, so later calls run fresh
+  (caching stays the job of the caches).
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Task
+    waiters: int = 0
+
+
+@dataclass
+class SingleFlight:
+    """In-flight request table for one kind of call."""
+
+    name: str
+    calls: int = 0
+    coalesced: int = 0
+    _flights: Dict[Hashable, _Flight] = field(default_factory=dict, repr=False)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``fn()`` once per key among concurrent callers.
+
+        Args:
+            key: Identity of the call (e.g. model + text hash)
+            fn: Zero-argument coroutine factory performing the call
+
+        Returns:
+            The shared call's result
+
+        Raises:
+            Whatever the shared call raised
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            self.calls += 1
+            flight = _Flight(task=asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _task: self._release(key, flight))
+        else:
+            self.coalesced += 1
+            logger.debug(f"Coalesced in-flight {self.name} call")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _release(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Nobody left to observe a failure (all waiters cancelled)
+        if not flight.task.cancelled():
+            flight.task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dictionary with executed calls, coalesced calls and calls in flight
+        """
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._flights),
+        }
+
+
+_tables: Dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """Return the process-wide table registered under ``name``."""
+    table = _tables.get(name)
+    if table is None:
+        table = _tables[name] = SingleFlight(name)
+    return table
+
+
+def get_single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """Coalescing statistics for every registered table."""
+    return {name: table.get_stats() for name, table in _tables.items()}
+
+
+def reset_single_flights() -> None:
+    """Forget all registered tables (test helper)."""
+    _tables.clear()
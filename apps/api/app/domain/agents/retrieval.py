@@ -116,6 +116,7 @@ class RetrievalAgent(Agent):
                     "has_rag_context": bool(rag_context_str),
                     "has_citations": has_citations,
                     "citations": rag_context.citations if rag_context else [],
+                    "rag_packing": rag_context.packing if rag_context else None,
                 },
             )
 
@@ -0,0 +1,293 @@
+"""
+Verdict cache for the temperature-0 LLM safety classifiers.
+
+``MedicalQueryDetector`` and ``EmergencyDetector`` ask the LLM a yes/no
+question about the raw message at temperature 0, so a verdict can be reused
+for a repeated message ("what is DCS?"). Entries are keyed by
+sha256(prompt version + normalized message). The prompt version hashes the
+classifier prompt and model, so editing either one orphans the old entries
+instead of serving stale verdicts.
+
+Only verdicts parsed from an LLM response are cached; error fallbacks are not.
+With ``safety_classifier_cache_path`` set, verdicts are also written to a
+SQLite file and survive restarts. The detectors use ``aget``/``aset``, which
+run the SQLite calls in a worker thread with a short busy timeout, so a
+locked file costs a cache miss rather than stalling the event loop.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from app.core.config import settings
+from app.infrastructure.services.rag.cache import normalize_query
+
+logger = logging.getLogger(__name__)
+
+# Busy timeout: a locked database fails fast and is treated as a miss
+_BUSY_TIMEOUT_SECONDS = 0.5
+
+
+def prompt_version(prompt: str, model: str) -> str:
+    """Short hash identifying a classifier prompt + model."""
+    return hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).hexdigest()[:16]
+
+
+class _VerdictStore:
+    """Classifier verdicts in a SQLite file (WAL mode, shared across processes)."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.path),
+            timeout=_BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS classifier_verdicts (
+                name TEXT NOT NULL,
+                key TEXT NOT NULL,
+                verdict INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (name, key)
+            ) WITHOUT ROWID
+            """
+        )
+
+    def get(self, name: str, key: str) -> Optional[Tuple[bool, float]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT verdict, expires_at FROM classifier_verdicts WHERE name = ? AND key = ?",
+                (name, key),
+            ).fetchone()
+        if row is None or row[1] <= time.time():
+            return None
+        return bool(row[0]), row[1]
+
+    def set(self, name: str, key: str, verdict: bool, expires_at: float) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO classifier_verdicts (name, key, verdict, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (name, key, int(verdict), expires_at),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class ClassifierCache:
+    """
+    LRU cache with TTL for classifier verdicts.
+
+    Stores (verdict, expires_at) tuples, with wall-clock expiry so persisted
+    entries keep their TTL across restarts.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        version: str,
+        max_size: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        store: Optional[_VerdictStore] = None,
+    ):
+        """
+        Initialize classifier cache.
+
+        Args:
+            name: Classifier name (namespaces persisted entries)
+            version: Prompt version from prompt_version()
+            max_size: Maximum number of entries (default: from settings)
+            ttl_seconds: Time-to-live in seconds (default: from settings)
+            store: Persistent SQLite store (optional)
+        """
+        self.name = name
+        self.version = version
+        self.max_size = max_size or settings.safety_classifier_cache_size
+        self.ttl_seconds = ttl_seconds or settings.safety_classifier_cache_ttl
+        self.store = store
+        self.cache: OrderedDict[str, Tuple[bool, float]] = OrderedDict()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def make_key(self, message: str) -> str:
+        """Hash of the prompt version and normalized message."""
+        return hashlib.sha256(
+            f"{self.version}:{normalize_query(message)}".encode("utf-8")
+        ).hexdigest()
+
+    def get(self, message: str) -> Optional[bool]:
+        """
+        Get a cached verdict.
+
+        Args:
+            message: Raw user message
+
+        Returns:
+            Cached verdict, or None on miss
+        """
+        key = self.make_key(message)
+        entry = self._get_local(key)
+        if entry is None and self.store is not None:
+            entry = self._promote(key, self._read_store(key))
+        return self._count(key, entry)
+
+    async def aget(self, message: str) -> Optional[bool]:
+        """Like ``get``, with the persistent-store lookup off the event loop."""
+        key = self.make_key(message)
+        entry = self._get_local(key)
+        if entry is None and self.store is not None:
+            entry = self._promote(key, await asyncio.to_thread(self._read_store, key))
+        return self._count(key, entry)
+
+    def set(self, message: str, verdict: bool) -> None:
+        """
+        Store a verdict parsed from an LLM response.
+
+        Args:
+            message: Raw user message
+            verdict: Classifier verdict
+        """
+        key, entry = self._set_local(message, verdict)
+        if self.store is not None:
+            self._write_store(key, entry)
+
+    async def aset(self, message: str, verdict: bool) -> None:
+        """Like ``set``, with the persistent-store write off the event loop."""
+        key, entry = self._set_local(message, verdict)
+        if self.store is not None:
+            await asyncio.to_thread(self._write_store, key, entry)
+
+    def _get_local(self, key: str) -> Optional[Tuple[bool, float]]:
+        entry = self.cache.get(key)
+        if entry is not None and entry[1] <= time.time():
+            del self.cache[key]
+            return None
+        return entry
+
+    def _read_store(self, key: str) -> Optional[Tuple[bool, float]]:
+        try:
+            return self.store.get(self.name, key)
+        except sqlite3.Error as exc:
+            logger.warning(f"Classifier cache read failed: {exc}")
+            return None
+
+    def _promote(
+        self, key: str, entry: Optional[Tuple[bool, float]]
+    ) -> Optional[Tuple[bool, float]]:
+        if entry is not None:
+            self.store_hits += 1
+            self._put(key, entry)
+        return entry
+
+    def _count(self, key: str, entry: Optional[Tuple[bool, float]]) -> Optional[bool]:
+        if entry is None:
+            self.misses += 1
+            return None
+        self.cache.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _set_local(self, message: str, verdict: bool) -> Tuple[str, Tuple[bool, float]]:
+        key = self.make_key(message)
+        entry = (verdict, time.time() + self.ttl_seconds)
+        self._put(key, entry)
+        return key, entry
+
+    def _write_store(self, key: str, entry: Tuple[bool, float]) -> None:
+        # Best effort: a locked or failing store only costs a future LLM call
+        try:
+            self.store.set(self.name, key, *entry)
+        except sqlite3.Error as exc:
+            logger.warning(f"Classifier cache write failed: {exc}")
+
+    def _put(self, key: str, entry: Tuple[bool, float]) -> None:
+        if key not in self.cache and len(self.cache) >= self.max_size:
+            self.cache.popitem(last=False)
+            self.evictions += 1
+        self.cache[key] = entry
+        self.cache.move_to_end(key)
+
+    def clear(self) -> None:
+        """Clear in-memory entries and statistics (the persistent store is left intact)."""
+        self.cache.clear()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_stats(self) -> Dict[str, Union[int, float, str]]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses, hit_rate and prompt version
+        """
+        total_requests = self.hits + self.misses
+        return {
+            "version": self.version,
+            "size": len(self.cache),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total_requests if total_requests > 0 else 0.0,
+        }
+
+
+_caches: Dict[Tuple[str, str], ClassifierCache] = {}
+_stores: Dict[str, _VerdictStore] = {}
+
+
+def _get_store() -> Optional[_VerdictStore]:
+    path = settings.safety_classifier_cache_path
+    if not path:
+        return None
+    store = _stores.get(path)
+    if store is None:
+        try:
+            store = _stores[path] = _VerdictStore(path)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning(f"Persistent classifier cache unavailable at {path}: {exc}")
+            return None
+    return store
+
+
+def get_classifier_cache(name: str, prompt: str, model: str) -> Optional[ClassifierCache]:
+    """Return the process-wide cache for a classifier prompt (None when disabled)."""
+    if not settings.safety_classifier_cache_enabled:
+        return None
+    version = prompt_version(prompt, model)
+    cache = _caches.get((name, version))
+    if cache is None:
+        cache = _caches[(name, version)] = ClassifierCache(name, version, store=_get_store())
+    return cache
+
+
+def get_classifier_cache_stats() -> Dict[str, Dict[str, Union[int, float, str]]]:
+    """Hit-rate statistics for every classifier cache, keyed by classifier name."""
+    return {name: cache.get_stats() for (name, _), cache in _caches.items()}
+
+
+def reset_classifier_caches() -> None:
+    """Forget all caches and close persistent stores (test helper)."""
+    _caches.clear()
+    for store in _stores.values():
+        store.close()
+    _stores.clear()
@@ -0,0 +1,130 @@
+"""App-lifetime orchestration components shared across chat requests."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from app.core.config import settings
+from app.infrastructure.services.rag.pipeline import RAGPipeline
+
+from .agent_router import AgentRouter
+from .context_builder import ContextBuilder
+from .emergency_detector_hybrid import EmergencyDetector
+from .mode_detector import ModeDetector
+from .response_formatter import ResponseFormatter
+
+try:
+    from .gemini_orchestrator import GeminiOrchestrator
+except Exception:  # pragma: no cover - fallback for slim production deployments
+    GeminiOrchestrator = None  # type: ignore[assignment]
+
+try:
+    from app.infrastructure.adk import ADKNativeGraphOrchestrator
+    from app.infrastructure.adk.tools import ADKToolbox
+except Exception:  # pragma: no cover - fallback for partially deployed environments
+    ADKNativeGraphOrchestrator = None  # type: ignore[assignment]
+    ADKToolbox = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OrchestrationComponents:
+    """
+    Heavy, stateless-by-contract dependencies of ``ChatOrchestrator``.
+
+    Built once per process in ``app.main.lifespan`` so the embedding cache,
+    Gemini clients and ADK runners survive between turns. ADK sessions do not:
+    each runner call gets a fresh session that is deleted afterwards. Only the
+    database session is bound per request.
+    """
+
+    rag_pipeline: RAGPipeline
+    context_builder: ContextBuilder
+    agent_router: AgentRouter
+    mode_detector: ModeDetector
+    response_formatter: ResponseFormatter
+    emergency_detector: EmergencyDetector
+    native_graph_orchestrator: Optional[Any] = None
+    orchestrator: Optional[Any] = None
+
+    @classmethod
+    def build(cls) -> "OrchestrationComponents":
+        """Construct the component graph from settings."""
+        rag_pipeline = RAGPipeline()
+        emergency_detector = EmergencyDetector()
+
+        native_graph_orchestrator = None
+        if (
+            settings.enable_adk
+            and settings.enable_adk_native_graph
+            and ADKNativeGraphOrchestrator is not None
+        ):
+            try:
+                native_graph_orchestrator = ADKNativeGraphOrchestrator(
+                    tools=ADKToolbox(
+                        rag_pipeline=rag_pipeline,
+                        emergency_detector=emergency_detector,
+                    )
+                )
+                logger.info(
+                    "Google ADK native graph enabled with model=%s",
+                    settings.adk_model,
+                )
+            except Exception:
+                logger.warning(
+                    "Failed to initialize ADK native graph; using legacy ADK router fallback",
+                    exc_info=True,
+                )
+
+        # Legacy ADK router fallback remains available for staged rollout.
+        orchestrator = None
+        if settings.enable_adk and GeminiOrchestrator is not None:
+            try:
+                orchestrator = GeminiOrchestrator()
+                logger.info(
+                    "Google ADK orchestration enabled with model=%s",
+                    settings.adk_model,
+                )
+            except Exception:
+                logger.warning(
+                    "Failed to initialize ADK router; using mode detector fallback",
+                    exc_info=True,
+                )
+        elif settings.enable_adk:
+            logger.warning(
+                "Google ADK package unavailable; using mode detector fallback"
+            )
+        else:
+            logger.info("Google ADK disabled; using mode detector fallback")
+
+        return cls(
+            rag_pipeline=rag_pipeline,
+            context_builder=ContextBuilder(rag_pipeline=rag_pipeline),
+            agent_router=AgentRouter(),
+            mode_detector=ModeDetector(),
+            response_formatter=ResponseFormatter(),
+            emergency_detector=emergency_detector,
+            native_graph_orchestrator=native_graph_orchestrator,
+            orchestrator=orchestrator,
+        )
+
+
+_components: Optional[OrchestrationComponents] = None
+
+
+def get_orchestration_components() -> OrchestrationComponents:
+    """Return the process singleton component container, building it on first use."""
+    global _components
+    if _components is None:
+        _components = OrchestrationComponents.build()
+        logger.info("Orchestration components initialized")
+    return _components
+
+
+def reset_orchestration_components() -> None:
+    """Reset singleton (test helper)."""
+    global _components
+    _components = None
@@ -2,16 +2,24 @@
 Hybrid emergency detector with keyword + LLM validation.
 
 Fast keyword-based detection for clear emergencies, with LLM fallback for ambiguous cases.
+A local keyword model confirms clear-cut ambiguous emergencies before the LLM is asked
+(it never clears one),
+and LLM verdicts are cached per prompt version.
 """
 
+import hashlib
 import json
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from app.core.config import settings
+from app.core.single_flight import get_single_flight
 from app.infrastructure.services.llm.factory import create_llm_provider
 from app.infrastructure.services.llm.types import LLMMessage
 
+from .classifier_cache import get_classifier_cache
+from .safety_classifier import LocalSafetyClassifier
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,10 +105,27 @@ Your task: Determine if this message represents an ACTIVE MEDICAL EMERGENCY.
 Respond with ONLY a JSON object:
 {"is_emergency": true} or {"is_emergency": false}"""
 
-    def __init__(self):
-        """Initialize with optional LLM for ambiguous cases."""
+    def __init__(self, use_local_classifier: Optional[bool] = None):
+        """
+        Initialize with optional LLM for ambiguous cases.
+
+        Args:
+            use_local_classifier: Settle confident ambiguous cases locally
+                (default: settings.safety_local_classifier_enabled)
+        """
         # Lazy init LLM only when needed
         self._llm = None
+        # Identical concurrent messages share one validation call
+        self._in_flight = get_single_flight("emergency_classifier")
+        # Repeated messages reuse the verdict until the prompt or model changes
+        self._cache = get_classifier_cache(
+            "emergency_classifier", self.LLM_VALIDATION_PROMPT, settings.default_llm_model
+        )
+        if use_local_classifier is None:
+            use_local_classifier = settings.safety_local_classifier_enabled
+        self.local_classifier = LocalSafetyClassifier() if use_local_classifier else None
+        self.local_decisions = 0
+        self.llm_calls = 0
         logger.info("EmergencyDetector initialized (hybrid keyword + LLM)")
 
     async def detect_emergency(
@@ -143,6 +168,16 @@ Respond with ONLY a JSON object:
         # Ambiguous case: symptom present but unclear context
         # Use LLM to distinguish "I have chest pain" (emergency) from "What causes chest pain?" (educational)
         if has_symptom:
+            # The local model may only confirm an emergency; it never clears one
+            if self.local_classifier is not None:
+                decision = self.local_classifier.classify_emergency(message)
+                if decision.label is True:
+                    self.local_decisions += 1
+                    logger.warning(
+                        f"🚨 EMERGENCY DETECTED (local, p={decision.probability:.2f}): {message[:50]}..."
+                    )
+                    return True, self.get_emergency_response()
+
             is_emergency = await self._validate_with_llm(message)
             if is_emergency:
                 logger.warning(f"🚨 EMERGENCY DETECTED (LLM validated): {message[:50]}...")
@@ -163,6 +198,16 @@ Respond with ONLY a JSON object:
         Returns:
             True if LLM confirms emergency
         """
+        if self._cache is not None:
+            cached = await self._cache.aget(message)
+            if cached is not None:
+                return cached
+
+        message_hash = hashlib.sha256(message.encode("utf-8")).hexdigest()
+        return await self._in_flight.do(message_hash, lambda: self._classify_with_llm(message))
+
+    async def _classify_with_llm(self, message: str) -> bool:
+        self.llm_calls += 1
         try:
             # Lazy initialization of LLM
             if self._llm is None:
@@ -183,10 +228,14 @@ Respond with ONLY a JSON object:
             # Parse JSON response
             try:
                 result = json.loads(response_text)
-                return result.get("is_emergency", False)
+                is_emergency = result.get("is_emergency", False)
             except json.JSONDecodeError:
                 # Fallback: check if response contains "true"
-                return "true" in response_text.lower()
+                is_emergency = "true" in response_text.lower()
+
+            if self._cache is not None:
+                await self._cache.aset(message, is_emergency)
+            return is_emergency
 
         except Exception as e:
             logger.error(f"LLM emergency validation failed: {e}", exc_info=True)
@@ -194,6 +243,14 @@ Respond with ONLY a JSON object:
             logger.warning("LLM validation failed, defaulting to EMERGENCY for safety")
             return True
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Local vs cached vs LLM validation counts for ambiguous messages."""
+        return {
+            "local_decisions": self.local_decisions,
+            "llm_calls": self.llm_calls,
+            "cache": self._cache.get_stats() if self._cache is not None else None,
+        }
+
     def get_emergency_response(self) -> str:
         """Get standard emergency response with immediate action guidance."""
         return """⚠️ **EMERGENCY: Seek Immediate Medical Attention**
@@ -8,7 +8,8 @@ the appropriate specialist tool.
 import asyncio
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import uuid4
 
 from google.adk.agents import LlmAgent
@@ -100,21 +101,26 @@ class GeminiOrchestrator:
             "parameters": {"query": query, "reason": reason, "topic": topic},
         }
 
-    async def _ensure_session(self, *, session_id: str, state: Optional[SessionState]) -> None:
-        existing = await self.runner.session_service.get_session(
-            app_name=self.app_name,
-            user_id=self.user_id,
-            session_id=session_id,
-        )
-        if existing:
-            return
-
+    @asynccontextmanager
+    async def _turn_session(
+        self, *, session_id: str, state: Optional[SessionState]
+    ) -> AsyncIterator[str]:
+        """Fresh ADK session for one routing call (history travels in the prompt)."""
+        turn_session_id = f"{session_id}:{uuid4().hex}"
         await self.runner.session_service.create_session(
             app_name=self.app_name,
             user_id=self.user_id,
-            session_id=session_id,
+            session_id=turn_session_id,
             state=state.to_dict() if state else {},
         )
+        try:
+            yield turn_session_id
+        finally:
+            await self.runner.session_service.delete_session(
+                app_name=self.app_name,
+                user_id=self.user_id,
+                session_id=turn_session_id,
+            )
 
     async def route_request(
         self,
@@ -133,8 +139,7 @@ class GeminiOrchestrator:
 
             full_prompt = prompt_context + f"User Request: {message}"
 
-            resolved_session_id = session_id or f"legacy-{uuid4()}"
-            await self._ensure_session(session_id=resolved_session_id, state=state)
+            resolved_session_id = session_id or "legacy"
 
             estimated_tokens = estimate_tokens_from_text(full_prompt) + 128
             await self.quota_manager.reserve(
@@ -145,10 +150,14 @@ class GeminiOrchestrator:
 
             user_message = types.Content(role="user", parts=[types.Part(text=full_prompt)])
 
-            async with asyncio.timeout(max(0.1, settings.adk_router_timeout_ms / 1000)):
+            async with self._turn_session(
+                session_id=resolved_session_id, state=state
+            ) as turn_session_id, asyncio.timeout(
+                max(0.1, settings.adk_router_timeout_ms / 1000)
+            ):
                 async for event in self.runner.run_async(
                     user_id=self.user_id,
-                    session_id=resolved_session_id,
+                    session_id=turn_session_id,
                     new_message=user_message,
                 ):
                     function_calls = event.get_function_calls()
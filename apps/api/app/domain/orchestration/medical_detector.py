@@ -3,15 +3,24 @@ Lightweight medical query detector using LLM.
 
 Uses fast LLM to classify if a user query is about medical/health concerns
 vs general diving questions (dive sites, destinations, certifications).
+A local keyword model answers confident cases first; the LLM only sees the
+ambiguous band, and its verdicts are cached per prompt version.
 """
 
+import hashlib
 import json
 import logging
+from typing import Any, Dict, Optional
 
 from app.core.config import settings
+from app.core.single_flight import get_single_flight
+from app.infrastructure.services.llm.base import LLMProvider
 from app.infrastructure.services.llm.factory import create_llm_provider
 from app.infrastructure.services.llm.types import LLMMessage
 
+from .classifier_cache import get_classifier_cache
+from .safety_classifier import LocalSafetyClassifier
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,14 +51,36 @@ Respond with ONLY a JSON object:
 
 No explanations, no extra text."""
 
-    def __init__(self):
-        """Initialize with fast, lightweight LLM."""
+    def __init__(
+        self,
+        llm_provider: Optional[LLMProvider] = None,
+        use_local_classifier: Optional[bool] = None,
+    ):
+        """
+        Initialize with fast, lightweight LLM.
+
+        Args:
+            llm_provider: Classifier LLM (default: settings provider, temperature 0, 10 tokens)
+            use_local_classifier: Answer confident cases locally
+                (default: settings.safety_local_classifier_enabled)
+        """
         # Use fastest model for quick classification (from settings)
-        self.llm = create_llm_provider(
+        self.llm = llm_provider or create_llm_provider(
             provider_name=settings.default_llm_provider,
             temperature=0.0,  # Deterministic
             max_tokens=10,  # Just need {"is_medical": true/false}
         )
+        # Identical concurrent messages share one classification call
+        self._in_flight = get_single_flight("medical_classifier")
+        # Repeated messages reuse the verdict until the prompt or model changes
+        self._cache = get_classifier_cache(
+            "medical_classifier", self.SYSTEM_PROMPT, settings.default_llm_model
+        )
+        if use_local_classifier is None:
+            use_local_classifier = settings.safety_local_classifier_enabled
+        self.local_classifier = LocalSafetyClassifier() if use_local_classifier else None
+        self.local_decisions = 0
+        self.llm_calls = 0
         logger.info("MedicalQueryDetector initialized")
 
     async def is_medical_query(self, user_message: str) -> bool:
@@ -65,6 +96,26 @@ No explanations, no extra text."""
         if not user_message or len(user_message.strip()) == 0:
             return False
 
+        if self.local_classifier is not None:
+            decision = self.local_classifier.classify_medical(user_message)
+            if decision.label is not None:
+                self.local_decisions += 1
+                logger.info(
+                    f"Medical query classification (local, p={decision.probability:.2f}): "
+                    f"{decision.label} for: {user_message[:50]}..."
+                )
+                return decision.label
+
+        if self._cache is not None:
+            cached = await self._cache.aget(user_message)
+            if cached is not None:
+                return cached
+
+        message_hash = hashlib.sha256(user_message.encode("utf-8")).hexdigest()
+        return await self._in_flight.do(message_hash, lambda: self._classify(user_message))
+
+    async def _classify(self, user_message: str) -> bool:
+        self.llm_calls += 1
         try:
             messages = [
                 LLMMessage(role="system", content=self.SYSTEM_PROMPT),
@@ -79,14 +130,24 @@ No explanations, no extra text."""
                 result = json.loads(response_text)
                 is_medical = result.get("is_medical", False)
                 logger.info(f"Medical query classification: {is_medical} for: {user_message[:50]}...")
-                return is_medical
             except json.JSONDecodeError:
                 # Fallback: check if response contains "true"
                 is_medical = "true" in response_text.lower()
                 logger.warning(f"Failed to parse JSON, fallback result: {is_medical}")
-                return is_medical
+
+            if self._cache is not None:
+                await self._cache.aset(user_message, is_medical)
+            return is_medical
 
         except Exception as e:
             logger.error(f"Medical query detection failed: {e}", exc_info=True)
             # Safe fallback: assume not medical (won't wrongly show disclaimer)
             return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Local vs cached vs LLM classification counts."""
+        return {
+            "local_decisions": self.local_decisions,
+            "llm_calls": self.llm_calls,
+            "cache": self._cache.get_stats() if self._cache is not None else None,
+        }
@@ -11,23 +11,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.core.quota_manager import QuotaExceededError, get_quota_manager
 
-from .agent_router import AgentRouter
-from .context_builder import ContextBuilder
-from .emergency_detector_hybrid import EmergencyDetector
-from .mode_detector import ConversationMode, ModeDetector
-from .response_formatter import ResponseFormatter
+from .components import OrchestrationComponents
+from .mode_detector import ConversationMode
 from .session_manager import SessionManager
 from .types import ChatRequest, ChatResponse, IntentType, SessionData, SessionState
 
 try:
-    from .gemini_orchestrator import GeminiOrchestrator
-except Exception:  # pragma: no cover - fallback for slim production deployments
-    GeminiOrchestrator = None  # type: ignore[assignment]
-
-try:
-    from app.infrastructure.adk import ADKNativeGraphOrchestrator, NativeTurnResult
+    from app.infrastructure.adk import NativeTurnResult
 except Exception:  # pragma: no cover - fallback for partially deployed environments
-    ADKNativeGraphOrchestrator = None  # type: ignore[assignment]
     NativeTurnResult = Any  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
@@ -36,54 +27,30 @@ logger = logging.getLogger(__name__)
 class ChatOrchestrator:
     """Main orchestrator for chat conversations."""
 
-    def __init__(self, db_session: AsyncSession):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        components: Optional[OrchestrationComponents] = None,
+    ):
+        """
+        Bind shared orchestration components to a request-scoped DB session.
+
+        Args:
+            db_session: Database session for this request
+            components: App-lifetime components (if None, builds a private set)
+        """
+        components = components or OrchestrationComponents.build()
+
         self.db_session = db_session
         self.session_manager = SessionManager(db_session)
-        self.context_builder = ContextBuilder()
-        self.agent_router = AgentRouter()
-        self.mode_detector = ModeDetector()
-        self.response_formatter = ResponseFormatter()
-        self.emergency_detector = EmergencyDetector()
+        self.context_builder = components.context_builder
+        self.agent_router = components.agent_router
+        self.mode_detector = components.mode_detector
+        self.response_formatter = components.response_formatter
+        self.emergency_detector = components.emergency_detector
         self.quota_manager = get_quota_manager()
-
-        self.native_graph_orchestrator: Optional[ADKNativeGraphOrchestrator] = None
-        if (
-            settings.enable_adk
-            and settings.enable_adk_native_graph
-            and ADKNativeGraphOrchestrator is not None
-        ):
-            try:
-                self.native_graph_orchestrator = ADKNativeGraphOrchestrator()
-                logger.info(
-                    "Google ADK native graph enabled with model=%s",
-                    settings.adk_model,
-                )
-            except Exception:
-                logger.warning(
-                    "Failed to initialize ADK native graph; using legacy ADK router fallback",
-                    exc_info=True,
-                )
-
-        # Legacy ADK router fallback remains available for staged rollout.
-        self.orchestrator: Optional[GeminiOrchestrator] = None  # type: ignore[type-arg]
-        if settings.enable_adk and GeminiOrchestrator is not None:
-            try:
-                self.orchestrator = GeminiOrchestrator()
-                logger.info(
-                    "Google ADK orchestration enabled with model=%s",
-                    settings.adk_model,
-                )
-            except Exception:
-                logger.warning(
-                    "Failed to initialize ADK router; using mode detector fallback",
-                    exc_info=True,
-                )
-        elif settings.enable_adk:
-            logger.warning(
-                "Google ADK package unavailable; using mode detector fallback"
-            )
-        else:
-            logger.info("Google ADK disabled; using mode detector fallback")
+        self.native_graph_orchestrator = components.native_graph_orchestrator
+        self.orchestrator = components.orchestrator
 
     @staticmethod
     def _route_to_mode(route: str) -> ConversationMode:
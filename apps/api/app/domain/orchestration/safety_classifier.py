@@ -0,0 +1,215 @@
+"""
+Local fast-path safety classifier.
+
+Two small logistic models over keyword-family features score a message in
+microseconds, before the Gemini classifiers are consulted:
+
+- medical: is the message about medical/health concerns?
+  (``MedicalQueryDetector``)
+- emergency: does a message that mentions a symptom describe an active
+  emergency rather than an educational question? (the ambiguous band of
+  ``EmergencyDetector``)
+
+Each model outputs a probability. The medical model answers locally when it
+is confident either way (``max(p, 1 - p) >= confidence``). The emergency
+model may only *confirm* an emergency (``p >= confidence``): a low score
+never clears a symptom-bearing message, because question phrasing ("what do
+we do? diver unconscious") is not evidence of safety. Everything else is
+left to the LLM, which falls back to emergency on failure.
+
+The emergency model only confirms when a first-person subject directly
+governs a symptom ("I feel dizzy", "my buddy is unconscious") *and* the
+message has acute context; a first-person symptom alone scores 0.88 and goes
+to the LLM. Its weights are set by hand so that no non-emergency fixture case
+scores above 0.8. The medical weights were fitted with
+``python -m scripts.evaluate_safety_classifier --fit`` on
+``tests/fixtures/safety_classifier_cases.json``. Both are evaluated on that
+same fixture, so the reported accuracy is in-sample only, and the tier is
+off by default (``safety_local_classifier_enabled``).
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from app.core.config import settings
+
+# Keyword families (matched case-insensitively on word boundaries)
+MEDICAL_FEATURES: Dict[str, str] = {
+    # Only unambiguous phrasings: bare "cold", "heart", "knees" or "lungs" also
+    # describe water temperature, places and gear, so those words alone are left
+    # to the LLM
+    "condition": (
+        r"asthma|diabet\w*|epilep\w*|heart (?:condition|disease|attack|problems?|surgery"
+        r"|murmur|rate)|blood pressure|hypertension|pregnan\w*|(?:a|head|common|chest) cold"
+        r"|flu|sinus\w*|congest\w*|allerg\w*|anxiety|panic|migraine|ear ?drum"
+        r"|(?:bad|sore|injured) knees?|knee (?:injury|surgery|pain)|injur\w*|surgery"
+        r"|medical condition|health condition|illness|disease"
+        r"|(?:lung|respiratory) (?:condition|disease|problems?)|collapsed lung"
+    ),
+    "symptom": (
+        r"pain|aches?|headaches?|dizz\w*|nause\w*|numb\w*|tingl\w*|vomit\w*|bleed\w*"
+        r"|unconscious|confus\w*|seizures?|breath\w*|chest|hearing|ringing|weak\w*"
+        r"|vision|symptoms?|narcosis|seasick\w*|sick|hurts?"
+    ),
+    "medication": (
+        r"medic\w*|medicine|pills?|drugs?|antidepressants?|decongestants?|insulin|prescri\w*"
+    ),
+    "clinical": (
+        r"doctor|physician|health|fit to dive|how fit|physically fit|medically fit|fitness"
+        r"|decompression sickness|dcs|bends|hyperbaric"
+        r"|recompression|fly after|flying after|safe to dive|okay to dive"
+    ),
+    "destination": (
+        r"dive sites?|visibility|season|monsoon|resorts?|book\w*|boat ride|liveaboard|trip"
+        r"|pack|islands?|snorkel\w*|night dive|wreck"
+    ),
+    "training": (
+        r"certif\w*|course|padi|ssi|open water|divemaster|rescue diver|nitrox|log|buoyancy"
+    ),
+    "gear_marine": (
+        r"regulator|wetsuit|fins|mask|computer|camera|gear|turtles?|sharks?|marine life|fish"
+        r"|coral|currents?"
+    ),
+}
+MEDICAL_WEIGHTS: Dict[str, float] = {
+    "condition": 2.0,
+    "symptom": 2.3,
+    "medication": 1.4,
+    "clinical": 1.3,
+    "destination": -1.7,
+    "training": -1.4,
+    "gear_marine": -1.9,
+}
+MEDICAL_BIAS = 0.1
+
+# Symptoms an active emergency reports (mirrors EmergencyDetector.SYMPTOM_KEYWORDS)
+_EMERGENCY_SYMPTOMS = (
+    r"chest pain|(?:can't|cannot|can not) (?:breathe|feel)|(?:difficulty|trouble) breathing"
+    r"|hard to breathe|not breathing|dizzy|numb|paralyzed|bleeding|unconscious|confused"
+    r"|tingling|weak|blurred vision|ringing|vomiting|nause\w*|(?:a |an )?(?:severe )?headache"
+    r"|(?:a )?seizure|convulsing|convulsions"
+)
+_FILLER = r"(?:(?:very|really|so|still|suddenly|getting|feeling|being|going) )?"
+EMERGENCY_FEATURES: Dict[str, str] = {
+    # First person (or "my <person/body part>") directly governing a symptom:
+    # "I feel dizzy", "my arm is numb", "my buddy is unconscious". At most one
+    # intensifier may sit in between ("I'm really dizzy"), so "I am just
+    # curious what causes chest pain" does not match.
+    "first_person_symptom": (
+        r"(?:i|i'm|i am|i've|i feel|i'm feeling|i am feeling|i have|i've got|i had|i keep)"
+        rf" {_FILLER}(?:{_EMERGENCY_SYMPTOMS})"
+        r"|my \w+ (?:is|are|feels?|has|had|keeps?|keep) "
+        rf"{_FILLER}(?:{_EMERGENCY_SYMPTOMS})"
+    ),
+    "acute": (
+        r"right now|since|still|getting worse|this morning|surfaced|on the boat"
+        r"|after (?:my|the) (?:\w+ )?dive|what do we do|please help|need help|^help"
+    ),
+    "question": r"^(?:what|why|how|can|could|does|do|is|are|should|which)",
+    "past_or_hypothetical": r"last (?:week|month|year)|ago|once|if|becomes|when|curious|article",
+}
+EMERGENCY_WEIGHTS: Dict[str, float] = {
+    "first_person_symptom": 3.0,
+    "acute": 1.5,
+    "question": -2.0,
+    "past_or_hypothetical": -2.0,
+}
+EMERGENCY_BIAS = -1.0
+
+
+def _compile(features: Dict[str, str]) -> Dict[str, Pattern[str]]:
+    return {name: re.compile(rf"\b(?:{pattern})\b") for name, pattern in features.items()}
+
+
+@dataclass(frozen=True)
+class LogisticModel:
+    """Logistic regression over binary keyword-family features."""
+
+    features: Dict[str, Pattern[str]]
+    weights: Dict[str, float]
+    bias: float
+
+    def extract(self, message: str) -> List[str]:
+        """Names of the features present in ``message``."""
+        text = message.lower().strip()
+        return [name for name, pattern in self.features.items() if pattern.search(text)]
+
+    def probability(self, message: str) -> Tuple[float, List[str]]:
+        """P(positive | message) and the matched features."""
+        matched = self.extract(message)
+        logit = self.bias + sum(self.weights[name] for name in matched)
+        return 1.0 / (1.0 + math.exp(-logit)), matched
+
+
+MEDICAL_MODEL = LogisticModel(_compile(MEDICAL_FEATURES), MEDICAL_WEIGHTS, MEDICAL_BIAS)
+EMERGENCY_MODEL = LogisticModel(_compile(EMERGENCY_FEATURES), EMERGENCY_WEIGHTS, EMERGENCY_BIAS)
+
+
+@dataclass
+class LocalDecision:
+    """Local classifier output for one message."""
+
+    probability: float
+    label: Optional[bool]  # None inside the ambiguous band: consult the LLM
+    features: List[str] = field(default_factory=list)
+
+    @property
+    def confidence(self) -> float:
+        return max(self.probability, 1.0 - self.probability)
+
+
+class LocalSafetyClassifier:
+    """Fast-path medical/emergency classifier with an ambiguous band for the LLM."""
+
+    def __init__(
+        self,
+        medical_confidence: Optional[float] = None,
+        emergency_confidence: Optional[float] = None,
+    ):
+        """
+        Initialize local classifier.
+
+        Args:
+            medical_confidence: Min confidence to answer medical locally
+                (default: settings.safety_local_medical_confidence)
+            emergency_confidence: Min confidence to answer emergency locally
+                (default: settings.safety_local_emergency_confidence)
+        """
+        self.medical_confidence = (
+            medical_confidence
+            if medical_confidence is not None
+            else settings.safety_local_medical_confidence
+        )
+        self.emergency_confidence = (
+            emergency_confidence
+            if emergency_confidence is not None
+            else settings.safety_local_emergency_confidence
+        )
+
+    @staticmethod
+    def _decide(
+        model: LogisticModel, message: str, confidence: float, allow_negative: bool = True
+    ) -> LocalDecision:
+        probability, matched = model.probability(message)
+        label: Optional[bool] = None
+        if probability >= confidence:
+            label = True
+        elif allow_negative and 1.0 - probability >= confidence:
+            label = False
+        return LocalDecision(probability=probability, label=label, features=matched)
+
+    def classify_medical(self, message: str) -> LocalDecision:
+        """Score whether ``message`` is a medical/health query."""
+        return self._decide(MEDICAL_MODEL, message, self.medical_confidence)
+
+    def classify_emergency(self, message: str) -> LocalDecision:
+        """
+        Score whether a symptom-bearing ``message`` describes an active emergency.
+
+        Confirm-only: the label is True or None, never False.
+        """
+        return self._decide(
+            EMERGENCY_MODEL, message, self.emergency_confidence, allow_negative=False
+        )
@@ -6,7 +6,9 @@ import asyncio
 import logging
 import os
 import time
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional, Tuple
 
 from google.adk.agents import LlmAgent
 from google.adk.models import Gemini
@@ -14,19 +16,23 @@ from google.adk.runners import InMemoryRunner
 from google.genai import types
 
 from app.core.config import settings
-from app.core.quota_manager import QuotaExceededError, get_quota_manager
+from app.core.quota_manager import QuotaDecision, QuotaExceededError, get_quota_manager
 from app.infrastructure.services.cost.token_cost import estimate_tokens_from_text
 from app.prompts.specialists_v1 import (
     NATIVE_CERTIFICATION_SPECIALIST_PROMPT,
     NATIVE_GENERAL_SPECIALIST_PROMPT,
     NATIVE_SAFETY_SPECIALIST_PROMPT,
     NATIVE_TRIP_SPECIALIST_PROMPT,
+    PREGROUNDED_CERTIFICATION_SPECIALIST_PROMPT,
+    PREGROUNDED_GENERAL_SPECIALIST_PROMPT,
+    PREGROUNDED_TRIP_SPECIALIST_PROMPT,
     ROUTER_SYSTEM_PROMPT,
 )
 
-from .tools import ADKToolbox
+from .tools import ADKToolbox, TurnState
 from .types import (
     AgentTurnTrace,
+    GroundingMode,
     NativeTurnResult,
     PolicyValidationResult,
     RouteDecision,
@@ -36,11 +42,44 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# Routes whose answers must be grounded in retrieved content.
+GROUNDED_ROUTES = frozenset(
+    {
+        "trip_specialist",
+        "certification_specialist",
+        "general_retrieval_specialist",
+    }
+)
+
+# Retrieval filters used when the orchestrator pre-grounds a specialist.
+ROUTE_RAG_FILTERS: Dict[str, Dict[str, Any]] = {
+    "trip_specialist": {"doc_type": ["destination", "dive_site"]},
+    "certification_specialist": {
+        "doc_type": [
+            "certification",
+            "certification_context",
+            "certification_limits",
+            "certification_overview",
+            "certification_prerequisites",
+            "certification_professional",
+            "certification_progression",
+            "certification_requirements",
+            "certification_rules",
+            "certification_training",
+            "equivalency",
+        ]
+    },
+}
+
 
 class ADKNativeGraphOrchestrator:
     """Coordinator + specialist ADK graph for one chat turn."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        tools: Optional[ADKToolbox] = None,
+        grounding_mode: Optional[GroundingMode] = None,
+    ):
         self.api_key = settings.gemini_api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise RuntimeError("Gemini API key is required for ADK native graph")
@@ -50,8 +89,11 @@ class ADKNativeGraphOrchestrator:
         self.app_name = "dovvybuddy_adk_graph"
         self.user_id = "backend-native-graph"
 
-        self.tools = ADKToolbox()
+        self.tools = tools or ADKToolbox()
         self.quota_manager = get_quota_manager()
+        self.grounding_mode: GroundingMode = (
+            grounding_mode or settings.adk_specialist_grounding_mode
+        )
 
         self.router_agent = self._build_router_agent()
         self.router_runner = InMemoryRunner(
@@ -89,28 +131,40 @@ class ADKNativeGraphOrchestrator:
             self.tools.safety_classification_tool,
             self.tools.response_policy_tool,
         ]
+        grounded_tools = common_tools
+        trip_prompt = NATIVE_TRIP_SPECIALIST_PROMPT
+        certification_prompt = NATIVE_CERTIFICATION_SPECIALIST_PROMPT
+        general_prompt = NATIVE_GENERAL_SPECIALIST_PROMPT
+        if self.grounding_mode == "pregrounded":
+            # Context arrives in the first prompt, so no retrieval tool round trip.
+            grounded_tools = [
+                tool for tool in common_tools if tool != self.tools.rag_search_tool
+            ]
+            trip_prompt = PREGROUNDED_TRIP_SPECIALIST_PROMPT
+            certification_prompt = PREGROUNDED_CERTIFICATION_SPECIALIST_PROMPT
+            general_prompt = PREGROUNDED_GENERAL_SPECIALIST_PROMPT
         specialist_model = Gemini(model=self.model_name)
 
         return {
             "trip_specialist": LlmAgent(
                 name="trip_specialist",
                 model=specialist_model,
-                instruction=NATIVE_TRIP_SPECIALIST_PROMPT,
-                tools=common_tools,
+                instruction=trip_prompt,
+                tools=grounded_tools,
                 generate_content_config=types.GenerateContentConfig(temperature=0.4),
             ),
             "certification_specialist": LlmAgent(
                 name="certification_specialist",
                 model=specialist_model,
-                instruction=NATIVE_CERTIFICATION_SPECIALIST_PROMPT,
-                tools=common_tools,
+                instruction=certification_prompt,
+                tools=grounded_tools,
                 generate_content_config=types.GenerateContentConfig(temperature=0.3),
             ),
             "general_retrieval_specialist": LlmAgent(
                 name="general_retrieval_specialist",
                 model=specialist_model,
-                instruction=NATIVE_GENERAL_SPECIALIST_PROMPT,
-                tools=common_tools,
+                instruction=general_prompt,
+                tools=grounded_tools,
                 generate_content_config=types.GenerateContentConfig(temperature=0.3),
             ),
             "safety_specialist": LlmAgent(
@@ -122,29 +176,43 @@ class ADKNativeGraphOrchestrator:
             ),
         }
 
-    async def _ensure_session(
+    @asynccontextmanager
+    async def _turn_session(
         self,
         runner: InMemoryRunner,
         *,
         session_id: str,
         state: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        session = await runner.session_service.get_session(
+    ) -> AsyncIterator[str]:
+        """
+        Create a fresh ADK session for one runner call and delete it afterwards.
+
+        The orchestrator lives for the whole process. A long-lived ADK session
+        per chat would make every agent replay all earlier turns' events, on top
+        of the recent history already in the prompt, and would never be freed.
+        A fresh session also picks up the current session state.
+        """
+        turn_session_id = f"{session_id}:{uuid.uuid4().hex}"
+        await runner.session_service.create_session(
             app_name=runner.app_name,
             user_id=self.user_id,
-            session_id=session_id,
+            session_id=turn_session_id,
+            state=dict(state or {}),
         )
-        if not session:
-            await runner.session_service.create_session(
+        try:
+            yield turn_session_id
+        finally:
+            await runner.session_service.delete_session(
                 app_name=runner.app_name,
                 user_id=self.user_id,
-                session_id=session_id,
-                state=state or {},
+                session_id=turn_session_id,
             )
 
-    async def _reserve_text_quota(self, prompt: str, *, expected_output_tokens: int) -> None:
+    async def _reserve_text_quota(
+        self, prompt: str, *, expected_output_tokens: int
+    ) -> QuotaDecision:
         request_tokens = estimate_tokens_from_text(prompt) + max(1, expected_output_tokens)
-        await self.quota_manager.reserve(
+        return await self.quota_manager.reserve(
             "text_generation",
             request_tokens,
             wait_for_capacity=True,
@@ -172,6 +240,19 @@ class ADKNativeGraphOrchestrator:
             return ""
         return current_text
 
+    @staticmethod
+    def _accumulate_usage(usage: Dict[str, int], event: Any) -> None:
+        metadata = getattr(event, "usage_metadata", None)
+        if metadata is None:
+            return
+        usage["llm_calls"] = usage.get("llm_calls", 0) + 1
+        usage["prompt_tokens"] = usage.get("prompt_tokens", 0) + (
+            getattr(metadata, "prompt_token_count", None) or 0
+        )
+        usage["output_tokens"] = usage.get("output_tokens", 0) + (
+            getattr(metadata, "candidates_token_count", None) or 0
+        )
+
     async def _route_request(
         self,
         *,
@@ -180,12 +261,6 @@ class ADKNativeGraphOrchestrator:
         session_id: str,
         session_state: Optional[Dict[str, Any]],
     ) -> Tuple[RouteDecision, List[str]]:
-        await self._ensure_session(
-            self.router_runner,
-            session_id=session_id,
-            state=session_state or {},
-        )
-
         prompt = message
         if history:
             history_str = "\n".join(
@@ -194,34 +269,131 @@ class ADKNativeGraphOrchestrator:
             )
             prompt = f"Recent history:\n{history_str}\n\nUser request:\n{message}"
 
-        await self._reserve_text_quota(prompt, expected_output_tokens=96)
+        reservation = await self._reserve_text_quota(prompt, expected_output_tokens=96)
 
         user_message = types.Content(role="user", parts=[types.Part(text=prompt)])
 
         called_tools: List[str] = []
         route = RouteDecision(route="general_retrieval_specialist", reason="default")
-        async with asyncio.timeout(max(0.1, settings.adk_router_timeout_ms / 1000)):
-            async for event in self.router_runner.run_async(
-                user_id=self.user_id,
-                session_id=session_id,
-                new_message=user_message,
+        try:
+            async with self._turn_session(
+                self.router_runner, session_id=session_id, state=session_state
+            ) as turn_session_id, asyncio.timeout(
+                max(0.1, settings.adk_router_timeout_ms / 1000)
             ):
-                function_calls = event.get_function_calls()
-                for call in function_calls:
-                    called_tools.append(call.name)
-                    args = dict(call.args) if call.args else {}
-                    mapped_route = self._map_route_tool_to_specialist(call.name)
-                    if mapped_route:
-                        route = RouteDecision(
-                            route=mapped_route,
-                            reason=args.get("reason", ""),
-                            confidence=0.85,
-                            parameters=args,
-                        )
-                        return route, called_tools
+                async for event in self.router_runner.run_async(
+                    user_id=self.user_id,
+                    session_id=turn_session_id,
+                    new_message=user_message,
+                ):
+                    function_calls = event.get_function_calls()
+                    for call in function_calls:
+                        called_tools.append(call.name)
+                        args = dict(call.args) if call.args else {}
+                        mapped_route = self._map_route_tool_to_specialist(call.name)
+                        if mapped_route:
+                            route = RouteDecision(
+                                route=mapped_route,
+                                reason=args.get("reason", ""),
+                                confidence=0.85,
+                                parameters=args,
+                            )
+                            return route, called_tools
+        except asyncio.CancelledError:
+            # Router call abandoned (e.g. emergency short-circuit): give the quota back.
+            self.quota_manager.release(reservation)
+            raise
 
         return route, called_tools
 
+    def _start_route_task(
+        self,
+        *,
+        message: str,
+        history: List[Dict[str, str]],
+        session_id: str,
+        session_state: Optional[Dict[str, Any]],
+    ) -> "asyncio.Task[Tuple[RouteDecision, List[str], float]]":
+        """Launch the router call so it overlaps safety classification."""
+
+        async def _timed_route() -> Tuple[RouteDecision, List[str], float]:
+            route_started = time.perf_counter()
+            route_decision, route_tools_called = await self._route_request(
+                message=message,
+                history=history,
+                session_id=session_id,
+                session_state=session_state,
+            )
+            return (
+                route_decision,
+                route_tools_called,
+                (time.perf_counter() - route_started) * 1000,
+            )
+
+        return asyncio.create_task(_timed_route())
+
+    async def _classify_safety(
+        self,
+        *,
+        message: str,
+        history: List[Dict[str, str]],
+    ) -> Tuple[Dict[str, Any], SafetyClassification, float]:
+        safety_started = time.perf_counter()
+        safety_data = await self.tools.safety_classification_tool(
+            message=message,
+            history=history,
+        )
+        safety_latency_ms = (time.perf_counter() - safety_started) * 1000
+        safety_classification = SafetyClassification(
+            classification=safety_data["classification"],
+            is_emergency=safety_data["is_emergency"],
+            is_medical=safety_data["is_medical"],
+        )
+        return safety_data, safety_classification, safety_latency_ms
+
+    async def _resolve_route(
+        self,
+        route_task: "asyncio.Task[Tuple[RouteDecision, List[str], float]]",
+        *,
+        safety_classification: SafetyClassification,
+        phase_started: float,
+    ) -> Tuple[RouteDecision, List[str], float]:
+        """Await the in-flight router, or cancel it when safety short-circuits."""
+        if not safety_classification.is_emergency:
+            return await route_task
+
+        route_task.cancel()
+        await asyncio.gather(route_task, return_exceptions=True)
+        logger.warning("Emergency classification cancelled in-flight router call")
+        return (
+            RouteDecision(
+                route="safety_specialist",
+                reason="emergency_safety_classification",
+                confidence=1.0,
+            ),
+            [],
+            (time.perf_counter() - phase_started) * 1000,
+        )
+
+    async def _ground_specialist_prompt(self, *, route: RouteName, message: str) -> str:
+        """In pre-grounded mode, retrieve up front and prepend the context to the prompt."""
+        if self.grounding_mode != "pregrounded" or route not in GROUNDED_ROUTES:
+            return message
+
+        filters = ROUTE_RAG_FILTERS.get(route)
+        result = await self.tools.rag_search_tool(query=message, filters=filters)
+        if filters and not result["has_data"]:
+            # Route filters can be too narrow for cross-cutting questions; widen
+            # once. The unfiltered prefetch, if any, serves this lookup.
+            result = await self.tools.rag_search_tool(query=message)
+        elif filters:
+            # The filtered context is final: release an in-flight prefetch now
+            # rather than at the end of the turn.
+            self.tools.finish_rag_prefetch(self.tools.current_turn())
+
+        context = "\n\n".join(result["chunks"]) if result["has_data"] else "NO_DATA"
+        return f"Verified context:\n{context}\n\nUser request:\n{message}"
+
     async def _run_specialist(
         self,
         *,
@@ -229,9 +401,8 @@ class ADKNativeGraphOrchestrator:
         message: str,
         session_id: str,
         session_state: Optional[Dict[str, Any]],
-    ) -> Tuple[str, List[str]]:
+    ) -> Tuple[str, List[str], Dict[str, int]]:
         runner = self.specialist_runners[route]
-        await self._ensure_session(runner, session_id=session_id, state=session_state or {})
         await self._reserve_text_quota(
             f"{route}\n{message}",
             expected_output_tokens=max(256, settings.llm_max_tokens),
@@ -240,12 +411,18 @@ class ADKNativeGraphOrchestrator:
         user_message = types.Content(role="user", parts=[types.Part(text=message)])
         response_text = ""
         called_tools: List[str] = []
-        async with asyncio.timeout(max(0.1, settings.adk_specialist_timeout_ms / 1000)):
+        usage: Dict[str, int] = {}
+        async with self._turn_session(
+            runner, session_id=session_id, state=session_state
+        ) as turn_session_id, asyncio.timeout(
+            max(0.1, settings.adk_specialist_timeout_ms / 1000)
+        ):
             async for event in runner.run_async(
                 user_id=self.user_id,
-                session_id=session_id,
+                session_id=turn_session_id,
                 new_message=user_message,
             ):
+                self._accumulate_usage(usage, event)
                 function_calls = event.get_function_calls()
                 for call in function_calls:
                     called_tools.append(call.name)
@@ -257,7 +434,7 @@ class ADKNativeGraphOrchestrator:
                 if event.is_final_response() and text:
                     response_text = text
 
-        return response_text, called_tools
+        return response_text, called_tools, usage
 
     @staticmethod
     def _map_route_tool_to_specialist(tool_name: str) -> Optional[RouteName]:
@@ -272,6 +449,7 @@ class ADKNativeGraphOrchestrator:
     def _build_turn_result(
         self,
         *,
+        turn: TurnState,
         started: float,
         route_decision: RouteDecision,
         safety_data: Dict[str, Any],
@@ -281,11 +459,17 @@ class ADKNativeGraphOrchestrator:
         specialist_tools_called: List[str],
         safety_latency_ms: float,
         route_latency_ms: float,
+        safety_route_latency_ms: float,
         specialist_latency_ms: float,
+        grounding_latency_ms: float,
+        specialist_usage: Dict[str, int],
     ) -> NativeTurnResult:
-        citations = self.tools.last_rag_result.citations
-        rag_invoked = "rag_search_tool" in specialist_tools_called
-        has_verified_data = bool(citations) and self.tools.last_rag_result.has_data
+        citations = turn.rag_result.citations
+        pre_grounded = (
+            self.grounding_mode == "pregrounded" and route_decision.route in GROUNDED_ROUTES
+        )
+        rag_invoked = pre_grounded or "rag_search_tool" in specialist_tools_called
+        has_verified_data = bool(citations) and turn.rag_result.has_data
         response_text = specialist_response.strip()
         if not response_text:
             response_text = (
@@ -305,12 +489,7 @@ class ADKNativeGraphOrchestrator:
             should_append_uncertainty=policy_data["should_append_uncertainty"],
         )
 
-        grounded_routes = {
-            "trip_specialist",
-            "certification_specialist",
-            "general_retrieval_specialist",
-        }
-        if route_decision.route in grounded_routes and not rag_invoked:
+        if route_decision.route in GROUNDED_ROUTES and not rag_invoked:
             policy_validation.policy_enforced = True
             policy_validation.reason = "rag_not_invoked_for_factual_route"
             policy_validation.should_append_uncertainty = True
@@ -332,9 +511,18 @@ class ADKNativeGraphOrchestrator:
             latency_ms={
                 "safety_classification_ms": safety_latency_ms,
                 "route_ms": route_latency_ms,
+                # Wall time of the concurrent safety + route phase; overlap is
+                # safety_classification_ms + route_ms - safety_route_ms.
+                "safety_route_ms": safety_route_latency_ms,
+                # specialist_ms includes grounding_ms (orchestrator-side retrieval).
+                "grounding_ms": grounding_latency_ms,
                 "specialist_ms": specialist_latency_ms,
                 "total_ms": total_latency_ms,
             },
+            grounding_mode=self.grounding_mode,
+            token_usage=specialist_usage,
+            rag_prefetch=self.tools.finish_rag_prefetch(turn),
+            rag_packing=turn.rag_result.packing,
         )
 
         state_updates: Dict[str, Any] = {
@@ -369,7 +557,7 @@ class ADKNativeGraphOrchestrator:
         diver_profile: Optional[Dict[str, Any]] = None,
     ) -> NativeTurnResult:
         started = time.perf_counter()
-        self.tools.set_turn_context(
+        turn = self.tools.set_turn_context(
             session_id=session_id,
             message=message,
             history=conversation_history,
@@ -377,48 +565,79 @@ class ADKNativeGraphOrchestrator:
             diver_profile=diver_profile,
         )
 
-        safety_started = time.perf_counter()
-        safety_data = await self.tools.safety_classification_tool(
-            message=message,
-            history=conversation_history,
-        )
-        safety_latency_ms = (time.perf_counter() - safety_started) * 1000
-        safety_classification = SafetyClassification(
-            classification=safety_data["classification"],
-            is_emergency=safety_data["is_emergency"],
-            is_medical=safety_data["is_medical"],
-        )
+        if settings.adk_rag_prefetch_enabled:
+            # Speculative retrieval overlaps safety + routing; the specialist's
+            # rag_search_tool reuses it when its query is close enough.
+            self.tools.start_rag_prefetch(turn, message)
 
-        route_started = time.perf_counter()
-        route_decision, route_tools_called = await self._route_request(
-            message=message,
-            history=conversation_history,
-            session_id=session_id,
-            session_state=session_state,
-        )
-        route_latency_ms = (time.perf_counter() - route_started) * 1000
+        try:
+            # Safety and routing are independent inputs: run them concurrently.
+            phase_started = time.perf_counter()
+            route_task = self._start_route_task(
+                message=message,
+                history=conversation_history,
+                session_id=session_id,
+                session_state=session_state,
+            )
+            try:
+                (
+                    safety_data,
+                    safety_classification,
+                    safety_latency_ms,
+                ) = await self._classify_safety(
+                    message=message,
+                    history=conversation_history,
+                )
+                (
+                    route_decision,
+                    route_tools_called,
+                    route_latency_ms,
+                ) = await self._resolve_route(
+                    route_task,
+                    safety_classification=safety_classification,
+                    phase_started=phase_started,
+                )
+            finally:
+                if not route_task.done():
+                    route_task.cancel()
+            safety_route_latency_ms = (time.perf_counter() - phase_started) * 1000
 
-        specialist_started = time.perf_counter()
-        specialist_response, specialist_tools_called = await self._run_specialist(
-            route=route_decision.route,
-            message=message,
-            session_id=session_id,
-            session_state=session_state,
-        )
-        specialist_latency_ms = (time.perf_counter() - specialist_started) * 1000
+            specialist_started = time.perf_counter()
+            specialist_prompt = await self._ground_specialist_prompt(
+                route=route_decision.route,
+                message=message,
+            )
+            grounding_latency_ms = (time.perf_counter() - specialist_started) * 1000
+            (
+                specialist_response,
+                specialist_tools_called,
+                specialist_usage,
+            ) = await self._run_specialist(
+                route=route_decision.route,
+                message=specialist_prompt,
+                session_id=session_id,
+                session_state=session_state,
+            )
+            specialist_latency_ms = (time.perf_counter() - specialist_started) * 1000
 
-        return self._build_turn_result(
-            started=started,
-            route_decision=route_decision,
-            safety_data=safety_data,
-            safety_classification=safety_classification,
-            specialist_response=specialist_response,
-            route_tools_called=route_tools_called,
-            specialist_tools_called=specialist_tools_called,
-            safety_latency_ms=safety_latency_ms,
-            route_latency_ms=route_latency_ms,
-            specialist_latency_ms=specialist_latency_ms,
-        )
+            return self._build_turn_result(
+                turn=turn,
+                started=started,
+                route_decision=route_decision,
+                safety_data=safety_data,
+                safety_classification=safety_classification,
+                specialist_response=specialist_response,
+                route_tools_called=route_tools_called,
+                specialist_tools_called=specialist_tools_called,
+                safety_latency_ms=safety_latency_ms,
+                route_latency_ms=route_latency_ms,
+                safety_route_latency_ms=safety_route_latency_ms,
+                specialist_latency_ms=specialist_latency_ms,
+                grounding_latency_ms=grounding_latency_ms,
+                specialist_usage=specialist_usage,
+            )
+        finally:
+            self.tools.finish_rag_prefetch(turn)
 
     async def stream_turn(
         self,
@@ -440,65 +659,86 @@ class ADKNativeGraphOrchestrator:
         - final (includes NativeTurnResult as `turn_result`)
         - error
         """
+        turn: Optional[TurnState] = None
         try:
             started = time.perf_counter()
-            self.tools.set_turn_context(
+            turn = self.tools.set_turn_context(
                 session_id=session_id,
                 message=message,
                 history=conversation_history,
                 session_state=session_state,
                 diver_profile=diver_profile,
             )
+            if settings.adk_rag_prefetch_enabled:
+                self.tools.start_rag_prefetch(turn, message)
 
-            safety_started = time.perf_counter()
-            safety_data = await self.tools.safety_classification_tool(
-                message=message,
-                history=conversation_history,
-            )
-            safety_latency_ms = (time.perf_counter() - safety_started) * 1000
-            safety_classification = SafetyClassification(
-                classification=safety_data["classification"],
-                is_emergency=safety_data["is_emergency"],
-                is_medical=safety_data["is_medical"],
-            )
-            yield {
-                "type": "safety",
-                "content": safety_classification.to_dict(),
-            }
-
-            route_started = time.perf_counter()
-            route_decision, route_tools_called = await self._route_request(
+            phase_started = time.perf_counter()
+            route_task = self._start_route_task(
                 message=message,
                 history=conversation_history,
                 session_id=session_id,
                 session_state=session_state,
             )
-            route_latency_ms = (time.perf_counter() - route_started) * 1000
+            try:
+                (
+                    safety_data,
+                    safety_classification,
+                    safety_latency_ms,
+                ) = await self._classify_safety(
+                    message=message,
+                    history=conversation_history,
+                )
+                yield {
+                    "type": "safety",
+                    "content": safety_classification.to_dict(),
+                }
+
+                (
+                    route_decision,
+                    route_tools_called,
+                    route_latency_ms,
+                ) = await self._resolve_route(
+                    route_task,
+                    safety_classification=safety_classification,
+                    phase_started=phase_started,
+                )
+            finally:
+                if not route_task.done():
+                    route_task.cancel()
+            safety_route_latency_ms = (time.perf_counter() - phase_started) * 1000
             yield {"type": "route", "content": route_decision.to_dict()}
 
             specialist_started = time.perf_counter()
-            runner = self.specialist_runners[route_decision.route]
-            await self._ensure_session(
-                runner,
-                session_id=session_id,
-                state=session_state or {},
+            specialist_prompt = await self._ground_specialist_prompt(
+                route=route_decision.route,
+                message=message,
             )
+            grounding_latency_ms = (time.perf_counter() - specialist_started) * 1000
+            runner = self.specialist_runners[route_decision.route]
             await self._reserve_text_quota(
-                f"{route_decision.route}\n{message}",
+                f"{route_decision.route}\n{specialist_prompt}",
                 expected_output_tokens=max(256, settings.llm_max_tokens),
             )
 
-            user_message = types.Content(role="user", parts=[types.Part(text=message)])
+            user_message = types.Content(
+                role="user", parts=[types.Part(text=specialist_prompt)]
+            )
             specialist_response = ""
             emitted_text = ""
             specialist_tools_called: List[str] = []
+            specialist_usage: Dict[str, int] = {}
 
-            async with asyncio.timeout(max(0.1, settings.adk_specialist_timeout_ms / 1000)):
+            async with self._turn_session(
+                runner, session_id=session_id, state=session_state
+            ) as turn_session_id, asyncio.timeout(
+                max(0.1, settings.adk_specialist_timeout_ms / 1000)
+            ):
                 async for event in runner.run_async(
                     user_id=self.user_id,
-                    session_id=session_id,
+                    session_id=turn_session_id,
                     new_message=user_message,
                 ):
+                    self._accumulate_usage(specialist_usage, event)
                     function_calls = event.get_function_calls()
                     for call in function_calls:
                         specialist_tools_called.append(call.name)
@@ -517,6 +757,7 @@ class ADKNativeGraphOrchestrator:
             specialist_latency_ms = (time.perf_counter() - specialist_started) * 1000
 
             turn_result = self._build_turn_result(
+                turn=turn,
                 started=started,
                 route_decision=route_decision,
                 safety_data=safety_data,
@@ -526,7 +767,10 @@ class ADKNativeGraphOrchestrator:
                 specialist_tools_called=specialist_tools_called,
                 safety_latency_ms=safety_latency_ms,
                 route_latency_ms=route_latency_ms,
+                safety_route_latency_ms=safety_route_latency_ms,
                 specialist_latency_ms=specialist_latency_ms,
+                grounding_latency_ms=grounding_latency_ms,
+                specialist_usage=specialist_usage,
             )
 
             if (
@@ -559,6 +803,9 @@ class ADKNativeGraphOrchestrator:
                 "content": "adk_stream_failed",
                 "metadata": {"detail": str(exc)},
             }
+        finally:
+            if turn is not None:
+                self.tools.finish_rag_prefetch(turn)
 
     def route_trip_specialist(
         self,
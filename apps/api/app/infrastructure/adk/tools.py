@@ -2,15 +2,18 @@
 
 import asyncio
 import logging
+import math
 import re
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Literal, Optional, Sequence
 
 from app.core.config import settings
 from app.core.quota_manager import get_quota_manager
 from app.domain.orchestration.emergency_detector_hybrid import EmergencyDetector
 from app.domain.orchestration.medical_detector import MedicalQueryDetector
 from app.infrastructure.services.rag.pipeline import RAGPipeline
+from app.infrastructure.services.rag.types import RAGContext
 
 from .types import PolicyValidationResult, RagSearchResult, SafetyClassification
 
@@ -36,6 +39,51 @@ class _TurnContext:
             self.diver_profile = {}
 
 
+PrefetchStatus = Literal["pending", "hit", "miss"]
+
+
+@dataclass
+class RagPrefetch:
+    """Speculative retrieval for the raw user message, started at turn begin."""
+
+    query: str
+    task: "asyncio.Task[RAGContext]"
+    status: PrefetchStatus = "pending"
+    distance: Optional[float] = None
+    finalized: bool = False
+
+
+@dataclass
+class TurnState:
+    """Request-scoped tool state for one graph turn.
+
+    Tools mutate this object in place, so ADK tool tasks spawned from the turn
+    (which inherit a copy of the caller's context) write back to the same turn.
+    """
+
+    context: _TurnContext = field(default_factory=_TurnContext)
+    rag_result: RagSearchResult = field(default_factory=RagSearchResult)
+    safety_classification: SafetyClassification = field(
+        default_factory=SafetyClassification
+    )
+    policy_validation: PolicyValidationResult = field(
+        default_factory=PolicyValidationResult
+    )
+    rag_prefetch: Optional[RagPrefetch] = None
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def _cosine_distance(a: Sequence[float], b: Sequence[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b, strict=False))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    if norm == 0:
+        return 1.0
+    return 1.0 - dot / norm
+
+
 class ADKToolbox:
     """Single source of truth for ADK tool behaviors and contracts."""
 
@@ -50,10 +98,36 @@ class ADKToolbox:
         self.medical_detector = medical_detector or MedicalQueryDetector()
         self.quota_manager = get_quota_manager()
 
-        self.turn_context = _TurnContext()
-        self.last_rag_result = RagSearchResult()
-        self.last_safety_classification = SafetyClassification()
-        self.last_policy_validation = PolicyValidationResult()
+        # One toolbox serves many concurrent turns; per-turn state lives in the
+        # current asyncio context rather than on the instance.
+        self._turn_state: ContextVar[Optional[TurnState]] = ContextVar(
+            f"adk_turn_state_{id(self)}", default=None
+        )
+        self._prefetch_counts = {"started": 0, "hits": 0, "misses": 0, "wasted": 0}
+
+    def current_turn(self) -> TurnState:
+        """Return the turn state bound to the current context, creating one if needed."""
+        state = self._turn_state.get()
+        if state is None:
+            state = TurnState()
+            self._turn_state.set(state)
+        return state
+
+    @property
+    def turn_context(self) -> _TurnContext:
+        return self.current_turn().context
+
+    @property
+    def last_rag_result(self) -> RagSearchResult:
+        return self.current_turn().rag_result
+
+    @property
+    def last_safety_classification(self) -> SafetyClassification:
+        return self.current_turn().safety_classification
+
+    @property
+    def last_policy_validation(self) -> PolicyValidationResult:
+        return self.current_turn().policy_validation
 
     def _adaptive_rag_top_k(self) -> int:
         top_k = max(1, settings.rag_top_k)
@@ -76,9 +150,10 @@ class ADKToolbox:
 
     def reset_turn_state(self) -> None:
         """Reset mutable per-turn snapshots."""
-        self.last_rag_result = RagSearchResult()
-        self.last_safety_classification = SafetyClassification()
-        self.last_policy_validation = PolicyValidationResult()
+        turn = self.current_turn()
+        turn.rag_result = RagSearchResult()
+        turn.safety_classification = SafetyClassification()
+        turn.policy_validation = PolicyValidationResult()
 
     def set_turn_context(
         self,
@@ -88,51 +163,157 @@ class ADKToolbox:
         history: Optional[List[Dict[str, str]]] = None,
         session_state: Optional[Dict[str, Any]] = None,
         diver_profile: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Set current turn context consumed by tools."""
-        self.turn_context = _TurnContext(
-            session_id=session_id,
-            message=message,
-            history=history or [],
-            session_state=session_state or {},
-            diver_profile=diver_profile or {},
+    ) -> TurnState:
+        """Bind a fresh turn to the current context and return it."""
+        turn = TurnState(
+            context=_TurnContext(
+                session_id=session_id,
+                message=message,
+                history=history or [],
+                session_state=session_state or {},
+                diver_profile=diver_profile or {},
+            )
         )
-        self.reset_turn_state()
+        self._turn_state.set(turn)
+        return turn
+
+    def start_rag_prefetch(self, turn: TurnState, message: str) -> None:
+        """Speculatively retrieve for the raw message so it overlaps routing."""
+        if not getattr(self.rag_pipeline, "enabled", True) or not message.strip():
+            return
+        task = asyncio.create_task(
+            self.rag_pipeline.retrieve_context(
+                query=message,
+                top_k=self._adaptive_rag_top_k(),
+                filters={},
+            )
+        )
+        turn.rag_prefetch = RagPrefetch(query=message, task=task)
+        self._prefetch_counts["started"] += 1
+
+    async def _take_rag_prefetch(
+        self,
+        turn: TurnState,
+        query: str,
+        filters: Optional[Dict[str, Any]],
+    ) -> Optional[RAGContext]:
+        """Serve the prefetched context when the specialist query is close enough."""
+        prefetch = turn.rag_prefetch
+        if prefetch is None:
+            return None
+
+        def _miss() -> None:
+            if prefetch.status == "pending":
+                prefetch.status = "miss"
+            return None
+
+        # Prefetch ran unfiltered; filtered queries need their own retrieval.
+        # That is not a miss: a later unfiltered lookup this turn (the
+        # pre-grounded widen-once fallback) can still be served from it.
+        if filters:
+            return None
+
+        try:
+            if _normalize_query(query) == _normalize_query(prefetch.query):
+                distance = 0.0
+            else:
+                query_embedding, prefetch_embedding = await asyncio.gather(
+                    self.rag_pipeline.embed_query(query),
+                    self.rag_pipeline.embed_query(prefetch.query),
+                )
+                distance = _cosine_distance(query_embedding, prefetch_embedding)
+            if distance > settings.adk_rag_prefetch_max_distance:
+                prefetch.distance = distance
+                return _miss()
+            context = await prefetch.task
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.debug("RAG prefetch unusable; running fresh retrieval", exc_info=True)
+            return _miss()
+
+        prefetch.status = "hit"
+        prefetch.distance = distance
+        return context
+
+    def finish_rag_prefetch(self, turn: TurnState) -> Optional[Dict[str, Any]]:
+        """Account for the turn's prefetch and cancel it if still in flight."""
+        prefetch = turn.rag_prefetch
+        if prefetch is None:
+            return None
+
+        if not prefetch.finalized:
+            prefetch.finalized = True
+            if prefetch.status == "hit":
+                self._prefetch_counts["hits"] += 1
+            else:
+                self._prefetch_counts["wasted"] += 1
+                if prefetch.status == "miss":
+                    self._prefetch_counts["misses"] += 1
+            if not prefetch.task.done():
+                prefetch.task.cancel()
+            elif not prefetch.task.cancelled():
+                prefetch.task.exception()  # Mark retrieved; failures were already handled.
+
+        return {
+            "status": "unused" if prefetch.status == "pending" else prefetch.status,
+            "distance": prefetch.distance,
+            "stats": self.get_prefetch_stats(),
+        }
+
+    def get_prefetch_stats(self) -> Dict[str, float | int]:
+        """
+        Get speculative prefetch statistics.
+
+        Returns:
+            Dictionary with started/hits/misses/wasted counts and hit/waste rates
+        """
+        started = self._prefetch_counts["started"]
+        return {
+            **self._prefetch_counts,
+            "hit_rate": self._prefetch_counts["hits"] / started if started else 0.0,
+            "waste_rate": self._prefetch_counts["wasted"] / started if started else 0.0,
+        }
 
     async def rag_search_tool(
         self, query: str, filters: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Retrieve grounded context from the RAG pipeline."""
+        turn = self.current_turn()
         try:
             adaptive_top_k = self._adaptive_rag_top_k()
             async with asyncio.timeout(max(0.1, settings.rag_timeout_ms / 1000)):
-                context = await self.rag_pipeline.retrieve_context(
-                    query=query,
-                    top_k=adaptive_top_k,
-                    filters=filters or {},
-                )
+                context = await self._take_rag_prefetch(turn, query, filters)
+                if context is None:
+                    context = await self.rag_pipeline.retrieve_context(
+                        query=query,
+                        top_k=adaptive_top_k,
+                        filters=filters or {},
+                    )
             chunks = [result.text for result in context.results]
             citations = context.citations
 
-            self.last_rag_result = RagSearchResult(
+            turn.rag_result = RagSearchResult(
                 chunks=chunks,
                 citations=citations,
                 has_data=context.has_data,
+                packing=context.packing,
             )
-            return self.last_rag_result.to_dict()
+            return turn.rag_result.to_dict()
         except Exception as exc:
             logger.error("rag_search_tool failed: %s", exc, exc_info=True)
-            self.last_rag_result = RagSearchResult(chunks=[], citations=[], has_data=False)
-            return self.last_rag_result.to_dict()
+            turn.rag_result = RagSearchResult(chunks=[], citations=[], has_data=False)
+            return turn.rag_result.to_dict()
 
     def session_context_tool(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         """Return normalized turn/session context for specialists."""
-        requested_session = session_id or self.turn_context.session_id
+        turn_context = self.current_turn().context
+        requested_session = session_id or turn_context.session_id
         return {
             "session_id": requested_session,
-            "history": self.turn_context.history[-10:],
-            "session_state": self.turn_context.session_state,
-            "diver_profile": self.turn_context.diver_profile,
+            "history": turn_context.history[-10:],
+            "session_state": turn_context.session_state,
+            "diver_profile": turn_context.diver_profile,
         }
 
     async def safety_classification_tool(
@@ -141,35 +322,36 @@ class ADKToolbox:
         history: Optional[List[Dict[str, str]]] = None,
     ) -> Dict[str, Any]:
         """Classify a turn as emergency, medical, or non-medical."""
-        conversation_history = history if history is not None else self.turn_context.history
+        turn = self.current_turn()
+        conversation_history = history if history is not None else turn.context.history
 
         try:
             is_emergency, _ = await self.emergency_detector.detect_emergency(
                 message, conversation_history=conversation_history
             )
             if is_emergency:
-                self.last_safety_classification = SafetyClassification(
+                turn.safety_classification = SafetyClassification(
                     classification="emergency",
                     is_emergency=True,
                     is_medical=True,
                 )
-                return self.last_safety_classification.to_dict()
+                return turn.safety_classification.to_dict()
 
             is_medical = await self.medical_detector.is_medical_query(message)
-            self.last_safety_classification = SafetyClassification(
+            turn.safety_classification = SafetyClassification(
                 classification="medical" if is_medical else "non_medical",
                 is_emergency=False,
                 is_medical=is_medical,
             )
-            return self.last_safety_classification.to_dict()
+            return turn.safety_classification.to_dict()
         except Exception as exc:
             logger.error("safety_classification_tool failed: %s", exc, exc_info=True)
-            self.last_safety_classification = SafetyClassification(
+            turn.safety_classification = SafetyClassification(
                 classification="medical",
                 is_emergency=False,
                 is_medical=True,
             )
-            return self.last_safety_classification.to_dict()
+            return turn.safety_classification.to_dict()
 
     def response_policy_tool(
         self,
@@ -184,8 +366,9 @@ class ADKToolbox:
         - Factual-looking statements should include citations.
         - Medical/emergency statements are allowed but should be concise and cautious.
         """
+        turn = self.current_turn()
         citations = citations or []
-        safety_flags = safety_flags or self.last_safety_classification.to_dict()
+        safety_flags = safety_flags or turn.safety_classification.to_dict()
 
         answer_text = (answer or "").strip()
         appears_factual = self._appears_factual_claim(answer_text)
@@ -211,7 +394,7 @@ class ADKToolbox:
             result.reason = "emergency_path"
             result.should_append_uncertainty = False
 
-        self.last_policy_validation = result
+        turn.policy_validation = result
         return result.to_dict()
 
     @staticmethod
@@ -12,6 +12,8 @@ RouteName = Literal[
 
 SafetyLabel = Literal["emergency", "medical", "non_medical"]
 
+GroundingMode = Literal["tool", "pregrounded"]
+
 
 @dataclass
 class RouteDecision:
@@ -38,6 +40,7 @@ class RagSearchResult:
     chunks: List[str] = field(default_factory=list)
     citations: List[str] = field(default_factory=list)
     has_data: bool = False
+    packing: Optional[Dict[str, int]] = None  # Trace only; not sent to the model
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -90,15 +93,26 @@ class AgentTurnTrace:
     safety_label: SafetyLabel = "non_medical"
     route: Optional[RouteName] = None
     latency_ms: Dict[str, float] = field(default_factory=dict)
+    grounding_mode: GroundingMode = "tool"
+    token_usage: Dict[str, int] = field(default_factory=dict)
+    rag_prefetch: Optional[Dict[str, Any]] = None
+    rag_packing: Optional[Dict[str, int]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        payload = {
             "tools_called": self.tools_called,
             "citations_count": self.citations_count,
             "safety_label": self.safety_label,
             "route": self.route,
             "latency_ms": self.latency_ms,
+            "grounding_mode": self.grounding_mode,
+            "token_usage": self.token_usage,
         }
+        if self.rag_prefetch is not None:
+            payload["rag_prefetch"] = self.rag_prefetch
+        if self.rag_packing is not None:
+            payload["rag_packing"] = self.rag_packing
+        return payload
 
 
 @dataclass
@@ -1,7 +1,15 @@
 from .content_embedding import ContentEmbedding
+from .content_generation import ContentGeneration
 from .destination import Destination
 from .dive_site import DiveSite
 from .lead import Lead
 from .session import Session as SessionModel
 
-__all__ = ["SessionModel", "ContentEmbedding", "Lead", "Destination", "DiveSite"]
+__all__ = [
+    "SessionModel",
+    "ContentEmbedding",
+    "ContentGeneration",
+    "Lead",
+    "Destination",
+    "DiveSite",
+]
@@ -1,8 +1,8 @@
 import uuid
 
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import BIT, HALFVEC, Vector
 from sqlalchemy import Column, Computed, DateTime, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
 
 from app.infrastructure.db.base import Base
 
@@ -16,7 +16,16 @@ class ContentEmbedding(Base):
     chunk_text_tsv = Column(TSVECTOR, Computed("to_tsvector('english', chunk_text)", persisted=True))  # Full-text search column (database-generated)
     # Using pgvector Vector type for text-embedding-004 (768 dimensions)
     embedding = Column(Vector(768), nullable=True)
+    # Compact copies for shortlist search, re-ranked on `embedding` (migration 007)
+    embedding_half = Column(HALFVEC(768), nullable=True)
+    embedding_bit = Column(BIT(768), nullable=True)
+    # Normalized 256-d Matryoshka prefix of `embedding` (migration 008)
+    embedding_256 = Column(Vector(256), nullable=True)
     metadata_ = Column(
         "metadata", JSONB, nullable=True
     )  # Use metadata_ to avoid SQLAlchemy conflict
+    # Filter columns generated from metadata (btree/GIN indexed, migration 006)
+    doc_type = Column(Text, Computed("metadata ->> 'doc_type'", persisted=True))
+    destination = Column(Text, Computed("metadata ->> 'destination'", persisted=True))
+    tags = Column(ARRAY(Text), Computed("content_metadata_tags(metadata)", persisted=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
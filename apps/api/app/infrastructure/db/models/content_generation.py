@@ -0,0 +1,15 @@
+from sqlalchemy import BigInteger, Column, DateTime, SmallInteger, func
+
+from app.infrastructure.db.base import Base
+
+
+class ContentGeneration(Base):
+    """Single-row counter bumped whenever content chunks are written or deleted."""
+
+    __tablename__ = "content_generation"
+
+    id = Column(SmallInteger, primary_key=True, default=1)
+    generation = Column(BigInteger, nullable=False, default=0, server_default="0")
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -2,16 +2,32 @@
 In-memory LRU cache for embeddings.
 
 Provides TTL-based caching to reduce API calls for frequently embedded texts.
+With a persistent store attached, the LRU is the L1 tier in front of it.
+Async callers use ``aget_many``/``aset_many``, which run the SQLite calls in
+a worker thread so a locked database never stalls the event loop.
+
+Vectors live in one preallocated float32 slab (``max_size`` slots of
+``dimension`` floats) rather than as Python lists: a 768-d list costs ~25 KB
+in float objects and pointers, a slab slot 3 KB. Reads copy the slot into a
+new list: callers (pgvector binds, JSON, the provider API) need lists, and a
+zero-copy view would alias a slot that is reused after eviction. The copy is
+about 15 µs per 768-d hit (``scripts/benchmark_cache_memory.py``), small next to the
+API round trip it saves.
 """
 
+import asyncio
 import hashlib
 import logging
+import sqlite3
 import time
+from array import array
 from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Union
 
 from app.core.config import settings
 
+from .persistent_cache import SqliteEmbeddingStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,11 +35,20 @@ class EmbeddingCache:
     """
     Simple in-memory LRU cache with TTL for embeddings.
 
-    Uses OrderedDict for LRU behavior and stores (embedding, timestamp) tuples.
+    Uses OrderedDict for LRU behavior and stores (slab slot, timestamp) tuples;
+    evicted and expired slots go back on a free list.
+    Entries are keyed by (model, dimension, sha256(text)); L1 misses fall
+    through to the optional persistent store and are promoted on a hit.
     """
 
     def __init__(
-            self, max_size: Optional[int] = None, ttl_seconds: Optional[int] = None
+            self,
+            max_size: Optional[int] = None,
+            ttl_seconds: Optional[int] = None,
+            *,
+            model: str = "",
+            dimension: int = 0,
+            store: Optional[SqliteEmbeddingStore] = None,
     ):
         """
         Initialize embedding cache.
@@ -31,12 +56,22 @@ class EmbeddingCache:
         Args:
             max_size: Maximum number of entries (default: from settings)
             ttl_seconds: Time-to-live in seconds (default: from settings)
+            model: Embedding model the vectors belong to (part of the key)
+            dimension: Vector dimension (part of the key; default: length of the first vector)
+            store: Persistent L2 store shared across processes (optional)
         """
         self.max_size = max_size or settings.embedding_cache_size
         self.ttl_seconds = ttl_seconds or settings.embedding_cache_ttl
-        self.cache: OrderedDict[str, Tuple[List[float], float]] = OrderedDict()
+        self.model = model
+        self.dimension = dimension
+        self.store = store
+        self.cache: OrderedDict[str, Tuple[int, float]] = OrderedDict()
+        self._slab: Optional[array] = None  # allocated on first set
+        self._width = dimension
+        self._free_slots: List[int] = []
         self.hits = 0
         self.misses = 0
+        self.store_hits = 0
 
         logger.info(
             f"Initialized EmbeddingCache with max_size={self.max_size}, ttl={self.ttl_seconds}s"
@@ -54,6 +89,9 @@ class EmbeddingCache:
         """
         return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
+    def _key(self, text_hash: str) -> str:
+        return f"{self.model}:{self.dimension}:{text_hash}"
+
     def get(self, text: str) -> Optional[List[float]]:
         """
         Get embedding from cache.
@@ -64,27 +102,90 @@ class EmbeddingCache:
         Returns:
             Embedding vector if found and not expired, None otherwise
         """
-        key = self._hash_text(text)
+        return self.get_many([text])[0]
+
+    def get_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Get embeddings for several texts (one persistent-store lookup for L1 misses).
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Embedding or None per text
+        """
+        text_hashes, embeddings, missing = self._lookup_local(texts)
+        if missing and self.store is not None:
+            self._promote(text_hashes, embeddings, self._read_store(missing))
+        return self._count(embeddings)
+
+    async def aget_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Like ``get_many``, with the persistent-store lookup off the event loop."""
+        text_hashes, embeddings, missing = self._lookup_local(texts)
+        if missing and self.store is not None:
+            stored = await asyncio.to_thread(self._read_store, missing)
+            self._promote(text_hashes, embeddings, stored)
+        return self._count(embeddings)
+
+    def _lookup_local(
+        self, texts: List[str]
+    ) -> Tuple[List[str], List[Optional[List[float]]], List[str]]:
+        text_hashes = [self._hash_text(text) for text in texts]
+        embeddings = [self._get_local(text_hash) for text_hash in text_hashes]
+        missing = [
+            text_hash
+            for text_hash, embedding in zip(text_hashes, embeddings, strict=True)
+            if embedding is None
+        ]
+        return text_hashes, embeddings, missing
+
+    def _read_store(self, text_hashes: List[str]) -> Dict[str, List[float]]:
+        try:
+            return self.store.get_many(self.model, self.dimension, text_hashes)
+        except sqlite3.Error as exc:
+            logger.warning(f"Persistent embedding cache read failed: {exc}")
+            return {}
+
+    def _promote(
+        self,
+        text_hashes: List[str],
+        embeddings: List[Optional[List[float]]],
+        stored: Dict[str, List[float]],
+    ) -> None:
+        for index, text_hash in enumerate(text_hashes):
+            if embeddings[index] is None and text_hash in stored:
+                embeddings[index] = stored[text_hash]
+                self._set_local(text_hash, stored[text_hash])
+                self.store_hits += 1
 
+    def _count(self, embeddings: List[Optional[List[float]]]) -> List[Optional[List[float]]]:
+        for embedding in embeddings:
+            if embedding is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return embeddings
+
+    def _get_local(self, text_hash: str) -> Optional[List[float]]:
+        key = self._key(text_hash)
         if key not in self.cache:
-            self.misses += 1
             return None
 
-        embedding, timestamp = self.cache[key]
+        slot, timestamp = self.cache[key]
         current_time = time.time()
 
         # Check if expired
         if current_time - timestamp > self.ttl_seconds:
             logger.debug("Cache entry expired")
             del self.cache[key]
-            self.misses += 1
+            self._free_slots.append(slot)
             return None
 
         # Move to end (most recently used)
         self.cache.move_to_end(key)
-        self.hits += 1
-
-        return embedding
+        # Copy out: the slot is recycled on eviction, so a view could change under the caller
+        start = slot * self._width
+        return self._slab[start : start + self._width].tolist()
 
     def set(self, text: str, embedding: List[float]) -> None:
         """
@@ -94,26 +195,82 @@ class EmbeddingCache:
             text: Text key
             embedding: Embedding vector to store
         """
-        key = self._hash_text(text)
+        self.set_many([(text, embedding)])
+
+    def set_many(self, items: List[Tuple[str, List[float]]]) -> None:
+        """
+        Store several embeddings (one persistent-store transaction).
+
+        Args:
+            items: (text, embedding) pairs
+        """
+        hashed = self._set_local_many(items)
+        if hashed and self.store is not None:
+            self._write_store(hashed)
+
+    async def aset_many(self, items: List[Tuple[str, List[float]]]) -> None:
+        """Like ``set_many``, with the persistent-store write off the event loop."""
+        hashed = self._set_local_many(items)
+        if hashed and self.store is not None:
+            await asyncio.to_thread(self._write_store, hashed)
+
+    def _set_local_many(
+        self, items: List[Tuple[str, List[float]]]
+    ) -> List[Tuple[str, List[float]]]:
+        hashed = [(self._hash_text(text), embedding) for text, embedding in items]
+        for text_hash, embedding in hashed:
+            self._set_local(text_hash, embedding)
+        return hashed
+
+    def _write_store(self, hashed: List[Tuple[str, List[float]]]) -> None:
+        # Best effort: a locked or failing store only costs a future API call
+        try:
+            self.store.set_many(self.model, self.dimension, hashed)
+        except sqlite3.Error as exc:
+            logger.warning(f"Persistent embedding cache write failed: {exc}")
+
+    def _set_local(self, text_hash: str, embedding: List[float]) -> None:
+        if self._slab is None:
+            self._allocate(self._width or len(embedding))
+        if len(embedding) != self._width:
+            raise ValueError(
+                f"Expected embedding dimension {self._width}, got {len(embedding)}"
+            )
+
+        key = self._key(text_hash)
         current_time = time.time()
 
-        # Remove oldest entry if at capacity
-        if key not in self.cache and len(self.cache) >= self.max_size:
-            oldest_key = next(iter(self.cache))
-            del self.cache[oldest_key]
-            logger.debug(f"Evicted oldest cache entry, size={len(self.cache)}")
+        if key in self.cache:
+            slot = self.cache[key][0]
+        else:
+            # Remove oldest entry if at capacity
+            if len(self.cache) >= self.max_size:
+                _, (oldest_slot, _) = self.cache.popitem(last=False)
+                self._free_slots.append(oldest_slot)
+                logger.debug(f"Evicted oldest cache entry, size={len(self.cache)}")
+            slot = self._free_slots.pop()
 
         # Store embedding with timestamp
-        self.cache[key] = (embedding, current_time)
+        start = slot * self._width
+        self._slab[start : start + self._width] = array("f", embedding)
+        self.cache[key] = (slot, current_time)
 
         # Move to end (most recently used)
         self.cache.move_to_end(key)
 
+    def _allocate(self, width: int) -> None:
+        self._width = width
+        self._slab = array("f", bytes(4 * width * self.max_size))
+        self._free_slots = list(range(self.max_size - 1, -1, -1))
+
     def clear(self) -> None:
-        """Clear all cache entries."""
+        """Clear all in-memory entries (the persistent store is left intact)."""
         self.cache.clear()
+        if self._slab is not None:
+            self._free_slots = list(range(self.max_size - 1, -1, -1))
         self.hits = 0
         self.misses = 0
+        self.store_hits = 0
         logger.info("Cache cleared")
 
     def get_stats(self) -> Dict[str, Union[int, float]]:
@@ -126,10 +283,14 @@ class EmbeddingCache:
         total_requests = self.hits + self.misses
         hit_rate = self.hits / total_requests if total_requests > 0 else 0.0
 
-        return {
+        stats: Dict[str, Union[int, float]] = {
             "size": len(self.cache),
             "max_size": self.max_size,
             "hits": self.hits,
             "misses": self.misses,
             "hit_rate": hit_rate,
+            "slab_bytes": self._slab.itemsize * len(self._slab) if self._slab is not None else 0,
         }
+        if self.store is not None:
+            stats["store_hits"] = self.store_hits
+        return stats
@@ -6,10 +6,11 @@ Supports Matryoshka-style dimension truncation for flexible embedding sizes.
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-import google.genai as genai
+from google.genai import errors as genai_errors
 from google.genai import types
 from tenacity import (
     retry,
@@ -20,10 +21,13 @@ from tenacity import (
 
 from app.core.config import settings
 from app.core.quota_manager import QuotaExceededError, get_quota_manager
+from app.core.single_flight import get_single_flight
 from app.infrastructure.services.cost.token_cost import estimate_tokens_from_text
+from app.infrastructure.services.genai_clients import get_genai_client, get_request_pool
 
 from .base import EmbeddingProvider
 from .cache import EmbeddingCache
+from .persistent_cache import get_embedding_store
 
 logger = logging.getLogger(__name__)
 
@@ -36,12 +40,25 @@ EMBEDDING_DIMENSIONS = {
     "models/text-embedding-004": 768,
 }
 MAX_BATCH_SIZE = 100
+# Estimated-token cap per batch request (further capped by embedding_tpm_limit)
+MAX_BATCH_TOKENS = 20_000
+
+# Derived concurrency: one in-flight request per this many RPM, within [1, MAX_CONCURRENCY]
+RPM_PER_CONCURRENT_REQUEST = 10
+MAX_CONCURRENCY = 16
 
 # Matryoshka dimension support for text-embedding-004
 # This model supports flexible output dimensions via truncation
 SUPPORTED_TRUNCATION_DIMENSIONS = [256, 512, 768]
 
 
+def resolve_embedding_concurrency() -> int:
+    """Max in-flight embedding requests from settings or the quota profile's RPM limit."""
+    if settings.embedding_max_concurrency:
+        return max(1, settings.embedding_max_concurrency)
+    return max(1, min(MAX_CONCURRENCY, settings.embedding_rpm_limit // RPM_PER_CONCURRENT_REQUEST))
+
+
 class RateLimitError(Exception):
     """Raised when API rate limit is exceeded."""
 
@@ -57,6 +74,7 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
         model: str = GEMINI_EMBEDDING_MODEL,
         use_cache: bool = True,
         dimension: int | None = None,
+        max_concurrency: int | None = None,
     ):
         """
         Initialize Gemini embedding provider with optional Matryoshka dimension truncation.
@@ -67,6 +85,8 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
             use_cache: Whether to use in-memory cache (default: True)
             dimension: Target output dimension for Matryoshka truncation (default: model's native dimension)
                       For text-embedding-004: supports 256, 512, or 768 dimensions
+            max_concurrency: Max in-flight API requests (default: settings.embedding_max_concurrency,
+                      else derived from the quota profile's embedding_rpm_limit); 1 is sequential
         """
         if not api_key:
             raise ValueError("Gemini API key is required")
@@ -89,12 +109,23 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
         else:
             self.dimension = native_dimension
 
-        # Configure Gemini API (New SDK pattern)
-        self.client = genai.Client(api_key=api_key)
+        # Configure Gemini API (New SDK pattern); shared client, shared HTTP pool
+        self.client = get_genai_client(api_key)
         self.quota_manager = get_quota_manager()
 
+        # Bounds in-flight requests; QuotaManager.reserve still decides admission
+        self.max_concurrency = max_concurrency or resolve_embedding_concurrency()
+        self._request_slots = get_request_pool("gemini_embedding", self.max_concurrency)
+
+        # Identical concurrent embed_text calls share one API request
+        self._in_flight = get_single_flight("embedding")
+
         # Initialize cache
-        self.cache = EmbeddingCache() if use_cache else None
+        self.cache = (
+            EmbeddingCache(model=model, dimension=self.dimension, store=get_embedding_store())
+            if use_cache
+            else None
+        )
 
         logger.info(f"Initialized GeminiEmbeddingProvider with model={model}, dimension={self.dimension} (New SDK)")
 
@@ -108,22 +139,25 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
         retry=retry_if_exception_type(RateLimitError),
         reraise=True,
     )
-    async def _embed_with_retry(self, text: str) -> List[float]:
+    async def _embed_request(self, texts: List[str]) -> List[Optional[List[float]]]:
         """
-        Generate embedding with retry logic.
+        Embed several texts in one ``embed_content`` request with retry logic.
+
+        Makes one quota reservation for the summed token estimate of the request.
 
         Args:
-            text: Text to embed
+            texts: Texts to embed in a single API call
 
         Returns:
-            Embedding vector
+            One vector per text, or None where the response has no valid vector
+            (missing item or wrong dimension)
 
         Raises:
             RateLimitError: If rate limit is hit (will trigger retry)
             Exception: If other error occurs
         """
         try:
-            estimated_tokens = estimate_tokens_from_text(text)
+            estimated_tokens = sum(estimate_tokens_from_text(text) for text in texts)
             quota_decision = await self.quota_manager.reserve(
                 "embedding",
                 estimated_tokens,
@@ -135,41 +169,40 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
                     quota_decision.wait_seconds,
                 )
 
-            # Run synchronous Gemini API call in thread pool with timeout.
-            loop = asyncio.get_running_loop()
-            result = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: self.client.models.embed_content(
+            # Native async call; a timeout cancels the HTTP request and frees the slot
+            async with self._request_slots.slot():
+                result = await asyncio.wait_for(
+                    self.client.aio.models.embed_content(
                         model=self.model,
-                        contents=text,
-                        config=types.EmbedContentConfig(
-                            output_dimensionality=self.dimension
-                        ),
+                        contents=texts[0] if len(texts) == 1 else texts,
+                        config=types.EmbedContentConfig(output_dimensionality=self.dimension),
                     ),
-                ),
-                timeout=max(0.1, settings.embedding_timeout_ms / 1000),
-            )
+                    timeout=max(0.1, settings.embedding_timeout_ms / 1000),
+                )
 
-            # Extract embedding from response
+            # Extract embeddings from response
             if hasattr(result, "embeddings") and result.embeddings:
-                embedding = result.embeddings[0].values
+                vectors = [embedding.values for embedding in result.embeddings]
             elif hasattr(result, "embedding") and result.embedding:
-                embedding = result.embedding.values
+                vectors = [result.embedding.values]
             else:
                 logger.debug(f"Unexpected result structure: {result}")
                 if hasattr(result, "values"):
-                    embedding = result.values
+                    vectors = [result.values]
                 else:
                     raise ValueError("Invalid embedding response from Gemini API")
 
-            # Validate dimension
-            if len(embedding) != self.dimension:
-                raise ValueError(
-                    f"Expected embedding dimension {self.dimension}, got {len(embedding)}"
+            embeddings: List[Optional[List[float]]] = []
+            for index in range(len(texts)):
+                vector = vectors[index] if index < len(vectors) else None
+                embeddings.append(
+                    list(vector) if vector is not None and len(vector) == self.dimension else None
                 )
-
-            return embedding
+            if len(vectors) != len(texts):
+                logger.warning(
+                    "Embedding response had %d vectors for %d texts", len(vectors), len(texts)
+                )
+            return embeddings
 
         except QuotaExceededError:
             raise
@@ -194,6 +227,92 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
             logger.error(f"Error generating embedding: {e}")
             raise
 
+    async def _embed_with_retry(self, text: str) -> List[float]:
+        """
+        Generate embedding for one text with retry logic.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            ValueError: If the response has no vector of the expected dimension
+            Exception: If API call fails after retries
+        """
+        embedding = (await self._embed_request([text]))[0]
+        if embedding is None:
+            raise ValueError(
+                f"Expected embedding dimension {self.dimension}, got an invalid vector"
+            )
+        return embedding
+
+    def _plan_requests(self, texts: List[str]) -> List[List[int]]:
+        """
+        Group text positions into requests bounded by count and estimated tokens.
+
+        A request holds at most ``embedding_batch_size`` (<= MAX_BATCH_SIZE) texts
+        and at most MAX_BATCH_TOKENS estimated tokens, capped by
+        ``embedding_tpm_limit`` so one reservation always fits the quota window.
+        A single text over the token cap is sent on its own.
+        """
+        max_items = max(1, min(settings.embedding_batch_size, MAX_BATCH_SIZE))
+        max_tokens = max(1, min(MAX_BATCH_TOKENS, settings.embedding_tpm_limit))
+
+        requests: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for index, text in enumerate(texts):
+            tokens = estimate_tokens_from_text(text)
+            if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+                requests.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            requests.append(current)
+        return requests
+
+    async def _embed_group(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed one planned request, re-sending only the items that failed.
+
+        Items missing from (or invalid in) a response are retried together, up to
+        ``embedding_max_retries`` rounds. A request rejected as invalid (HTTP 400,
+        e.g. one malformed item) is split in half so the failure is isolated to
+        its item. Any other error (5xx, connection, quota, timeout) is re-raised,
+        so an outage never fans out into more requests.
+        """
+        try:
+            embeddings = await self._embed_request(texts)
+        except genai_errors.ClientError as exc:
+            if exc.code != 400 or len(texts) == 1:
+                raise
+            middle = len(texts) // 2
+            logger.warning(
+                "Embedding request for %d texts was rejected; splitting to isolate the item",
+                len(texts),
+            )
+            return await self._embed_group(texts[:middle]) + await self._embed_group(
+                texts[middle:]
+            )
+
+        for _ in range(settings.embedding_max_retries):
+            failed = [index for index, embedding in enumerate(embeddings) if embedding is None]
+            if not failed:
+                break
+            logger.warning(f"Retrying {len(failed)} of {len(texts)} embeddings from a partial batch")
+            retried = await self._embed_request([texts[index] for index in failed])
+            for index, embedding in zip(failed, retried, strict=True):
+                embeddings[index] = embedding
+
+        if any(embedding is None for embedding in embeddings):
+            raise ValueError(
+                f"Expected embedding dimension {self.dimension} for every text in the batch"
+            )
+        return embeddings
+
     async def embed_text(self, text: str) -> List[float]:
         """
         Generate an embedding vector for a single text.
@@ -213,17 +332,23 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
 
         # Check cache
         if self.cache:
-            cached = self.cache.get(text)
+            cached = (await self.cache.aget_many([text]))[0]
             if cached is not None:
                 logger.debug("Cache hit for embedding")
                 return cached
 
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return await self._in_flight.do(
+            (self.model, self.dimension, text_hash), lambda: self._embed_and_cache(text)
+        )
+
+    async def _embed_and_cache(self, text: str) -> List[float]:
         # Generate embedding
         embedding = await self._embed_with_retry(text)
 
         # Store in cache
         if self.cache:
-            self.cache.set(text, embedding)
+            await self.cache.aset_many([(text, embedding)])
 
         return embedding
 
@@ -231,7 +356,10 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
         """
         Generate embedding vectors for multiple texts in a batch.
 
-        Processes texts in batches up to MAX_BATCH_SIZE, with cache lookups.
+        Cached texts are served from the cache; the remaining distinct texts are
+        sent as multi-content ``embed_content`` requests sized by count and
+        estimated tokens (see ``_plan_requests``), one quota reservation each.
+        Requests are dispatched concurrently, up to ``max_concurrency`` in flight.
 
         Args:
             texts: List of texts to embed
@@ -246,46 +374,47 @@ class GeminiEmbeddingProvider(EmbeddingProvider):
         if not texts:
             raise ValueError("Texts list cannot be empty")
 
-        embeddings: List[List[float]] = []
-
-        # Process in batches
-        for i in range(0, len(texts), MAX_BATCH_SIZE):
-            batch = texts[i : i + MAX_BATCH_SIZE]
-
-            # Check cache for each text
-            batch_embeddings: List[Optional[List[float]]] = []
-            texts_to_embed: List[str] = []
-            indices_to_embed: List[int] = []
-
-            for idx, text in enumerate(batch):
-                if not text or not text.strip():
-                    raise ValueError(f"Text at index {i + idx} is empty")
-
-                cached = self.cache.get(text) if self.cache else None
-                if cached is not None:
-                    batch_embeddings.append(cached)
-                else:
-                    batch_embeddings.append(None)
-                    texts_to_embed.append(text)
-                    indices_to_embed.append(idx)
-
-            # Generate embeddings for uncached texts
-            if texts_to_embed:
-                # Process sequentially to avoid rate limits
-                for j, text in enumerate(texts_to_embed):
-                    embedding = await self._embed_with_retry(text)
-
-                    # Store in cache
-                    if self.cache:
-                        self.cache.set(text, embedding)
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                raise ValueError(f"Text at index {index} is empty")
+
+        embeddings: List[Optional[List[float]]] = (
+            await self.cache.aget_many(texts) if self.cache else [None] * len(texts)
+        )
+        pending: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            if embeddings[index] is None:
+                pending.setdefault(text, []).append(index)
+
+        texts_to_embed = list(pending)
+        request_texts = [
+            [texts_to_embed[index] for index in request]
+            for request in self._plan_requests(texts_to_embed)
+        ]
+        # Each request caches its vectors as soon as it lands, so a failed request
+        # doesn't discard the others' results; it also cancels those still running
+        tasks = [
+            asyncio.create_task(self._embed_group_and_cache(batch)) for batch in request_texts
+        ]
+        try:
+            request_embeddings = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
-                    # Insert at correct position
-                    batch_idx = indices_to_embed[j]
-                    batch_embeddings[batch_idx] = embedding
+        for batch, batch_embeddings in zip(request_texts, request_embeddings, strict=True):
+            for text, embedding in zip(batch, batch_embeddings, strict=True):
+                for index in pending[text]:
+                    embeddings[index] = embedding
 
-            # Add batch to results
-            embeddings.extend([e for e in batch_embeddings if e is not None])
+        return embeddings
 
+    async def _embed_group_and_cache(self, texts: List[str]) -> List[List[float]]:
+        embeddings = await self._embed_group(texts)
+        if self.cache:
+            await self.cache.aset_many(list(zip(texts, embeddings, strict=True)))
         return embeddings
 
     def get_dimension(self) -> int:
@@ -0,0 +1,189 @@
+"""
+Durable SQLite tier for the embedding cache.
+
+Vectors are stored as float32 blobs keyed by ``(model, dimension,
+sha256(text))``, so switching the embedding model or Matryoshka dimension
+never serves stale vectors. The database runs in WAL mode, so API workers
+and ``scripts/ingest_content.py`` can share one file: a re-ingest of
+unchanged text and a restarted worker's hot queries both skip the API.
+
+Embeddings are deterministic for a given key, so this tier has no TTL;
+the in-memory ``EmbeddingCache`` in front of it keeps its own LRU/TTL.
+Calls are blocking; async callers go through ``EmbeddingCache.aget_many`` /
+``aset_many``, which run them in a worker thread. A short busy timeout turns
+lock contention into a cache miss or a skipped write instead of a stall.
+"""
+
+import logging
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Busy timeout: a locked database fails fast and the cache treats it as a miss
+_BUSY_TIMEOUT_SECONDS = 0.5
+
+# SQLite caps bound parameters per statement (999 on older builds)
+_MAX_LOOKUP_KEYS = 900
+
+
+def _encode(embedding: Sequence[float]) -> bytes:
+    values = array("f", embedding)
+    if sys.byteorder == "big":
+        values.byteswap()  # stored little-endian
+    return values.tobytes()
+
+
+def _decode(blob: bytes) -> List[float]:
+    values = array("f")
+    values.frombytes(blob)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tolist()
+
+
+class SqliteEmbeddingStore:
+    """Embedding vectors in a SQLite file shared across processes."""
+
+    def __init__(self, path: str | Path):
+        """
+        Open (and create if needed) the embedding store.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.path),
+            timeout=_BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                dimension INTEGER NOT NULL,
+                text_hash TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (model, dimension, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        logger.info(f"Opened persistent embedding store at {self.path}")
+
+    def get_many(
+        self, model: str, dimension: int, text_hashes: Iterable[str]
+    ) -> Dict[str, List[float]]:
+        """
+        Look up vectors for several text hashes.
+
+        Returns:
+            text_hash -> vector for the hashes found (misses are absent)
+        """
+        wanted = list(dict.fromkeys(text_hashes))
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            for start in range(0, len(wanted), _MAX_LOOKUP_KEYS):
+                chunk = wanted[start : start + _MAX_LOOKUP_KEYS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    "SELECT text_hash, vector FROM embeddings "
+                    f"WHERE model = ? AND dimension = ? AND text_hash IN ({placeholders})",
+                    (model, dimension, *chunk),
+                ).fetchall()
+                for text_hash, blob in rows:
+                    vector = _decode(blob)
+                    if len(vector) == dimension:
+                        found[text_hash] = vector
+        self.hits += len(found)
+        self.misses += len(wanted) - len(found)
+        return found
+
+    def set_many(
+        self, model: str, dimension: int, items: Iterable[Tuple[str, Sequence[float]]]
+    ) -> None:
+        """Store vectors for several text hashes (one transaction)."""
+        now = time.time()
+        rows = [
+            (model, dimension, text_hash, _encode(embedding), now)
+            for text_hash, embedding in items
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings "
+                    "(model, dimension, text_hash, vector, created_at) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+        self.writes += len(rows)
+
+    def count(self, model: Optional[str] = None, dimension: Optional[int] = None) -> int:
+        """Number of stored vectors, optionally for one model/dimension."""
+        query = "SELECT COUNT(*) FROM embeddings"
+        params: Tuple = ()
+        if model is not None and dimension is not None:
+            query += " WHERE model = ? AND dimension = ?"
+            params = (model, dimension)
+        with self._lock:
+            return self._connection.execute(query, params).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def get_stats(self) -> Dict[str, int | str]:
+        return {
+            "path": str(self.path),
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+        }
+
+
+_stores: Dict[str, SqliteEmbeddingStore] = {}
+
+
+def get_embedding_store() -> Optional[SqliteEmbeddingStore]:
+    """Return the process-wide store for settings.embedding_cache_path (None when unset)."""
+    path = settings.embedding_cache_path
+    if not path:
+        return None
+    store = _stores.get(path)
+    if store is None:
+        try:
+            store = SqliteEmbeddingStore(path)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning(f"Persistent embedding cache unavailable at {path}: {exc}")
+            return None
+        _stores[path] = store
+    return store
+
+
+def reset_embedding_stores() -> None:
+    """Close and forget opened stores (test helper)."""
+    for store in _stores.values():
+        store.close()
+    _stores.clear()
@@ -0,0 +1,165 @@
+"""
+Shared Gemini SDK clients and bounded request pools.
+
+Providers call the SDK's native asyncio surface (``client.aio``) instead of
+wrapping the blocking client in the event loop's default thread pool. That
+pool is shared with every other blocking call, and a timed-out
+``run_in_executor`` call keeps its worker thread busy until the SDK returns.
+
+- ``get_genai_client`` returns one ``genai.Client`` per API key, so every
+  provider shares the same async HTTP connection pool.
+- ``RequestPool`` bounds in-flight requests per provider kind. A slot is
+  freed as soon as its request finishes, times out or is cancelled, and its
+  stats show how saturated the pool is.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict
+
+import google.genai as genai
+
+logger = logging.getLogger(__name__)
+
+_clients: Dict[str, genai.Client] = {}
+
+
+def get_genai_client(api_key: str) -> genai.Client:
+    """Return the process-wide SDK client for ``api_key``."""
+    client = _clients.get(api_key)
+    if client is None:
+        client = _clients[api_key] = genai.Client(api_key=api_key)
+    return client
+
+
+def reset_genai_clients() -> None:
+    """Forget shared SDK clients (test helper)."""
+    _clients.clear()
+
+
+class RequestPool:
+    """
+    In-flight request limit with saturation stats.
+
+    Unlike ``asyncio.Semaphore`` the limit can be changed while requests are
+    running, and waiters are not bound to one event loop.
+    """
+
+    def __init__(self, name: str, limit: int):
+        """
+        Initialize request pool.
+
+        Args:
+            name: Provider kind reported in stats (e.g. "gemini_llm")
+            limit: Max in-flight requests
+        """
+        self.name = name
+        self.limit = max(1, limit)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+        self.saturated = 0  # requests that had to queue for a slot
+        self.cancelled = 0  # requests cancelled or timed out while queued or in flight
+        self.wait_seconds = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    def resize(self, limit: int) -> None:
+        """Change the in-flight limit (takes effect as slots free up)."""
+        self.limit = max(1, limit)
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one in-flight slot for the duration of the block."""
+        await self._acquire()
+        try:
+            yield
+        except (asyncio.CancelledError, TimeoutError):
+            self.cancelled += 1
+            raise
+        finally:
+            self._release()
+
+    async def _acquire(self) -> None:
+        self.requests += 1
+        if self.in_flight < self.limit and not self._waiters:
+            self._take()
+            return
+
+        self.saturated += 1
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start_time = time.perf_counter()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over just as we were cancelled
+                self._release()
+            else:
+                self._waiters.remove(waiter)
+            self.cancelled += 1
+            raise
+        finally:
+            self.wait_seconds += time.perf_counter() - start_time
+
+    def _take(self) -> None:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._take()
+                waiter.set_result(None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with limit, in-flight/queued counts and saturation totals
+        """
+        return {
+            "name": self.name,
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "waiting": len(self._waiters),
+            "requests": self.requests,
+            "saturated": self.saturated,
+            "cancelled": self.cancelled,
+            "wait_seconds": self.wait_seconds,
+            "utilization": self.in_flight / self.limit,
+        }
+
+
+_pools: Dict[str, RequestPool] = {}
+
+
+def get_request_pool(name: str, limit: int) -> RequestPool:
+    """Return the process-wide pool for ``name``, applying ``limit``."""
+    pool = _pools.get(name)
+    if pool is None:
+        pool = _pools[name] = RequestPool(name, limit)
+    elif pool.limit != limit:
+        pool.resize(limit)
+    return pool
+
+
+def get_request_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Saturation statistics for every provider pool."""
+    return {name: pool.get_stats() for name, pool in _pools.items()}
+
+
+def reset_request_pools() -> None:
+    """Forget all request pools (test helper)."""
+    _pools.clear()
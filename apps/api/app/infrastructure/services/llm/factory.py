@@ -2,10 +2,12 @@
 Factory for creating LLM provider instances.
 
 Provides convenient methods to create providers from configuration.
+Providers are pooled per (api_key, model); callers get lightweight handles
+that differ only in their temperature/max_tokens defaults.
 """
 
 import logging
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from app.core.config import settings
 
@@ -14,6 +16,26 @@ from .gemini import GeminiLLMProvider
 
 logger = logging.getLogger(__name__)
 
+_provider_pool: Dict[Tuple[str, str], GeminiLLMProvider] = {}
+
+
+def _pooled_gemini_provider(api_key: str, model: str) -> GeminiLLMProvider:
+    provider = _provider_pool.get((api_key, model))
+    if provider is None:
+        logger.info(f"Creating Gemini LLM provider with model={model}")
+        provider = _provider_pool[(api_key, model)] = GeminiLLMProvider(
+            api_key=api_key,
+            model=model,
+            temperature=settings.llm_temperature,
+            max_tokens=settings.llm_max_tokens,
+        )
+    return provider
+
+
+def reset_llm_provider_pool() -> None:
+    """Forget pooled providers (test helper)."""
+    _provider_pool.clear()
+
 
 def create_llm_provider(
     provider_name: Optional[str] = None,
@@ -23,7 +45,7 @@ def create_llm_provider(
     max_tokens: Optional[int] = None,
 ) -> LLMProvider:
     """
-    Create an LLM provider instance.
+    Create an LLM provider handle over the process-wide provider pool.
 
     Args:
         provider_name: Name of the provider ("groq" or "gemini", default: from settings)
@@ -33,7 +55,7 @@ def create_llm_provider(
         max_tokens: Max tokens (if None, uses from settings)
 
     Returns:
-        LLMProvider instance
+        LLMProvider handle sharing the pooled client for (api_key, model)
 
     Raises:
         ValueError: If provider is unknown or API key is missing
@@ -54,12 +76,8 @@ def create_llm_provider(
 
         # Use default from config as single source of truth
         model_name = model or settings.default_llm_model
-        logger.info(f"Creating Gemini LLM provider with model={model_name}")
-        return GeminiLLMProvider(
-            api_key=key,
-            model=model_name,
-            temperature=temp,
-            max_tokens=max_tok,
+        return _pooled_gemini_provider(key, model_name).with_options(
+            temperature=temp, max_tokens=max_tok
         )
 
     else:
@@ -5,10 +5,10 @@ Uses Google's Generative AI API for text generation.
 """
 
 import asyncio
+import copy
 import logging
 from typing import List, Optional, Tuple
 
-import google.genai as genai
 from google.genai import types
 from tenacity import (
     retry,
@@ -23,6 +23,7 @@ from app.infrastructure.services.cost.token_cost import (
     calculate_gemini_cost,
     estimate_tokens_from_text,
 )
+from app.infrastructure.services.genai_clients import get_genai_client, get_request_pool
 from app.infrastructure.services.llm.base import LLMProvider, LLMResponse
 from app.infrastructure.services.llm.types import LLMMessage
 
@@ -55,12 +56,29 @@ class GeminiLLMProvider(LLMProvider):
         self.temperature = temperature
         self.max_tokens = max_tokens
 
-        # Create Gemini Client (New SDK)
-        self.client = genai.Client(api_key=api_key)
+        # Shared Gemini Client (New SDK) and its async HTTP connection pool
+        self.client = get_genai_client(api_key)
         self.quota_manager = get_quota_manager()
+        self._request_slots = get_request_pool("gemini_llm", settings.llm_max_concurrency)
 
         logger.info(f"Initialized GeminiLLMProvider with model={self.model} (New SDK)")
 
+    def with_options(
+        self, temperature: Optional[float] = None, max_tokens: Optional[int] = None
+    ) -> "GeminiLLMProvider":
+        """
+        Return a handle with different per-call defaults.
+
+        The handle shares this provider's client, quota manager and request
+        pool; only the temperature/max_tokens defaults differ.
+        """
+        handle = copy.copy(self)
+        if temperature is not None:
+            handle.temperature = temperature
+        if max_tokens is not None:
+            handle.max_tokens = max_tokens
+        return handle
+
     def _messages_to_gemini_format(
         self, messages: List[LLMMessage]
     ) -> Tuple[Optional[str], str]:
@@ -134,20 +152,18 @@ class GeminiLLMProvider(LLMProvider):
                 system_instruction=system_instruction,
             )
 
-            # Run in executor with an explicit timeout so orchestration can
-            # classify and recover from transient provider slowness.
-            loop = asyncio.get_running_loop()
-            response = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: self.client.models.generate_content(
+            # Native async call with an explicit timeout so orchestration can
+            # classify and recover from transient provider slowness; the
+            # timeout cancels the HTTP request and frees the slot.
+            async with self._request_slots.slot():
+                response = await asyncio.wait_for(
+                    self.client.aio.models.generate_content(
                         model=self.model,
                         contents=user_prompt,
                         config=config,
                     ),
-                ),
-                timeout=max(0.1, settings.llm_timeout_ms / 1000),
-            )
+                    timeout=max(0.1, settings.llm_timeout_ms / 1000),
+                )
 
             # Extract content
             content = response.text if response.text else ""
@@ -0,0 +1,225 @@
+"""
+In-memory LRU cache for retrieval results.
+
+Entries are scoped to the content generation counter that ingestion bumps on
+every chunk write/delete, so cached results never outlive the content they
+were retrieved from.
+"""
+
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.infrastructure.db.models import ContentGeneration
+from app.infrastructure.db.session import get_session
+
+from .types import RetrievalOptions, RetrievalResult
+
+logger = logging.getLogger(__name__)
+
+_TRAILING_PUNCTUATION = re.compile(r"[\s?!.]+$")
+
+
+async def read_content_generation() -> int:
+    """Read the content generation counter bumped by ingestion."""
+    session_maker = get_session()
+    async with session_maker() as session:
+        result = await session.execute(
+            select(ContentGeneration.generation).where(ContentGeneration.id == 1)
+        )
+        return result.scalar() or 0
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation."""
+    collapsed = " ".join(query.lower().split())
+    return _TRAILING_PUNCTUATION.sub("", collapsed)
+
+
+class RetrievalCache:
+    """
+    LRU cache with TTL for retrieval results, invalidated by content generation.
+
+    Stores (results, expires_at) tuples. Empty (NO_DATA) results are cached as
+    negative entries with a shorter TTL so newly ingested content shows up soon.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        negative_ttl_seconds: Optional[int] = None,
+        generation_check_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize retrieval cache.
+
+        Args:
+            max_size: Maximum number of entries (default: from settings)
+            ttl_seconds: TTL for non-empty results (default: from settings)
+            negative_ttl_seconds: TTL for NO_DATA results (default: from settings)
+            generation_check_seconds: How often to re-read the content generation
+        """
+        self.max_size = max_size or settings.rag_result_cache_size
+        self.ttl_seconds = ttl_seconds or settings.rag_result_cache_ttl
+        self.negative_ttl_seconds = (
+            negative_ttl_seconds or settings.rag_result_cache_negative_ttl
+        )
+        self.generation_check_seconds = (
+            generation_check_seconds
+            if generation_check_seconds is not None
+            else settings.rag_content_generation_check_seconds
+        )
+        self.cache: OrderedDict[str, Tuple[List[RetrievalResult], float]] = OrderedDict()
+        self.generation: Optional[int] = None
+        self._generation_checked_at: Optional[float] = None
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        logger.info(
+            f"Initialized RetrievalCache with max_size={self.max_size}, "
+            f"ttl={self.ttl_seconds}s, negative_ttl={self.negative_ttl_seconds}s"
+        )
+
+    @staticmethod
+    def make_key(
+        query: str,
+        options: RetrievalOptions,
+        *,
+        hybrid: bool,
+        keyword_weight: float,
+        rrf_k: int,
+    ) -> str:
+        """Build a cache key from the normalized query and retrieval parameters."""
+        return json.dumps(
+            [
+                normalize_query(query),
+                options.top_k,
+                options.min_similarity,
+                options.filters,
+                options.recall_profile,
+                hybrid,
+                keyword_weight if hybrid else None,
+                rrf_k if hybrid else None,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+    async def refresh_generation(self) -> Optional[int]:
+        """
+        Re-read the content generation (at most every generation_check_seconds).
+
+        Clears the cache when the generation moved. Returns None when the
+        generation cannot be read, in which case callers should bypass the cache.
+        A failed read is also remembered for the interval, so an unavailable
+        database is not queried (and logged) on every call.
+        """
+        now = time.monotonic()
+        if (
+            self._generation_checked_at is not None
+            and now - self._generation_checked_at < self.generation_check_seconds
+        ):
+            return self.generation
+
+        self._generation_checked_at = now
+        try:
+            generation = await read_content_generation()
+        except Exception as exc:
+            logger.warning(f"Content generation unavailable, bypassing retrieval cache: {exc}")
+            self.generation = None
+            return None
+
+        if self.generation is not None and generation != self.generation:
+            logger.info(
+                f"Content generation {self.generation} -> {generation}; "
+                f"dropping {len(self.cache)} cached retrieval(s)"
+            )
+            self.cache.clear()
+            self.invalidations += 1
+        self.generation = generation
+        return generation
+
+    def get(self, key: str) -> Optional[List[RetrievalResult]]:
+        """
+        Get cached results.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached results (possibly empty for NO_DATA) or None on miss
+        """
+        entry = self.cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        results, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self.cache[key]
+            self.misses += 1
+            return None
+
+        self.cache.move_to_end(key)
+        self.hits += 1
+        if not results:
+            self.negative_hits += 1
+        return list(results)
+
+    def set(self, key: str, results: List[RetrievalResult]) -> None:
+        """
+        Store results; empty results use the negative TTL.
+
+        Args:
+            key: Cache key from make_key()
+            results: Retrieval results to cache
+        """
+        ttl = self.ttl_seconds if results else self.negative_ttl_seconds
+        if key not in self.cache and len(self.cache) >= self.max_size:
+            self.cache.popitem(last=False)
+            self.evictions += 1
+
+        self.cache[key] = (list(results), time.monotonic() + ttl)
+        self.cache.move_to_end(key)
+
+    def clear(self) -> None:
+        """Clear all cache entries and statistics."""
+        self.cache.clear()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        logger.info("Retrieval cache cleared")
+
+    def get_stats(self) -> Dict[str, Union[int, float, Any]]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache stats (size, hits, misses, evictions, hit_rate, ...)
+        """
+        total_requests = self.hits + self.misses
+        hit_rate = self.hits / total_requests if total_requests > 0 else 0.0
+
+        return {
+            "size": len(self.cache),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "generation": self.generation,
+            "hit_rate": hit_rate,
+        }
@@ -0,0 +1,409 @@
+"""
+Portable, memory-mapped index artifact for the local vector retriever.
+
+One artifact version lives in ``<root>/<version>/``:
+
+- ``embeddings.npy``: float32 (rows, dimension) matrix with L2-normalized rows
+- ``chunks.npy``: per-chunk sidecar (chunk id, interned document, doc_type,
+  destination and section ids, packed tag bits, text offsets)
+- ``texts.bin``: UTF-8 chunk texts in one blob, addressed by the sidecar offsets
+- ``manifest.json``: format version, model, dimension, row count, content
+  generation, content hash, vocabularies and per-document metadata
+
+``<root>/CURRENT`` names the active version and is replaced atomically. The
+large parts are opened with ``mmap_mode="r"``, so every worker process shares
+the same pages through the OS page cache and loading takes milliseconds.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when optional dependency missing
+    np = None
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+CURRENT_FILE = "CURRENT"
+MANIFEST_FILE = "manifest.json"
+EMBEDDINGS_FILE = "embeddings.npy"
+CHUNKS_FILE = "chunks.npy"
+TEXTS_FILE = "texts.bin"
+
+# Chunk-level metadata keys; everything else is interned per document
+_CHUNK_KEYS = ("chunk_index", "section_header")
+_ABSENT = -2  # key missing from the chunk metadata
+_NONE = -1  # key present with a null value
+
+
+class _Vocabulary:
+    """Interns values to dense integer ids in first-seen order."""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.values: List[Any] = []
+
+    def intern(self, key: str, value: Any = None) -> int:
+        if key not in self.ids:
+            self.ids[key] = len(self.values)
+            self.values.append(key if value is None else value)
+        return self.ids[key]
+
+    def code(self, value: Any) -> int:
+        return _NONE if value is None else self.intern(str(value))
+
+
+def _chunk_dtype(tag_bytes: int):
+    return np.dtype(
+        [
+            ("id", "u1", (16,)),
+            ("document", "<i4"),
+            ("chunk_index", "<i4"),
+            ("section", "<i4"),
+            ("doc_type", "<i4"),
+            ("destination", "<i4"),
+            ("tags", "u1", (max(1, tag_bytes),)),
+            ("text_start", "<i8"),
+            ("text_end", "<i8"),
+        ]
+    )
+
+
+def _content_hash(matrix, chunks, texts, vocabularies: Dict[str, Any]) -> str:
+    digest = hashlib.sha256()
+    for part in (matrix, chunks, texts):
+        digest.update(np.ascontiguousarray(part).tobytes())
+    digest.update(json.dumps(vocabularies, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def write_index_artifact(
+    root: Union[str, Path],
+    rows: Iterable[Dict[str, Any]],
+    *,
+    model: str,
+    dimension: int,
+    generation: int,
+    keep_versions: int = 2,
+) -> Dict[str, Any]:
+    """
+    Write a new artifact version and point ``CURRENT`` at it.
+
+    Args:
+        root: Artifact root directory
+        rows: Chunks as dicts with id, text, embedding and metadata
+            (the RAGRepository.get_all() format)
+        model: Embedding model name
+        dimension: Embedding dimension
+        generation: Content generation the rows were read at
+        keep_versions: Number of versions (including the new one) to keep
+
+    Returns:
+        The written manifest
+
+    Raises:
+        RuntimeError: If numpy is not installed
+        ValueError: If an embedding has the wrong dimension
+    """
+    if np is None:
+        raise RuntimeError("Index artifacts require numpy; install the 'local-index' extra")
+
+    rows = list(rows)
+    documents, sections = _Vocabulary(), _Vocabulary()
+    doc_types, destinations, tags = _Vocabulary(), _Vocabulary(), _Vocabulary()
+    matrix = np.zeros((len(rows), dimension), dtype=np.float32)
+    records = []
+    row_tags: List[List[int]] = []
+    texts = bytearray()
+
+    for row_number, row in enumerate(rows):
+        embedding = np.asarray(row["embedding"], dtype=np.float32)
+        if embedding.shape != (dimension,):
+            raise ValueError(
+                f"Expected embedding dimension {dimension}, got {embedding.shape} for chunk {row['id']}"
+            )
+        matrix[row_number] = embedding
+
+        metadata = dict(row.get("metadata") or {})
+        document = {k: v for k, v in metadata.items() if k not in _CHUNK_KEYS}
+        document_key = json.dumps(document, sort_keys=True, default=str)
+        chunk_index = metadata.get("chunk_index", _ABSENT)
+        section = (
+            sections.code(metadata["section_header"])
+            if "section_header" in metadata
+            else _ABSENT
+        )
+
+        text = row["text"].encode("utf-8")
+        records.append(
+            (
+                np.frombuffer(uuid.UUID(str(row["id"])).bytes, dtype=np.uint8),
+                documents.intern(document_key, document),
+                _NONE if chunk_index is None else int(chunk_index),
+                section,
+                doc_types.code(metadata.get("doc_type")),
+                destinations.code(metadata.get("destination")),
+                0,
+                len(texts),
+                len(texts) + len(text),
+            )
+        )
+        row_tags.append([tags.code(tag) for tag in metadata.get("tags") or []])
+        texts.extend(text)
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+
+    tag_bytes = (len(tags.values) + 7) // 8
+    chunks = np.array(records, dtype=_chunk_dtype(tag_bytes))
+    if tag_bytes:
+        tag_matrix = np.zeros((len(rows), len(tags.values)), dtype=bool)
+        for row_number, codes in enumerate(row_tags):
+            tag_matrix[row_number, codes] = True
+        chunks["tags"][:, :tag_bytes] = np.packbits(tag_matrix, axis=1, bitorder="little")
+
+    blob = np.frombuffer(bytes(texts), dtype=np.uint8)
+    vocabularies = {
+        "documents": documents.values,
+        "sections": sections.values,
+        "doc_types": doc_types.values,
+        "destinations": destinations.values,
+        "tags": tags.values,
+    }
+    content_hash = _content_hash(matrix, chunks, blob, vocabularies)
+    version = f"g{generation:08d}-{content_hash[:12]}"
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "version": version,
+        "model": model,
+        "dimension": dimension,
+        "rows": len(rows),
+        "generation": generation,
+        "content_hash": content_hash,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "vocabularies": vocabularies,
+    }
+
+    root = Path(root)
+    directory = root / version
+    staging = root / f".{version}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    np.save(staging / EMBEDDINGS_FILE, matrix)
+    np.save(staging / CHUNKS_FILE, chunks)
+    (staging / TEXTS_FILE).write_bytes(bytes(texts))
+    (staging / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2, default=str), encoding="utf-8")
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(staging, directory)
+
+    pointer = root / f".{CURRENT_FILE}.tmp"
+    pointer.write_text(version, encoding="utf-8")
+    os.replace(pointer, root / CURRENT_FILE)
+
+    _prune_versions(root, keep=version, keep_versions=keep_versions)
+    logger.info(f"Wrote index artifact {directory} ({len(rows)} rows)")
+    return manifest
+
+
+def _prune_versions(root: Path, *, keep: str, keep_versions: int) -> None:
+    """Delete the oldest versions; open mmaps of deleted files stay valid."""
+    versions = sorted(
+        (path for path in root.iterdir() if path.is_dir() and not path.name.startswith(".")),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for path in [path for path in versions if path.name != keep][keep_versions - 1 :]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+class _IdColumn(Sequence):
+    """Chunk ids decoded on access from the sidecar."""
+
+    def __init__(self, ids):
+        self._ids = ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, row: int) -> uuid.UUID:
+        return uuid.UUID(bytes=self._ids[row].tobytes())
+
+
+class _TextColumn(Sequence):
+    """Chunk texts sliced on access from the mapped blob."""
+
+    def __init__(self, blob, starts, ends):
+        self._blob = blob
+        self._starts = starts
+        self._ends = ends
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, row: int) -> str:
+        return self._blob[self._starts[row] : self._ends[row]].tobytes().decode("utf-8")
+
+
+class _MetadataColumn(Sequence):
+    """Chunk metadata rebuilt on access from interned document metadata."""
+
+    def __init__(self, chunks, documents: List[Dict[str, Any]], sections: List[str]):
+        self._chunks = chunks
+        self._documents = documents
+        self._sections = sections
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def __getitem__(self, row: int) -> Dict[str, Any]:
+        chunk = self._chunks[row]
+        metadata = dict(self._documents[int(chunk["document"])])
+        chunk_index = int(chunk["chunk_index"])
+        if chunk_index != _ABSENT:
+            metadata["chunk_index"] = None if chunk_index == _NONE else chunk_index
+        section = int(chunk["section"])
+        if section != _ABSENT:
+            metadata["section_header"] = None if section == _NONE else self._sections[section]
+        return metadata
+
+
+class _RowsById(Mapping):
+    """Maps chunk UUIDs to rows without materializing UUID objects."""
+
+    def __init__(self, ids):
+        raw = np.ascontiguousarray(ids).tobytes()
+        self._rows = {raw[row * 16 : (row + 1) * 16]: row for row in range(len(ids))}
+
+    def __getitem__(self, chunk_id: uuid.UUID) -> int:
+        return self._rows[chunk_id.bytes]
+
+    def __iter__(self) -> Iterator[uuid.UUID]:
+        return (uuid.UUID(bytes=key) for key in self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+@dataclass(frozen=True)
+class IndexArtifact:
+    """A loaded (memory-mapped) artifact version."""
+
+    directory: Path
+    manifest: Dict[str, Any]
+    matrix: Any  # np.memmap (rows, dimension), float32, L2-normalized rows
+    chunks: Any  # np.memmap of the structured sidecar
+    blob: Any  # np.memmap of the text blob (uint8)
+
+    @property
+    def ids(self) -> Sequence:
+        return _IdColumn(self.chunks["id"])
+
+    @property
+    def texts(self) -> Sequence:
+        return _TextColumn(self.blob, self.chunks["text_start"], self.chunks["text_end"])
+
+    @property
+    def metadata(self) -> Sequence:
+        vocabularies = self.manifest["vocabularies"]
+        return _MetadataColumn(self.chunks, vocabularies["documents"], vocabularies["sections"])
+
+    @property
+    def row_by_id(self) -> Mapping:
+        return _RowsById(self.chunks["id"])
+
+    def vocabulary(self, name: str) -> Dict[str, int]:
+        return {value: code for code, value in enumerate(self.manifest["vocabularies"][name])}
+
+    def tag_matrix(self):
+        tag_count = len(self.manifest["vocabularies"]["tags"])
+        return np.unpackbits(
+            self.chunks["tags"], axis=1, count=tag_count, bitorder="little"
+        ).astype(bool)
+
+    def verify(self) -> None:
+        """Recompute the content hash (reads every page) and compare to the manifest."""
+        actual = _content_hash(
+            self.matrix, self.chunks, self.blob, self.manifest["vocabularies"]
+        )
+        if actual != self.manifest["content_hash"]:
+            raise ValueError(f"Index artifact {self.directory} failed content hash check")
+
+
+def resolve_artifact_version(root: Union[str, Path]) -> Path:
+    """Return the directory of the active version (``root`` itself if it is a version)."""
+    root = Path(root)
+    if (root / MANIFEST_FILE).exists():
+        return root
+    current = root / CURRENT_FILE
+    if not current.exists():
+        raise FileNotFoundError(f"No index artifact found at {root}")
+    return root / current.read_text(encoding="utf-8").strip()
+
+
+def load_index_artifact(
+    root: Union[str, Path],
+    *,
+    model: Optional[str] = None,
+    dimension: Optional[int] = None,
+    verify: bool = False,
+) -> IndexArtifact:
+    """
+    Memory-map the active artifact version.
+
+    Args:
+        root: Artifact root (or a version directory)
+        model: Expected embedding model (checked when given)
+        dimension: Expected embedding dimension (checked when given)
+        verify: Recompute the content hash (touches every page; off by default)
+
+    Returns:
+        IndexArtifact backed by read-only memory maps
+
+    Raises:
+        RuntimeError: If numpy is not installed
+        FileNotFoundError: If no artifact exists at root
+        ValueError: If the format, model, dimension or content hash do not match
+    """
+    if np is None:
+        raise RuntimeError("Index artifacts require numpy; install the 'local-index' extra")
+
+    directory = resolve_artifact_version(root)
+    manifest = json.loads((directory / MANIFEST_FILE).read_text(encoding="utf-8"))
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported index artifact format {manifest.get('format_version')} "
+            f"(expected {FORMAT_VERSION})"
+        )
+    if model is not None and manifest["model"] != model:
+        raise ValueError(f"Index artifact model {manifest['model']} does not match {model}")
+    if dimension is not None and manifest["dimension"] != dimension:
+        raise ValueError(
+            f"Index artifact dimension {manifest['dimension']} does not match {dimension}"
+        )
+
+    artifact = IndexArtifact(
+        directory=directory,
+        manifest=manifest,
+        matrix=np.load(directory / EMBEDDINGS_FILE, mmap_mode="r"),
+        chunks=np.load(directory / CHUNKS_FILE, mmap_mode="r"),
+        blob=(
+            np.memmap(directory / TEXTS_FILE, dtype=np.uint8, mode="r")
+            if (directory / TEXTS_FILE).stat().st_size
+            else np.zeros(0, dtype=np.uint8)
+        ),
+    )
+    if verify:
+        artifact.verify()
+    return artifact
@@ -0,0 +1,484 @@
+"""
+In-process vector retrieval for RAG.
+
+Keeps every chunk embedding in a pre-normalized float32 matrix so that
+semantic search is one matrix-vector product plus ``argpartition``. Metadata
+filters are evaluated against precomputed column arrays. The index reloads
+when ingestion bumps the content generation. When an index artifact written
+by ``scripts/ingest_content.py --export-index`` matches the current generation,
+it is memory-mapped instead of read from the database. Full-text search for
+hybrid retrieval still runs in Postgres.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.infrastructure.db.models.content_embedding import ContentEmbedding
+from app.infrastructure.db.session import get_session
+
+from .cache import read_content_generation
+from .index_artifact import IndexArtifact, load_index_artifact
+from .retriever import VectorRetriever
+from .types import RetrievalOptions, RetrievalResult
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when optional dependency missing
+    np = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LocalIndex:
+    """Immutable snapshot of the content embeddings for one content generation."""
+
+    generation: int
+    ids: Sequence[uuid.UUID]
+    texts: Sequence[str]
+    metadata: Sequence[Dict[str, Any]]
+    matrix: Any  # np.ndarray (rows, dimension), float32, L2-normalized rows
+    row_by_id: Mapping[uuid.UUID, int]
+    doc_types: Any  # np.ndarray (rows,), int32 codes into doc_type_vocab, -1 if unset
+    doc_type_vocab: Dict[str, int]
+    destinations: Any  # np.ndarray (rows,), int32 codes into destination_vocab, -1 if unset
+    destination_vocab: Dict[str, int]
+    tags: Any  # np.ndarray (rows, len(tag_vocab)), bool
+    tag_vocab: Dict[str, int]
+    load_ms: float = 0.0
+    source: str = "database"
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def build(
+        cls,
+        generation: int,
+        ids: List[uuid.UUID],
+        texts: List[str],
+        metadata: List[Dict[str, Any]],
+        embeddings: List[Any],
+        dimension: int,
+    ) -> "LocalIndex":
+        """Build a snapshot from loaded rows (normalizes and interns metadata)."""
+        matrix = np.asarray(embeddings, dtype=np.float32).reshape(len(ids), dimension)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+
+        doc_type_vocab: Dict[str, int] = {}
+        destination_vocab: Dict[str, int] = {}
+        tag_vocab: Dict[str, int] = {}
+        doc_types = np.full(len(ids), -1, dtype=np.int32)
+        destinations = np.full(len(ids), -1, dtype=np.int32)
+        row_tags: List[List[int]] = []
+        for row, meta in enumerate(metadata):
+            doc_type = meta.get("doc_type")
+            if doc_type is not None:
+                doc_types[row] = doc_type_vocab.setdefault(str(doc_type), len(doc_type_vocab))
+            destination = meta.get("destination")
+            if destination is not None:
+                destinations[row] = destination_vocab.setdefault(
+                    str(destination), len(destination_vocab)
+                )
+            row_tags.append(
+                [tag_vocab.setdefault(str(tag), len(tag_vocab)) for tag in meta.get("tags") or []]
+            )
+
+        tags = np.zeros((len(ids), len(tag_vocab)), dtype=bool)
+        for row, codes in enumerate(row_tags):
+            tags[row, codes] = True
+
+        return cls(
+            generation=generation,
+            ids=ids,
+            texts=texts,
+            metadata=metadata,
+            matrix=matrix,
+            row_by_id={chunk_id: row for row, chunk_id in enumerate(ids)},
+            doc_types=doc_types,
+            doc_type_vocab=doc_type_vocab,
+            destinations=destinations,
+            destination_vocab=destination_vocab,
+            tags=tags,
+            tag_vocab=tag_vocab,
+        )
+
+    @classmethod
+    def from_artifact(cls, artifact: IndexArtifact) -> "LocalIndex":
+        """Wrap a memory-mapped artifact; the matrix and texts stay on shared pages."""
+        return cls(
+            generation=artifact.manifest["generation"],
+            ids=artifact.ids,
+            texts=artifact.texts,
+            metadata=artifact.metadata,
+            matrix=artifact.matrix,
+            row_by_id=artifact.row_by_id,
+            doc_types=artifact.chunks["doc_type"],
+            doc_type_vocab=artifact.vocabulary("doc_types"),
+            destinations=artifact.chunks["destination"],
+            destination_vocab=artifact.vocabulary("destinations"),
+            tags=artifact.tag_matrix(),
+            tag_vocab=artifact.vocabulary("tags"),
+            source=str(artifact.directory),
+        )
+
+    def filter_mask(self, filters: Optional[Dict[str, Any]]) -> Optional[Any]:
+        """Evaluate doc_type/destination/tags filters; None means every row matches."""
+        if not filters:
+            return None
+
+        mask = np.ones(self.size, dtype=bool)
+        if "doc_type" in filters:
+            wanted = filters["doc_type"]
+            wanted = wanted if isinstance(wanted, list) else [wanted]
+            codes = [self.doc_type_vocab[v] for v in wanted if v in self.doc_type_vocab]
+            mask &= np.isin(self.doc_types, codes)
+
+        if "destination" in filters:
+            code = self.destination_vocab.get(filters["destination"])
+            mask &= self.destinations == code if code is not None else False
+
+        for tag in filters.get("tags") or []:
+            code = self.tag_vocab.get(tag)
+            mask &= self.tags[:, code] if code is not None else False
+
+        return mask
+
+    def search(
+        self, query_embedding: List[float], options: RetrievalOptions
+    ) -> Tuple[Any, Any]:
+        """
+        Exact cosine top-k over the filtered rows.
+
+        Returns:
+            (row indices, similarities), both sorted by similarity descending
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm:
+            query = query / norm
+
+        scores = self.matrix @ query
+        keep = scores >= options.min_similarity
+        mask = self.filter_mask(options.filters)
+        if mask is not None:
+            keep &= mask
+
+        candidates = np.flatnonzero(keep)
+        if candidates.size == 0 or options.top_k <= 0:
+            return candidates[:0], scores[:0]
+
+        candidate_scores = scores[candidates]
+        k = min(options.top_k, candidates.size)
+        top = np.argpartition(-candidate_scores, k - 1)[:k]
+        top = top[np.argsort(-candidate_scores[top], kind="stable")]
+        return candidates[top], candidate_scores[top]
+
+    def to_result(self, row: int, score: float) -> RetrievalResult:
+        metadata = self.metadata[row]
+        return RetrievalResult(
+            chunk_id=str(self.ids[row]),
+            text=self.texts[row],
+            similarity=score,
+            metadata=metadata,
+            source_citation=metadata.get("content_path"),
+        )
+
+
+class LocalVectorRetriever(VectorRetriever):
+    """
+    Retrieves content chunks from an in-memory NumPy index.
+
+    Drop-in replacement for VectorRetriever, selected with
+    ``RAG_RETRIEVER_BACKEND=local``. Suited to corpora that fit comfortably in
+    memory, where an exact scan beats a database round trip.
+    """
+
+    def __init__(
+        self,
+        embedding_provider=None,
+        refresh_seconds: Optional[float] = None,
+        index_path: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize local vector retriever.
+
+        Args:
+            embedding_provider: Embedding provider instance (if None, creates from env)
+            refresh_seconds: How often to re-check the content generation
+                (default: settings.rag_content_generation_check_seconds)
+            index_path: Index artifact root to memory-map
+                (default: settings.rag_local_index_path; None loads from the database)
+
+        Raises:
+            RuntimeError: If numpy is not installed
+        """
+        if np is None:
+            raise RuntimeError(
+                "LocalVectorRetriever requires numpy; install the 'local-index' extra"
+            )
+        super().__init__(embedding_provider)
+        self.refresh_seconds = (
+            refresh_seconds
+            if refresh_seconds is not None
+            else settings.rag_content_generation_check_seconds
+        )
+        index_path = index_path or settings.rag_local_index_path
+        self.index_path = Path(index_path) if index_path else None
+        self._index: Optional[LocalIndex] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+        self.reloads = 0
+
+    async def warm_up(self) -> None:
+        """Load the index before the first query."""
+        await self._ensure_index()
+
+    async def retrieve(
+        self,
+        query: str,
+        options: Optional[RetrievalOptions] = None,
+    ) -> List[RetrievalResult]:
+        """
+        Retrieve relevant content chunks based on query.
+
+        Args:
+            query: Search query
+            options: Retrieval options (default: RetrievalOptions())
+
+        Returns:
+            List of RetrievalResult objects, sorted by similarity (descending)
+
+        Raises:
+            ValueError: If query is empty
+            Exception: If the index cannot be loaded or the embedding fails
+        """
+        if not query or not query.strip():
+            raise ValueError("Query cannot be empty")
+
+        if options is None:
+            options = RetrievalOptions()
+
+        query_embedding, index = await asyncio.gather(
+            self._embed_query(query), self._ensure_index()
+        )
+        rows, scores = index.search(query_embedding, options)
+        results = [
+            index.to_result(int(row), float(score))
+            for row, score in zip(rows.tolist(), scores.tolist(), strict=True)
+        ]
+
+        logger.info(f"Retrieved {len(results)} chunks from local index ({index.size} rows)")
+        return results
+
+    async def _search_many(
+        self, query_embeddings: List[List[float]], options: RetrievalOptions
+    ) -> List[List[RetrievalResult]]:
+        """Search each query vector against the in-process index."""
+        index = await self._ensure_index()
+        results = []
+        for query_embedding in query_embeddings:
+            rows, scores = index.search(query_embedding, options)
+            results.append(
+                [
+                    index.to_result(int(row), float(score))
+                    for row, score in zip(rows.tolist(), scores.tolist(), strict=True)
+                ]
+            )
+        return results
+
+    async def _fuse_hybrid(
+        self,
+        query_embedding: List[float],
+        options: RetrievalOptions,
+        keyword_ids: List[uuid.UUID],
+        *,
+        keyword_weight: float,
+        k: int,
+    ) -> List[RetrievalResult]:
+        """Run the vector leg locally and fuse it with the keyword ranking (RRF)."""
+        index = await self._ensure_index()
+        rows, _ = index.search(query_embedding, options)
+
+        semantic_weight = 1 - keyword_weight
+        scores: Dict[int, float] = {}
+        semantic_rank: Dict[int, int] = {}
+        for rank, row in enumerate(rows.tolist(), 1):
+            scores[row] = semantic_weight / (k + rank)
+            semantic_rank[row] = rank
+        for rank, chunk_id in enumerate(keyword_ids, 1):
+            row = index.row_by_id.get(chunk_id)
+            if row is not None:
+                scores[row] = scores.get(row, 0.0) + keyword_weight / (k + rank)
+
+        fused = sorted(
+            scores, key=lambda row: (-scores[row], semantic_rank.get(row, len(rows) + 1))
+        )[: options.top_k]
+        return [index.to_result(row, scores[row]) for row in fused]  # RRF score
+
+    async def _fetch_keyword_results(
+        self,
+        keyword_ids: List[uuid.UUID],
+        *,
+        keyword_weight: float,
+        k: int,
+    ) -> List[RetrievalResult]:
+        """Serve keyword-only results from the index, scored as the keyword share of RRF."""
+        if not keyword_ids:
+            return []
+
+        index = await self._ensure_index()
+        results = [
+            index.to_result(index.row_by_id[chunk_id], keyword_weight / (k + rank))
+            for rank, chunk_id in enumerate(keyword_ids, 1)
+            if chunk_id in index.row_by_id
+        ]
+        logger.info(f"Hybrid search: Returning {len(results)} keyword-only results")
+        return results
+
+    async def _ensure_index(self) -> LocalIndex:
+        """
+        Return the current index, reloading it when the content generation moved.
+
+        If the generation or the reload fails while a previous snapshot exists,
+        the previous snapshot keeps serving. With an index artifact configured,
+        an unreadable generation still lets the artifact load as-is.
+        """
+        if self._index is not None and time.monotonic() - self._checked_at < self.refresh_seconds:
+            return self._index
+
+        async with self._lock:
+            now = time.monotonic()
+            if self._index is not None and now - self._checked_at < self.refresh_seconds:
+                return self._index
+
+            try:
+                generation: Optional[int] = await read_content_generation()
+            except Exception:
+                if self._index is None and self.index_path is None:
+                    raise
+                logger.warning("Content generation unavailable for local index", exc_info=True)
+                generation = None
+
+            if self._index is None or (
+                generation is not None and generation != self._index.generation
+            ):
+                try:
+                    self._index = await self._load_index(generation)
+                    self.reloads += 1
+                except Exception:
+                    if self._index is None:
+                        raise
+                    logger.error(
+                        f"Local index refresh failed; serving generation {self._index.generation}",
+                        exc_info=True,
+                    )
+
+            self._checked_at = now
+            return self._index
+
+    async def _load_index(self, generation: Optional[int]) -> LocalIndex:
+        """
+        Load the index for a content generation.
+
+        Prefers the memory-mapped artifact when it was exported at that
+        generation (or the generation is unknown); otherwise reads the database.
+        """
+        if self.index_path is not None:
+            try:
+                index = self._load_artifact()
+            except Exception:
+                if generation is None:
+                    raise
+                logger.warning(
+                    f"Index artifact at {self.index_path} unavailable; loading from database",
+                    exc_info=True,
+                )
+            else:
+                if generation is None or index.generation == generation:
+                    return index
+                logger.warning(
+                    f"Index artifact is at generation {index.generation}, database at "
+                    f"{generation}; loading from database"
+                )
+        return await self._load_from_database(generation)
+
+    def _load_artifact(self) -> LocalIndex:
+        """Memory-map the active artifact version."""
+        started = time.perf_counter()
+        artifact = load_index_artifact(
+            self.index_path,
+            model=settings.embedding_model,
+            dimension=settings.embedding_dimension,
+        )
+        index = replace(
+            LocalIndex.from_artifact(artifact), load_ms=(time.perf_counter() - started) * 1000
+        )
+        logger.info(
+            f"Mapped local vector index artifact {index.source}: {index.size} rows, "
+            f"generation {index.generation} in {index.load_ms:.1f}ms"
+        )
+        return index
+
+    async def _load_from_database(self, generation: int) -> LocalIndex:
+        """Load all embedded chunks and build a new snapshot."""
+        started = time.perf_counter()
+        session_maker = get_session()
+        async with session_maker() as session:
+            stmt = select(
+                ContentEmbedding.id,
+                ContentEmbedding.chunk_text,
+                ContentEmbedding.metadata_,
+                ContentEmbedding.embedding,
+            ).where(ContentEmbedding.embedding.is_not(None))
+            result = await session.execute(stmt)
+            rows = result.all()
+
+        index = await asyncio.to_thread(
+            LocalIndex.build,
+            generation,
+            [row.id for row in rows],
+            [row.chunk_text for row in rows],
+            [row.metadata_ or {} for row in rows],
+            [row.embedding for row in rows],
+            settings.embedding_dimension,
+        )
+        index = replace(index, load_ms=(time.perf_counter() - started) * 1000)
+
+        logger.info(
+            f"Loaded local vector index: {index.size} rows, generation {generation}, "
+            f"{index.matrix.nbytes / 1_048_576:.1f} MiB in {index.load_ms:.0f}ms"
+        )
+        return index
+
+    def get_index_stats(self) -> Dict[str, Any]:
+        """
+        Get local index statistics.
+
+        Returns:
+            Dictionary with rows, dimension, generation, matrix_bytes, load_ms, source and reloads
+        """
+        index = self._index
+        if index is None:
+            return {"rows": 0, "generation": None, "reloads": self.reloads}
+        return {
+            "rows": index.size,
+            "dimension": int(index.matrix.shape[1]),
+            "generation": index.generation,
+            "matrix_bytes": int(index.matrix.nbytes),
+            "load_ms": index.load_ms,
+            "source": index.source,
+            "reloads": self.reloads,
+        }
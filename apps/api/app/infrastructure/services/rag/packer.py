@@ -0,0 +1,282 @@
+"""
+Token-budgeted context packing.
+
+Retrieval returns up to ``top_k`` chunks, and neighbouring chunks of one
+document share their section header and an overlap tail (see
+``combine_paragraphs_into_chunks``). Packing removes that redundancy before
+the context reaches a prompt:
+
+1. Drop chunks contained in, or mostly overlapping, a higher-ranked
+   non-adjacent chunk from the same ``content_path``.
+2. Merge chunks with consecutive ``chunk_index`` values from one document
+   into a single passage, emitting the shared paragraphs once.
+3. Fill the token budget by Maximal Marginal Relevance (MMR), so that
+   passages that repeat already selected content lose to new material.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .chunker import count_tokens
+from .types import RetrievalResult
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@dataclass
+class PackingStats:
+    """Token accounting for one packed context."""
+
+    input_chunks: int = 0
+    output_chunks: int = 0
+    duplicates_dropped: int = 0
+    chunks_merged: int = 0
+    over_budget_dropped: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    token_budget: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.input_tokens - self.output_tokens)
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "input_chunks": self.input_chunks,
+            "output_chunks": self.output_chunks,
+            "duplicates_dropped": self.duplicates_dropped,
+            "chunks_merged": self.chunks_merged,
+            "over_budget_dropped": self.over_budget_dropped,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "tokens_saved": self.tokens_saved,
+            "token_budget": self.token_budget,
+        }
+
+
+@dataclass
+class _Passage:
+    """A kept chunk, or a run of adjacent chunks merged into one."""
+
+    result: RetrievalResult
+    rank: int  # best retrieval rank among the merged chunks
+    chunk_indices: List[int] = field(default_factory=list)
+    words: Set[str] = field(default_factory=set)
+    tokens: int = 0
+
+
+def _words(text: str) -> Set[str]:
+    return set(_WORD_RE.findall(text.lower()))
+
+
+def _overlap(words: Set[str], other: Set[str]) -> float:
+    """Fraction of ``words`` also present in ``other``."""
+    if not words:
+        return 1.0
+    return len(words & other) / len(words)
+
+
+def _jaccard(words: Set[str], other: Set[str]) -> float:
+    union = words | other
+    return len(words & other) / len(union) if union else 0.0
+
+
+def _chunk_index(result: RetrievalResult) -> Optional[int]:
+    index = result.metadata.get("chunk_index")
+    return index if isinstance(index, int) else None
+
+
+def _adjacent(result: RetrievalResult, other: RetrievalResult) -> bool:
+    index, other_index = _chunk_index(result), _chunk_index(other)
+    return index is not None and other_index is not None and abs(index - other_index) == 1
+
+
+def merge_chunk_texts(first: str, second: str) -> str:
+    """
+    Join two consecutive chunks, emitting shared paragraphs once.
+
+    Chunks of one section both start with the section header, and the second
+    starts with the overlap tail of the first; both are dropped from ``second``.
+    """
+    first_paragraphs = first.split("\n\n")
+    second_paragraphs = second.split("\n\n")
+    if len(second_paragraphs) > 1 and second_paragraphs[0] == first_paragraphs[0]:
+        second_paragraphs = second_paragraphs[1:]
+
+    for size in range(min(len(first_paragraphs), len(second_paragraphs)), 0, -1):
+        if first_paragraphs[-size:] == second_paragraphs[:size]:
+            second_paragraphs = second_paragraphs[size:]
+            break
+
+    return "\n\n".join(first_paragraphs + second_paragraphs)
+
+
+class ContextPacker:
+    """Dedupes, merges and budget-fills retrieval results for prompt context."""
+
+    def __init__(
+        self,
+        token_budget: int,
+        *,
+        overlap_threshold: float = 0.8,
+        mmr_lambda: float = 0.7,
+    ):
+        """
+        Initialize context packer.
+
+        Args:
+            token_budget: Maximum tokens of packed context
+            overlap_threshold: Drop a chunk when this fraction of its words
+                appears in a higher-ranked chunk of the same document
+            mmr_lambda: Relevance weight in MMR (1.0 = pure relevance order)
+        """
+        self.token_budget = token_budget
+        self.overlap_threshold = overlap_threshold
+        self.mmr_lambda = mmr_lambda
+
+    def pack(
+        self, results: List[RetrievalResult]
+    ) -> Tuple[List[RetrievalResult], PackingStats]:
+        """
+        Pack ranked results into at most ``token_budget`` tokens.
+
+        The top passage is always kept, even when it alone exceeds the budget,
+        so a non-empty retrieval never packs to NO_DATA.
+
+        Args:
+            results: Retrieval results, best first
+
+        Returns:
+            (packed results in selection order, packing stats)
+        """
+        stats = PackingStats(
+            input_chunks=len(results),
+            input_tokens=sum(count_tokens(result.text) for result in results),
+            token_budget=self.token_budget,
+        )
+        if not results:
+            return [], stats
+
+        kept = self._drop_duplicates(results, stats)
+        passages = self._merge_adjacent(kept, stats)
+        selected = self._select_mmr(passages, stats)
+
+        packed = [passage.result for passage in selected]
+        stats.output_chunks = len(packed)
+        stats.output_tokens = sum(passage.tokens for passage in selected)
+        return packed, stats
+
+    def _drop_duplicates(
+        self, results: List[RetrievalResult], stats: PackingStats
+    ) -> List[Tuple[int, RetrievalResult, Set[str]]]:
+        kept: List[Tuple[int, RetrievalResult, Set[str]]] = []
+        for rank, result in enumerate(results):
+            words = _words(result.text)
+            path = result.source_citation
+            duplicate = path is not None and any(
+                other.source_citation == path
+                and (
+                    result.text in other.text
+                    # Neighbours share only the overlap tail; merging removes it exactly
+                    or (
+                        not _adjacent(result, other)
+                        and _overlap(words, other_words) >= self.overlap_threshold
+                    )
+                )
+                for _, other, other_words in kept
+            )
+            if duplicate:
+                stats.duplicates_dropped += 1
+            else:
+                kept.append((rank, result, words))
+        return kept
+
+    def _merge_adjacent(
+        self, kept: List[Tuple[int, RetrievalResult, Set[str]]], stats: PackingStats
+    ) -> List[_Passage]:
+        passages: List[_Passage] = []
+        by_document: Dict[str, List[Tuple[int, int, RetrievalResult]]] = {}
+        for rank, result, words in kept:
+            index = _chunk_index(result)
+            if result.source_citation is None or index is None:
+                passages.append(
+                    _Passage(result, rank, words=words, tokens=count_tokens(result.text))
+                )
+            else:
+                by_document.setdefault(result.source_citation, []).append((index, rank, result))
+
+        for chunks in by_document.values():
+            chunks.sort(key=lambda chunk: chunk[0])
+            run: List[Tuple[int, int, RetrievalResult]] = []
+            for chunk in chunks:
+                if run and chunk[0] != run[-1][0] + 1:
+                    passages.append(self._merge_run(run, stats))
+                    run = []
+                run.append(chunk)
+            passages.append(self._merge_run(run, stats))
+
+        passages.sort(key=lambda passage: passage.rank)
+        return passages
+
+    @staticmethod
+    def _merge_run(
+        run: List[Tuple[int, int, RetrievalResult]], stats: PackingStats
+    ) -> _Passage:
+        _, best_rank, best = min(run, key=lambda chunk: chunk[1])
+        if len(run) == 1:
+            return _Passage(
+                best,
+                best_rank,
+                chunk_indices=[run[0][0]],
+                words=_words(best.text),
+                tokens=count_tokens(best.text),
+            )
+
+        text = run[0][2].text
+        for _, _, result in run[1:]:
+            text = merge_chunk_texts(text, result.text)
+        stats.chunks_merged += len(run) - 1
+
+        chunk_indices = [index for index, _, _ in run]
+        metadata: Dict[str, Any] = {
+            **run[0][2].metadata,
+            "merged_chunk_indices": chunk_indices,
+        }
+        merged = replace(best, text=text, metadata=metadata)
+        return _Passage(
+            merged,
+            best_rank,
+            chunk_indices=chunk_indices,
+            words=_words(text),
+            tokens=count_tokens(text),
+        )
+
+    def _select_mmr(self, passages: List[_Passage], stats: PackingStats) -> List[_Passage]:
+        # Similarities are cosine or RRF scores; rescale so MMR weighs them against Jaccard
+        top_score = max(passage.result.similarity for passage in passages) or 1.0
+        remaining = list(passages)
+        selected: List[_Passage] = []
+        used_tokens = 0
+
+        while remaining:
+            def _mmr(passage: _Passage) -> float:
+                redundancy = max(
+                    (_jaccard(passage.words, chosen.words) for chosen in selected),
+                    default=0.0,
+                )
+                relevance = passage.result.similarity / top_score
+                return self.mmr_lambda * relevance - (1 - self.mmr_lambda) * redundancy
+
+            best = max(remaining, key=lambda passage: (_mmr(passage), -passage.rank))
+            remaining.remove(best)
+            if selected and used_tokens + best.tokens > self.token_budget:
+                stats.over_budget_dropped += len(best.chunk_indices) or 1
+                continue
+            selected.append(best)
+            used_tokens += best.tokens
+
+        return selected
@@ -5,28 +5,60 @@ Coordinates query embedding, retrieval, and context formatting.
 """
 
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from app.core.config import settings
 
+from .cache import RetrievalCache
+from .packer import ContextPacker
 from .retriever import VectorRetriever
-from .types import RAGContext, RetrievalOptions, RetrievalResult
+from .types import RAGContext, RecallProfile, RetrievalOptions, RetrievalResult
 
 logger = logging.getLogger(__name__)
 
 
+def create_retriever() -> VectorRetriever:
+    """Create the retriever selected by settings.rag_retriever_backend."""
+    if settings.rag_retriever_backend == "local":
+        from .local_retriever import LocalVectorRetriever
+
+        return LocalVectorRetriever()
+    return VectorRetriever()
+
+
 class RAGPipeline:
     """Orchestrates the RAG pipeline: query → embed → retrieve → format."""
 
-    def __init__(self, retriever: Optional[VectorRetriever] = None):
+    def __init__(
+        self,
+        retriever: Optional[VectorRetriever] = None,
+        cache: Optional[RetrievalCache] = None,
+        packer: Optional[ContextPacker] = None,
+    ):
         """
         Initialize RAG pipeline.
 
         Args:
-            retriever: Vector retriever instance (if None, creates default)
+            retriever: Vector retriever instance (if None, creates the configured backend)
+            cache: Retrieval result cache (if None, creates default when enabled)
+            packer: Context packer (if None, creates default when enabled)
         """
-        self.retriever = retriever or VectorRetriever()
+        self.retriever = retriever or create_retriever()
         self.enabled = settings.enable_rag
+        if cache is None and settings.rag_result_cache_enabled:
+            cache = RetrievalCache()
+        self.cache = cache
+        if packer is None and settings.rag_context_packing_enabled:
+            packer = ContextPacker(
+                settings.rag_context_token_budget,
+                overlap_threshold=settings.rag_context_dedup_overlap,
+                mmr_lambda=settings.rag_context_mmr_lambda,
+            )
+        self.packer = packer
+
+    async def warm_up(self) -> None:
+        """Prepare the retriever backend (loads the local index when configured)."""
+        await self.retriever.warm_up()
 
     async def retrieve_context(
         self,
@@ -34,6 +66,7 @@ class RAGPipeline:
         top_k: Optional[int] = None,
         min_similarity: Optional[float] = None,
         filters: Optional[dict] = None,
+        recall_profile: Optional[RecallProfile] = None,
     ) -> RAGContext:
         """
         Retrieve relevant context for a query.
@@ -43,6 +76,7 @@ class RAGPipeline:
             top_k: Number of chunks to retrieve (default: from settings)
             min_similarity: Minimum similarity threshold (default: from settings)
             filters: Optional filters (doc_type, destination, tags)
+            recall_profile: fast | balanced | exact (default: from settings)
 
         Returns:
             RAGContext with results and formatted context
@@ -52,35 +86,124 @@ class RAGPipeline:
         """
         if not self.enabled:
             logger.warning("RAG is disabled, returning empty context")
-            return RAGContext(
-                query=query,
-                results=[],
-                formatted_context="NO_DATA",
-                citations=[],
-                has_data=False,
-            )
+            return self._empty_context(query)
 
         if not query or not query.strip():
             raise ValueError("Query cannot be empty")
 
-        # Build retrieval options
-        options = RetrievalOptions(
+        options = self._build_options(top_k, min_similarity, filters, recall_profile)
+        results = await self._retrieve_cached(query, options)
+        return self._build_context(query, results)
+
+    async def retrieve_context_many(
+        self,
+        queries: List[str],
+        top_k: Optional[int] = None,
+        min_similarity: Optional[float] = None,
+        filters: Optional[dict] = None,
+        recall_profile: Optional[RecallProfile] = None,
+    ) -> List[RAGContext]:
+        """
+        Retrieve context for several queries in one batch.
+
+        Cached queries are served from the result cache; the remaining distinct
+        queries share one embedding batch and, for semantic search, one SQL
+        statement (hybrid search fuses each query separately).
+
+        Args:
+            queries: User queries
+            top_k: Number of chunks to retrieve per query (default: from settings)
+            min_similarity: Minimum similarity threshold (default: from settings)
+            filters: Optional filters applied to every query (doc_type, destination, tags)
+            recall_profile: fast | balanced | exact (default: from settings)
+
+        Returns:
+            One RAGContext per query, in input order
+
+        Raises:
+            ValueError: If RAG is enabled and any query is empty
+        """
+        if not self.enabled:
+            logger.warning("RAG is disabled, returning empty contexts")
+            return [self._empty_context(query) for query in queries]
+
+        if any(not query or not query.strip() for query in queries):
+            raise ValueError("Query cannot be empty")
+        if not queries:
+            return []
+
+        options = self._build_options(top_k, min_similarity, filters, recall_profile)
+
+        results_by_query: Dict[str, List[RetrievalResult]] = {}
+        cache_keys: Dict[str, str] = {}
+        for query in dict.fromkeys(queries):
+            cache_key = await self._cache_key(query, options)
+            if cache_key is None:
+                continue
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                results_by_query[query] = cached
+            else:
+                cache_keys[query] = cache_key
+
+        pending = [query for query in dict.fromkeys(queries) if query not in results_by_query]
+        if pending:
+            if settings.rag_use_hybrid:
+                fetched = await self.retriever.retrieve_hybrid_many(
+                    pending,
+                    options,
+                    keyword_weight=settings.rag_keyword_weight,
+                    rrf_k=settings.rag_rrf_k,
+                )
+            else:
+                fetched = await self.retriever.retrieve_many(pending, options)
+            for query, results in zip(pending, fetched, strict=True):
+                results_by_query[query] = results
+                if query in cache_keys:
+                    self.cache.set(cache_keys[query], results)
+
+        logger.info(
+            f"RAG pipeline: batched {len(queries)} queries "
+            f"({len(pending)} retrieved, {len(queries) - len(pending)} cached or duplicate)"
+        )
+        return [self._build_context(query, results_by_query[query]) for query in queries]
+
+    @staticmethod
+    def _empty_context(query: str) -> RAGContext:
+        return RAGContext(
+            query=query,
+            results=[],
+            formatted_context="NO_DATA",
+            citations=[],
+            has_data=False,
+        )
+
+    @staticmethod
+    def _build_options(
+        top_k: Optional[int],
+        min_similarity: Optional[float],
+        filters: Optional[dict],
+        recall_profile: Optional[RecallProfile],
+    ) -> RetrievalOptions:
+        """Build retrieval options, falling back to settings for unset values."""
+        return RetrievalOptions(
             top_k=top_k or settings.rag_top_k,
             min_similarity=min_similarity or settings.rag_min_similarity,
             filters=filters or {},
+            recall_profile=recall_profile or settings.rag_recall_profile,
         )
 
-        # Retrieve chunks using hybrid or semantic search
-        if settings.rag_use_hybrid:
-            logger.info(f"Using hybrid search (keyword_weight={settings.rag_keyword_weight})")
-            results = await self.retriever.retrieve_hybrid(
-                query,
-                options,
-                keyword_weight=settings.rag_keyword_weight
+    def _build_context(self, query: str, results: List[RetrievalResult]) -> RAGContext:
+        """Pack results, then format them and their citations into a RAGContext."""
+        packing = None
+        if self.packer is not None and results:
+            results, stats = self.packer.pack(results)
+            packing = stats.to_dict()
+            logger.info(
+                f"Context packing: {stats.input_chunks} -> {stats.output_chunks} chunks, "
+                f"{stats.input_tokens} -> {stats.output_tokens} tokens "
+                f"(budget {stats.token_budget})"
             )
-        else:
-            logger.info("Using semantic-only search")
-            results = await self.retriever.retrieve(query, options)
 
         # Format context
         formatted_context = self._format_context(results)
@@ -114,8 +237,70 @@ class RAGPipeline:
             formatted_context=formatted_context,
             citations=citations,
             has_data=has_data,
+            packing=packing,
+        )
+
+    async def _cache_key(self, query: str, options: RetrievalOptions) -> Optional[str]:
+        """Result cache key for the current content generation, or None when not caching."""
+        if self.cache is None or await self.cache.refresh_generation() is None:
+            return None
+        return RetrievalCache.make_key(
+            query,
+            options,
+            hybrid=settings.rag_use_hybrid,
+            keyword_weight=settings.rag_keyword_weight,
+            rrf_k=settings.rag_rrf_k,
         )
 
+    async def _retrieve_cached(
+        self, query: str, options: RetrievalOptions
+    ) -> List[RetrievalResult]:
+        """Serve from the result cache for the current content generation, else retrieve."""
+        cache_key = await self._cache_key(query, options)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Retrieval cache hit for query: {query[:80]}...")
+                return cached
+
+        # Retrieve chunks using hybrid or semantic search
+        if settings.rag_use_hybrid:
+            logger.info(f"Using hybrid search (keyword_weight={settings.rag_keyword_weight})")
+            results = await self.retriever.retrieve_hybrid(
+                query,
+                options,
+                keyword_weight=settings.rag_keyword_weight,
+                rrf_k=settings.rag_rrf_k,
+            )
+        else:
+            logger.info("Using semantic-only search")
+            results = await self.retriever.retrieve(query, options)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, results)
+        return results
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get retrieval result cache statistics.
+
+        Returns:
+            Cache stats (hits, misses, evictions, ...) or None when caching is disabled
+        """
+        return self.cache.get_stats() if self.cache is not None else None
+
+    async def embed_query(self, query: str) -> List[float]:
+        """
+        Embed a query with the retriever's provider (served from its cache when warm).
+
+        Args:
+            query: Query text
+
+        Returns:
+            Query embedding vector
+        """
+        return await self.retriever.embedding_provider.embed_text(query)
+
     def _format_context(self, results: List[RetrievalResult]) -> str:
         """
         Format retrieval results into context string.
@@ -157,21 +342,33 @@ class RAGPipeline:
         top_k: Optional[int] = None,
         min_similarity: Optional[float] = None,
         filters: Optional[dict] = None,
+        recall_profile: Optional[RecallProfile] = None,
     ) -> List[RetrievalResult]:
         """
-        Retrieve raw results without formatting.
+        Retrieve raw top-k results without packing or formatting.
+
+        Results come straight from the retriever (or the result cache): no
+        context packing, dedup or merging is applied.
 
         Args:
             query: User query
             top_k: Number of chunks to retrieve (default: from settings)
             min_similarity: Minimum similarity threshold (default: from settings)
             filters: Optional filters (doc_type, destination, tags)
+            recall_profile: fast | balanced | exact (default: from settings)
 
         Returns:
-            List of RetrievalResult objects
+            List of RetrievalResult objects (empty when RAG is disabled)
 
         Raises:
-            ValueError: If RAG is disabled or query is invalid
+            ValueError: If query is invalid
         """
-        context = await self.retrieve_context(query, top_k, min_similarity, filters)
-        return context.results
+        if not self.enabled:
+            logger.warning("RAG is disabled, returning no results")
+            return []
+
+        if not query or not query.strip():
+            raise ValueError("Query cannot be empty")
+
+        options = self._build_options(top_k, min_similarity, filters, recall_profile)
+        return await self._retrieve_cached(query, options)
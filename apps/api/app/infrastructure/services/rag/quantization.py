@@ -0,0 +1,39 @@
+"""
+Compact embedding representations for shortlist search.
+
+The compact columns (``halfvec``, binary ``bit`` and the Matryoshka prefix)
+only shortlist candidates; final ranking always uses exact cosine on the full
+vector.
+"""
+
+import math
+from typing import List, Sequence
+
+# Dimension of the Matryoshka prefix column (one of the Gemini truncation sizes)
+MATRYOSHKA_DIMENSIONS = 256
+
+
+def binary_quantize(embedding: Sequence[float]) -> str:
+    """
+    Binary-quantize an embedding (1 where the component is positive).
+
+    Matches pgvector's ``binary_quantize()`` and returns the ``bit(n)`` literal
+    string, e.g. ``"0110..."``.
+    """
+    return "".join("1" if value > 0 else "0" for value in embedding)
+
+
+def matryoshka_prefix(
+    embedding: Sequence[float], dimensions: int = MATRYOSHKA_DIMENSIONS
+) -> List[float]:
+    """
+    Truncate a Matryoshka embedding to its leading dimensions and L2-normalize.
+
+    Equivalent to pgvector's ``l2_normalize(subvector(embedding, 1, n))``, so
+    the query prefix is derived locally without a second embedding call.
+    """
+    prefix = [float(value) for value in embedding[:dimensions]]
+    norm = math.sqrt(sum(value * value for value in prefix))
+    if norm == 0.0:
+        return prefix
+    return [value / norm for value in prefix]
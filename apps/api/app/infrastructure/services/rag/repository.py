@@ -2,10 +2,12 @@
 
 from typing import Any, Dict, List
 
-from sqlalchemy import delete, func, select, text
+from sqlalchemy import delete, func, select, text, update
 from sqlalchemy.orm import Session
 
-from app.infrastructure.db.models import ContentEmbedding
+from app.infrastructure.db.models import ContentEmbedding, ContentGeneration
+
+from .quantization import binary_quantize, matryoshka_prefix
 
 
 class RAGRepository:
@@ -26,14 +28,22 @@ class RAGRepository:
             chunks: List of chunk dictionaries with text, embedding, and metadata
         """
         for chunk in chunks:
+            embedding = chunk["embedding"]
+            has_embedding = embedding is not None
             embedding_obj = ContentEmbedding(
                 content_path=chunk.get("metadata", {}).get("content_path", ""),
                 chunk_text=chunk["text"],
-                embedding=chunk["embedding"],
+                embedding=embedding,
+                # Compact representations for shortlist search (see quantization.py)
+                embedding_half=embedding if has_embedding else None,
+                embedding_bit=binary_quantize(embedding) if has_embedding else None,
+                embedding_256=matryoshka_prefix(embedding) if has_embedding else None,
                 metadata_=chunk.get("metadata", {}),
             )
             self.db.add(embedding_obj)
 
+        if chunks:
+            self._bump_content_generation()
         self.db.commit()
 
     def delete_by_content_path(self, content_path: str) -> int:
@@ -49,6 +59,8 @@ class RAGRepository:
             ContentEmbedding.metadata_["content_path"].astext == content_path
         )
         result = self.db.execute(stmt)
+        if result.rowcount:
+            self._bump_content_generation()
         self.db.commit()
         return result.rowcount
 
@@ -65,6 +77,8 @@ class RAGRepository:
             ContentEmbedding.metadata_["content_path"].astext.like(pattern)
         )
         result = self.db.execute(stmt)
+        if result.rowcount:
+            self._bump_content_generation()
         self.db.commit()
         return result.rowcount
 
@@ -76,9 +90,32 @@ class RAGRepository:
         """
         stmt = delete(ContentEmbedding)
         result = self.db.execute(stmt)
+        if result.rowcount:
+            self._bump_content_generation()
         self.db.commit()
         return result.rowcount
 
+    def _bump_content_generation(self) -> None:
+        """Advance the content generation in the current transaction.
+
+        API processes compare this counter to invalidate cached retrieval results.
+        """
+        self.db.execute(
+            update(ContentGeneration)
+            .where(ContentGeneration.id == 1)
+            .values(generation=ContentGeneration.generation + 1)
+        )
+
+    def get_content_generation(self) -> int:
+        """Get the current content generation.
+
+        Returns:
+            Generation counter (0 if never bumped)
+        """
+        stmt = select(ContentGeneration.generation).where(ContentGeneration.id == 1)
+        result = self.db.execute(stmt)
+        return result.scalar() or 0
+
     def count_all(self) -> int:
         """Count total number of embeddings.
 
@@ -110,7 +147,9 @@ class RAGRepository:
         Returns:
             List of embedding dictionaries
         """
-        stmt = select(ContentEmbedding)
+        stmt = select(ContentEmbedding).order_by(
+            ContentEmbedding.content_path, ContentEmbedding.created_at, ContentEmbedding.id
+        )
         result = self.db.execute(stmt)
         embeddings = result.scalars().all()
 
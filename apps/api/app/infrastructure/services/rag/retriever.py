@@ -4,36 +4,84 @@ Vector retrieval service for RAG.
 Performs vector similarity search using pgvector.
 """
 
+import asyncio
 import logging
-from typing import List, Optional
-
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import bindparam, func, select, text
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from pgvector.sqlalchemy import BIT, HALFVEC, Vector
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Integer,
+    Select,
+    bindparam,
+    cast,
+    column,
+    func,
+    select,
+    true,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.types import TypeEngine
 
 from app.core.config import settings
 from app.infrastructure.db.models.content_embedding import ContentEmbedding
 from app.infrastructure.db.session import get_session
 from app.infrastructure.services.embeddings import create_embedding_provider_from_env
 
-from .types import RetrievalOptions, RetrievalResult
+from .quantization import MATRYOSHKA_DIMENSIONS, binary_quantize, matryoshka_prefix
+from .types import RecallProfile, RetrievalOptions, RetrievalResult
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class HnswSearchParams:
+    """Per-transaction pgvector settings for one recall profile."""
+
+    ef_search: Optional[int] = None
+    iterative_scan: Optional[str] = None  # "strict_order" | "relaxed_order" (pgvector >= 0.8)
+    max_scan_tuples: Optional[int] = None
+    exact: bool = False  # disable index scans: brute-force distance over filtered rows
+
+
+RECALL_PROFILES: Dict[str, HnswSearchParams] = {
+    "fast": HnswSearchParams(ef_search=40),
+    "balanced": HnswSearchParams(
+        ef_search=100, iterative_scan="strict_order", max_scan_tuples=20000
+    ),
+    "exact": HnswSearchParams(exact=True),
+}
+
+# Bind parameter name of the compact query representation per shortlist mode
+COMPACT_QUERY_PARAMS: Dict[str, str] = {
+    "halfvec": "query_half",
+    "binary": "query_bits",
+    "matryoshka": "query_prefix",
+}
+
+
 class VectorRetriever:
     """Retrieves relevant content chunks using vector similarity search."""
 
-    def __init__(self, embedding_provider=None):
+    def __init__(self, embedding_provider=None, vector_search_mode: Optional[str] = None):
         """
         Initialize vector retriever.
 
         Args:
             embedding_provider: Embedding provider instance (if None, creates from env)
+            vector_search_mode: full | halfvec | binary | matryoshka (default: settings.rag_vector_search_mode)
         """
         self.embedding_provider = (
             embedding_provider or create_embedding_provider_from_env()
         )
-        self._result_cache = {}  # Cache for RRF merging
+        self.vector_search_mode = vector_search_mode or settings.rag_vector_search_mode
+
+    async def warm_up(self) -> None:
+        """Prepare backend state before serving (no-op for pgvector)."""
 
     async def retrieve(
         self,
@@ -60,67 +108,29 @@ class VectorRetriever:
         if options is None:
             options = RetrievalOptions()
 
-        # Generate embedding for query
-        logger.info(f"Generating embedding for query: {query[:100]}...")
-        query_embedding = await self.embedding_provider.embed_text(query)
-
-        expected_dimension = settings.embedding_dimension
-        if len(query_embedding) != expected_dimension:
-            raise ValueError(
-                f"Expected embedding dimension {expected_dimension}, got {len(query_embedding)}"
-            )
+        query_embedding = await self._embed_query(query)
 
         # Build query
         session_maker = get_session()
         async with session_maker() as session:
-            # Base query with cosine similarity
-            # Using pgvector <=> operator: cosine distance = 1 - cosine similarity
-            query_vector = bindparam(
-                "query_embedding",
-                value=query_embedding,
-                type_=Vector(expected_dimension),
-            )
-            similarity_expr = (
-                1 - ContentEmbedding.embedding.cosine_distance(query_vector)
-            )
+            await self._apply_recall_profile(session, options)
 
-            stmt = select(
-                ContentEmbedding.id,
-                ContentEmbedding.content_path,
-                ContentEmbedding.chunk_text,
-                ContentEmbedding.metadata_,
-                similarity_expr.label("similarity"),
+            # Using pgvector <=> operator: cosine distance = 1 - cosine similarity.
+            # Ordering by the bare distance lets the HNSW index serve the scan, and
+            # the similarity threshold is applied before LIMIT.
+            distance_expr = ContentEmbedding.embedding.cosine_distance(
+                self._query_vector(query_embedding)
             )
 
-            # Apply filters
-            if options.filters:
-                if "doc_type" in options.filters:
-                    doc_type = options.filters["doc_type"]
-                    if isinstance(doc_type, list):
-                        stmt = stmt.where(
-                            ContentEmbedding.metadata_["doc_type"].astext.in_(doc_type)
-                        )
-                    else:
-                        stmt = stmt.where(
-                            ContentEmbedding.metadata_["doc_type"].astext == doc_type
-                        )
-
-                if "destination" in options.filters:
-                    stmt = stmt.where(
-                        ContentEmbedding.metadata_["destination"].astext
-                        == options.filters["destination"]
-                    )
-
-                if "tags" in options.filters and options.filters["tags"]:
-                    # Check if any of the specified tags exist in metadata->tags array
-                    for tag in options.filters["tags"]:
-                        stmt = stmt.where(
-                            ContentEmbedding.metadata_["tags"]
-                            .astext.contains(f'"{tag}"')
-                        )
+            # Apply filters (and the compact-column shortlist, if enabled)
+            stmt = self._restrict_candidates(
+                self._select_semantic(distance_expr, options),
+                options,
+                self._compact_query(query_embedding, options),
+            )
 
-            # Order by similarity and limit
-            stmt = stmt.order_by(text("similarity DESC")).limit(options.top_k)
+            # Order by distance and limit
+            stmt = stmt.order_by(distance_expr).limit(options.top_k)
 
             # Execute query
             result = await session.execute(stmt)
@@ -131,7 +141,7 @@ class VectorRetriever:
             for row in rows:
                 similarity = float(row.similarity)
 
-                # Filter by minimum similarity
+                # Guard against float rounding at the SQL threshold
                 if similarity < options.min_similarity:
                     continue
 
@@ -155,185 +165,621 @@ class VectorRetriever:
 
             return results
 
+    async def retrieve_many(
+        self,
+        queries: List[str],
+        options: Optional[RetrievalOptions] = None,
+    ) -> List[List[RetrievalResult]]:
+        """
+        Retrieve chunks for several queries with one embedding batch and one statement.
+
+        All queries are embedded with a single ``embed_batch`` call, then every
+        vector search runs in one round trip as a ``LATERAL`` join over a
+        ``VALUES`` list of query vectors.
+
+        Args:
+            queries: Search queries
+            options: Retrieval options shared by all queries (default: RetrievalOptions())
+
+        Returns:
+            One result list per query, in input order (each sorted by similarity)
+
+        Raises:
+            ValueError: If the query list is empty or contains an empty query
+            Exception: If database or API error occurs
+        """
+        self._validate_queries(queries)
+        if options is None:
+            options = RetrievalOptions()
+
+        query_embeddings = await self._embed_queries(queries)
+        results = await self._search_many(query_embeddings, options)
+        logger.info(
+            f"Batched retrieval: {sum(len(r) for r in results)} chunks for {len(queries)} queries"
+        )
+        return results
+
+    async def retrieve_hybrid_many(
+        self,
+        queries: List[str],
+        options: Optional[RetrievalOptions] = None,
+        keyword_weight: float = 0.3,
+        rrf_k: Optional[int] = None,
+    ) -> List[List[RetrievalResult]]:
+        """
+        Hybrid search for several queries sharing one embedding batch.
+
+        The keyword legs run concurrently with the batched embedding call; each
+        query is then fused in Postgres exactly as in ``retrieve_hybrid``. Unlike
+        the single-query path there is no keyword-only fallback: a failed
+        embedding batch fails the whole call.
+
+        Args:
+            queries: Search queries
+            options: Retrieval options shared by all queries (default: RetrievalOptions())
+            keyword_weight: Weight for keyword results (0-1, default: 0.3)
+            rrf_k: RRF constant (default: settings.rag_rrf_k)
+
+        Returns:
+            One RRF-ranked result list per query, in input order
+
+        Raises:
+            ValueError: If the query list is empty or contains an empty query
+            Exception: If database or API error occurs
+        """
+        self._validate_queries(queries)
+        if options is None:
+            options = RetrievalOptions()
+        k = rrf_k if rrf_k is not None else settings.rag_rrf_k
+
+        keyword_lists, query_embeddings = await asyncio.gather(
+            asyncio.gather(*(self._keyword_search(query, options) for query in queries)),
+            self._embed_queries(queries),
+        )
+        return list(
+            await asyncio.gather(
+                *(
+                    self._fuse_hybrid(
+                        query_embedding,
+                        options,
+                        keyword_ids,
+                        keyword_weight=keyword_weight,
+                        k=k,
+                    )
+                    for query_embedding, keyword_ids in zip(
+                        query_embeddings, keyword_lists, strict=True
+                    )
+                )
+            )
+        )
+
+    async def _search_many(
+        self, query_embeddings: List[List[float]], options: RetrievalOptions
+    ) -> List[List[RetrievalResult]]:
+        """Run the batched vector search and split rows back out per query."""
+        stmt = self._build_many_statement(query_embeddings, options)
+
+        session_maker = get_session()
+        async with session_maker() as session:
+            await self._apply_recall_profile(session, options)
+            result = await session.execute(stmt)
+            rows = result.all()
+
+        results: List[List[RetrievalResult]] = [[] for _ in query_embeddings]
+        for row in rows:
+            similarity = float(row.similarity)
+            # Guard against float rounding at the SQL threshold
+            if similarity >= options.min_similarity:
+                results[row.ord].append(self._to_result(row, similarity))
+        return results
+
+    def _build_many_statement(
+        self, query_embeddings: List[List[float]], options: RetrievalOptions
+    ) -> Select:
+        """
+        Build one statement searching every query vector.
+
+        Query vectors travel as text in a ``VALUES`` list and are cast back to
+        their pgvector types, so each ``LATERAL`` search is the same plan as
+        the single-query statement (index scan, threshold, filters, shortlist).
+        """
+        dimension = settings.embedding_dimension
+        mode = self._shortlist_mode(options)
+
+        query_columns = [column("ord", Integer), column("query_embedding", Vector(dimension))]
+        rows: List[tuple] = [
+            (ord_, query_embedding) for ord_, query_embedding in enumerate(query_embeddings)
+        ]
+        if mode is not None:
+            query_columns.append(column("query_compact", self._compact_type(mode)))
+            rows = [
+                (ord_, query_embedding, self._compact_value(mode, query_embedding))
+                for ord_, query_embedding in rows
+            ]
+        queries = values(*query_columns, name="queries").data(rows)
+
+        distance_expr = ContentEmbedding.embedding.cosine_distance(
+            cast(queries.c.query_embedding, Vector(dimension))
+        )
+        compact_query = (
+            cast(queries.c.query_compact, self._compact_type(mode)) if mode is not None else None
+        )
+        matches = (
+            self._restrict_candidates(
+                self._select_semantic(distance_expr, options),
+                options,
+                compact_query,
+                lateral=True,
+            )
+            .order_by(distance_expr)
+            .limit(options.top_k)
+            .lateral("matches")
+        )
+        return (
+            select(queries.c.ord, matches)
+            .select_from(queries)
+            .join(matches, true())
+            .order_by(queries.c.ord, matches.c.similarity.desc())
+        )
+
+    @staticmethod
+    def _select_semantic(distance_expr: ColumnElement, options: RetrievalOptions) -> Select:
+        """Select chunk columns and similarity for rows within the similarity threshold."""
+        return select(
+            ContentEmbedding.id,
+            ContentEmbedding.content_path,
+            ContentEmbedding.chunk_text,
+            ContentEmbedding.metadata_,
+            (1 - distance_expr).label("similarity"),
+        ).where(distance_expr <= 1 - options.min_similarity)
+
     async def retrieve_hybrid(
         self,
         query: str,
         options: Optional[RetrievalOptions] = None,
         keyword_weight: float = 0.3,
+        rrf_k: Optional[int] = None,
     ) -> List[RetrievalResult]:
         """
         Hybrid search combining keyword + semantic search.
 
+        The full-text leg and the query embedding run concurrently, each under
+        its own timeout. Once the embedding arrives, one statement runs the
+        vector leg and fuses it with the keyword ranking via Reciprocal Rank
+        Fusion in Postgres, so only the final ``top_k`` rows carry chunk text.
+        If the embedding fails or times out, keyword-only results are returned;
+        if the keyword leg has nothing either, the embedding error is re-raised
+        rather than returning an empty list that reads as "no data".
+
         Args:
             query: Search query
             options: Retrieval options (default: RetrievalOptions())
             keyword_weight: Weight for keyword results (0-1, default: 0.3)
+            rrf_k: RRF constant (default: settings.rag_rrf_k)
 
         Returns:
-            Merged and re-ranked results using Reciprocal Rank Fusion
+            Results re-ranked by RRF score (descending)
+
+        Raises:
+            ValueError: If query is empty
+            Exception: If the embedding fails and the keyword leg fails, times out
+                or finds nothing (the embedding error is re-raised)
         """
+        if not query or not query.strip():
+            raise ValueError("Query cannot be empty")
+
         if options is None:
             options = RetrievalOptions()
+        k = rrf_k if rrf_k is not None else settings.rag_rrf_k
+
+        loop = asyncio.get_running_loop()
+        keyword_deadline = loop.time() + settings.rag_keyword_timeout_ms / 1000
+        keyword_task = asyncio.create_task(self._keyword_search(query, options))
+        embedding_task = asyncio.create_task(self._embed_query(query))
+        try:
+            embedding_error: Optional[BaseException] = None
+            try:
+                query_embedding: Optional[List[float]] = await asyncio.wait_for(
+                    embedding_task, timeout=settings.rag_embedding_timeout_ms / 1000
+                )
+            except asyncio.TimeoutError as exc:
+                logger.warning(
+                    "Hybrid search: query embedding timed out after %sms; using keyword-only results",
+                    settings.rag_embedding_timeout_ms,
+                )
+                query_embedding, embedding_error = None, exc
+            except Exception as exc:
+                logger.error(
+                    "Hybrid search: query embedding failed; using keyword-only results",
+                    exc_info=True,
+                )
+                query_embedding, embedding_error = None, exc
 
-        # Clear cache for new query
-        self._result_cache = {}
+            try:
+                keyword_ids = await asyncio.wait_for(
+                    keyword_task, timeout=max(0.0, keyword_deadline - loop.time())
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Hybrid search: keyword leg timed out after %sms; using semantic results only",
+                    settings.rag_keyword_timeout_ms,
+                )
+                keyword_ids = []
+            except Exception:
+                if embedding_error is not None:
+                    raise embedding_error from None
+                logger.error("Hybrid search: keyword leg failed", exc_info=True)
+                keyword_ids = []
+        finally:
+            for task in (keyword_task, embedding_task):
+                if not task.done():
+                    task.cancel()
+
+        if query_embedding is None:
+            if not keyword_ids:
+                raise embedding_error
+            return await self._fetch_keyword_results(
+                keyword_ids[: options.top_k], keyword_weight=keyword_weight, k=k
+            )
 
-        # 1. Semantic search (existing method)
-        logger.info(f"Hybrid search: Running semantic search for '{query[:50]}...'")
-        semantic_results = await self.retrieve(query, options)
+        results = await self._fuse_hybrid(
+            query_embedding,
+            options,
+            keyword_ids,
+            keyword_weight=keyword_weight,
+            k=k,
+        )
+        logger.info(
+            f"Hybrid search: Returning {len(results)} fused results "
+            f"({len(keyword_ids)} keyword candidates)"
+        )
+        return results
 
-        # 2. Keyword search (new)
-        logger.info(f"Hybrid search: Running keyword search for '{query[:50]}...'")
-        keyword_results = await self._keyword_search(query, options)
+    async def _fuse_hybrid(
+        self,
+        query_embedding: List[float],
+        options: RetrievalOptions,
+        keyword_ids: List[uuid.UUID],
+        *,
+        keyword_weight: float,
+        k: int,
+    ) -> List[RetrievalResult]:
+        """Run the vector leg and fuse it with the keyword ranking in Postgres."""
+        stmt = self._build_hybrid_statement(
+            query_embedding,
+            options,
+            keyword_ids,
+            keyword_weight=keyword_weight,
+            k=k,
+        )
 
-        # 3. Merge using Reciprocal Rank Fusion
-        logger.info(f"Hybrid search: Merging {len(semantic_results)} semantic + {len(keyword_results)} keyword results")
-        merged_results = self._merge_rrf(
-            semantic_results,
-            keyword_results,
-            keyword_weight
+        session_maker = get_session()
+        async with session_maker() as session:
+            await self._apply_recall_profile(session, options)
+            result = await session.execute(stmt)
+            rows = result.all()
+
+        return [self._to_result(row, float(row.score)) for row in rows]  # RRF score
+
+    def _build_hybrid_statement(
+        self,
+        query_embedding: List[float],
+        options: RetrievalOptions,
+        keyword_ids: List[uuid.UUID],
+        *,
+        keyword_weight: float,
+        k: int,
+    ) -> Select:
+        """
+        Build the fused hybrid statement.
+
+        RRF formula: score = Σ(weight / (k + rank)), where the semantic leg
+        keeps the ``top_k`` nearest chunks above ``min_similarity`` and the
+        keyword leg is the pre-computed ``ts_rank`` ordering of chunk ids.
+        """
+        distance_expr = ContentEmbedding.embedding.cosine_distance(
+            self._query_vector(query_embedding)
+        )
+        semantic = self._restrict_candidates(
+            select(
+                ContentEmbedding.id.label("id"),
+                func.row_number().over(order_by=distance_expr).label("rank"),
+            ).where(distance_expr <= 1 - options.min_similarity),
+            options,
+            self._compact_query(query_embedding, options),
+        )
+        semantic = semantic.order_by(distance_expr).limit(options.top_k).cte("semantic")
+
+        rrf_k = bindparam("rrf_k", value=k, type_=Float)
+        semantic_weight = bindparam("semantic_weight", value=1 - keyword_weight, type_=Float)
+        score_expr = func.coalesce(semantic_weight / (rrf_k + semantic.c.rank), 0.0)
+        id_expr = semantic.c.id
+        source = semantic
+
+        if keyword_ids:
+            keyword_ranks = values(
+                column("id", UUID(as_uuid=True)),
+                column("rank", Integer),
+                name="keyword_ranks",
+            ).data([(chunk_id, rank) for rank, chunk_id in enumerate(keyword_ids, 1)])
+            keyword = select(keyword_ranks.c.id, keyword_ranks.c.rank).cte("keyword")
+            keyword_weight_param = bindparam(
+                "keyword_weight", value=keyword_weight, type_=Float
+            )
+            score_expr = score_expr + func.coalesce(
+                keyword_weight_param / (rrf_k + keyword.c.rank), 0.0
+            )
+            id_expr = func.coalesce(semantic.c.id, keyword.c.id)
+            source = semantic.join(keyword, semantic.c.id == keyword.c.id, full=True)
+
+        fused = (
+            select(
+                id_expr.label("id"),
+                score_expr.label("score"),
+                semantic.c.rank.label("semantic_rank"),
+            )
+            .select_from(source)
+            .order_by(score_expr.desc(), semantic.c.rank.asc().nulls_last())
+            .limit(options.top_k)
+            .cte("fused")
         )
 
-        # Return top-k results
-        final_results = merged_results[:options.top_k]
-        logger.info(f"Hybrid search: Returning {len(final_results)} merged results")
+        return (
+            select(
+                ContentEmbedding.id,
+                ContentEmbedding.chunk_text,
+                ContentEmbedding.metadata_,
+                fused.c.score,
+            )
+            .join(fused, ContentEmbedding.id == fused.c.id)
+            .order_by(fused.c.score.desc(), fused.c.semantic_rank.asc().nulls_last())
+        )
 
-        return final_results
+    async def _fetch_keyword_results(
+        self,
+        keyword_ids: List[uuid.UUID],
+        *,
+        keyword_weight: float,
+        k: int,
+    ) -> List[RetrievalResult]:
+        """Load keyword-only results, scored as the keyword share of RRF."""
+        if not keyword_ids:
+            return []
+
+        session_maker = get_session()
+        async with session_maker() as session:
+            stmt = select(
+                ContentEmbedding.id,
+                ContentEmbedding.chunk_text,
+                ContentEmbedding.metadata_,
+            ).where(ContentEmbedding.id.in_(keyword_ids))
+            result = await session.execute(stmt)
+            rows_by_id = {row.id: row for row in result.all()}
+
+        results = [
+            self._to_result(rows_by_id[chunk_id], keyword_weight / (k + rank))
+            for rank, chunk_id in enumerate(keyword_ids, 1)
+            if chunk_id in rows_by_id
+        ]
+        logger.info(f"Hybrid search: Returning {len(results)} keyword-only results")
+        return results
 
     async def _keyword_search(
         self,
         query: str,
         options: RetrievalOptions,
-    ) -> List[RetrievalResult]:
+    ) -> List[uuid.UUID]:
         """
         Full-text search using PostgreSQL tsvector.
 
+        Only chunk ids are fetched; bodies are loaded for the fused top-k.
+
         Args:
             query: Search query
             options: Retrieval options
 
         Returns:
-            List of results ranked by FTS relevance
+            Up to ``2 * top_k`` chunk ids ranked by FTS relevance
         """
         if not query or not query.strip():
             return []
 
         session_maker = get_session()
         async with session_maker() as session:
+            tsquery = func.plainto_tsquery("english", query)
             # Use ts_rank for relevance scoring
-            stmt = select(
-                ContentEmbedding.id,
-                ContentEmbedding.content_path,
-                ContentEmbedding.chunk_text,
-                ContentEmbedding.metadata_,
-                func.ts_rank(
-                    ContentEmbedding.chunk_text_tsv,
-                    func.plainto_tsquery("english", query)
-                ).label("rank")
-            ).where(
-                ContentEmbedding.chunk_text_tsv.op("@@")(
-                    func.plainto_tsquery("english", query)
-                )
+            stmt = select(ContentEmbedding.id).where(
+                ContentEmbedding.chunk_text_tsv.op("@@")(tsquery)
             )
 
             # Apply metadata filters if present
-            if options.filters:
-                if "doc_type" in options.filters:
-                    doc_type = options.filters["doc_type"]
-                    if isinstance(doc_type, list):
-                        stmt = stmt.where(
-                            ContentEmbedding.metadata_["doc_type"].astext.in_(doc_type)
-                        )
-                    else:
-                        stmt = stmt.where(
-                            ContentEmbedding.metadata_["doc_type"].astext == doc_type
-                        )
-
-                if "destination" in options.filters:
-                    stmt = stmt.where(
-                        ContentEmbedding.metadata_["destination"].astext
-                        == options.filters["destination"]
-                    )
-
-                if "tags" in options.filters and options.filters["tags"]:
-                    for tag in options.filters["tags"]:
-                        stmt = stmt.where(
-                            ContentEmbedding.metadata_["tags"]
-                            .astext.contains(f'"{tag}"')
-                        )
+            stmt = self._apply_filters(stmt, options.filters)
 
-            stmt = stmt.order_by(text("rank DESC")).limit(options.top_k * 2)
+            stmt = stmt.order_by(
+                func.ts_rank(ContentEmbedding.chunk_text_tsv, tsquery).desc()
+            ).limit(options.top_k * 2)
 
             result = await session.execute(stmt)
-            rows = result.all()
+            chunk_ids = list(result.scalars().all())
+
+            logger.info(f"Keyword search found {len(chunk_ids)} results")
+            return chunk_ids
+
+    @staticmethod
+    def _to_result(row, score: float) -> RetrievalResult:
+        metadata = row.metadata_ or {}
+        return RetrievalResult(
+            chunk_id=str(row.id),
+            text=row.chunk_text,
+            similarity=score,
+            metadata=metadata,
+            source_citation=metadata.get("content_path"),
+        )
+
+    @staticmethod
+    def _validate_queries(queries: List[str]) -> None:
+        if not queries:
+            raise ValueError("Queries cannot be empty")
+        if any(not query or not query.strip() for query in queries):
+            raise ValueError("Query cannot be empty")
+
+    async def _embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embed several queries with one batched provider call and validate dimensions."""
+        logger.info(f"Generating embeddings for {len(queries)} queries in one batch")
+        query_embeddings = await self.embedding_provider.embed_batch(queries)
 
-            results = [
-                RetrievalResult(
-                    chunk_id=str(row.id),
-                    text=row.chunk_text,
-                    similarity=float(row.rank),  # Use FTS rank as similarity
-                    metadata=row.metadata_ or {},
-                    source_citation=(row.metadata_ or {}).get("content_path")
+        expected_dimension = settings.embedding_dimension
+        for query_embedding in query_embeddings:
+            if len(query_embedding) != expected_dimension:
+                raise ValueError(
+                    f"Expected embedding dimension {expected_dimension}, got {len(query_embedding)}"
                 )
-                for row in rows
-            ]
+        return query_embeddings
 
-            logger.info(f"Keyword search found {len(results)} results")
-            return results
+    async def _embed_query(self, query: str) -> List[float]:
+        """Embed the query and validate its dimension."""
+        logger.info(f"Generating embedding for query: {query[:100]}...")
+        query_embedding = await self.embedding_provider.embed_text(query)
+
+        expected_dimension = settings.embedding_dimension
+        if len(query_embedding) != expected_dimension:
+            raise ValueError(
+                f"Expected embedding dimension {expected_dimension}, got {len(query_embedding)}"
+            )
+        return query_embedding
+
+    def _shortlist_mode(self, options: RetrievalOptions) -> Optional[str]:
+        """Compact column to shortlist on, or None to search the full vector."""
+        profile: RecallProfile = options.recall_profile or settings.rag_recall_profile
+        if RECALL_PROFILES[profile].exact or self.vector_search_mode == "full":
+            return None
+        return self.vector_search_mode
+
+    def _compact_query(
+        self, query_embedding: List[float], options: RetrievalOptions
+    ) -> Optional[ColumnElement]:
+        """Bind the compact query representation, or None when not shortlisting."""
+        mode = self._shortlist_mode(options)
+        if mode is None:
+            return None
+        return bindparam(
+            COMPACT_QUERY_PARAMS[mode],
+            value=self._compact_value(mode, query_embedding),
+            type_=self._compact_type(mode),
+        )
 
-    def _merge_rrf(
+    @staticmethod
+    def _compact_value(mode: str, query_embedding: List[float]) -> Any:
+        """Derive the compact query representation locally (no extra embedding call)."""
+        if mode == "binary":
+            return binary_quantize(query_embedding)
+        if mode == "matryoshka":
+            return matryoshka_prefix(query_embedding)
+        return query_embedding
+
+    @staticmethod
+    def _compact_type(mode: str) -> TypeEngine:
+        if mode == "binary":
+            return BIT(settings.embedding_dimension)
+        if mode == "matryoshka":
+            return Vector(MATRYOSHKA_DIMENSIONS)
+        return HALFVEC(settings.embedding_dimension)
+
+    def _restrict_candidates(
         self,
-        semantic_results: List[RetrievalResult],
-        keyword_results: List[RetrievalResult],
-        keyword_weight: float = 0.3,
-        k: int = 60,
-    ) -> List[RetrievalResult]:
+        stmt: Select,
+        options: RetrievalOptions,
+        compact_query: Optional[ColumnElement],
+        *,
+        lateral: bool = False,
+    ) -> Select:
         """
-        Merge results using Reciprocal Rank Fusion.
-
-        RRF formula: score = Σ(weight / (k + rank))
-
-        Args:
-            semantic_results: Results from semantic search
-            keyword_results: Results from keyword search
-            keyword_weight: Weight for keyword results (0-1)
-            k: RRF constant (default: 60)
+        Apply metadata filters and, in halfvec/binary/matryoshka mode, the compact shortlist.
 
-        Returns:
-            Merged and re-ranked results
+        The shortlist takes the ``top_k * rag_shortlist_multiplier`` nearest rows
+        on the compact HNSW index; the caller's exact cosine ordering on the full
+        vector then re-ranks only those candidates. Inside a batched search the
+        shortlist is a ``LATERAL`` subquery correlated with the query row.
         """
-        scores = {}
-        semantic_weight = 1 - keyword_weight
-
-        # Score semantic results
-        for rank, result in enumerate(semantic_results, 1):
-            chunk_id = result.chunk_id
-            scores[chunk_id] = scores.get(chunk_id, 0) + semantic_weight / (k + rank)
-            if chunk_id not in self._result_cache:
-                self._result_cache[chunk_id] = result
-
-        # Score keyword results
-        for rank, result in enumerate(keyword_results, 1):
-            chunk_id = result.chunk_id
-            scores[chunk_id] = scores.get(chunk_id, 0) + keyword_weight / (k + rank)
-            if chunk_id not in self._result_cache:
-                self._result_cache[chunk_id] = result
-
-        # Sort by combined score
-        sorted_ids = sorted(scores.keys(), key=lambda x: scores[x], reverse=True)
-
-        # Return merged results with updated similarity scores
-        merged = []
-        for chunk_id in sorted_ids:
-            result = self._result_cache[chunk_id]
-            # Create new result with RRF score
-            merged_result = RetrievalResult(
-                chunk_id=result.chunk_id,
-                text=result.text,
-                similarity=scores[chunk_id],  # Use RRF score
-                metadata=result.metadata,
-                source_citation=result.source_citation
+        mode = self._shortlist_mode(options)
+        if mode is None or compact_query is None:
+            return self._apply_filters(stmt, options.filters)
+
+        if mode == "halfvec":
+            compact_distance = ContentEmbedding.embedding_half.cosine_distance(compact_query)
+        elif mode == "matryoshka":
+            compact_distance = ContentEmbedding.embedding_256.cosine_distance(compact_query)
+        else:
+            compact_distance = ContentEmbedding.embedding_bit.hamming_distance(compact_query)
+
+        shortlist = (
+            self._apply_filters(select(ContentEmbedding.id.label("id")), options.filters)
+            .order_by(compact_distance)
+            .limit(options.top_k * settings.rag_shortlist_multiplier)
+        )
+        shortlist = shortlist.lateral("shortlist") if lateral else shortlist.cte("shortlist")
+        return stmt.join(shortlist, ContentEmbedding.id == shortlist.c.id)
+
+    def _search_settings(self, options: RetrievalOptions) -> Dict[str, str]:
+        """Resolve the recall profile into pgvector/planner settings."""
+        profile: RecallProfile = options.recall_profile or settings.rag_recall_profile
+        params = RECALL_PROFILES[profile]
+        if params.exact:
+            return {"enable_indexscan": "off"}
+
+        search_settings = {}
+        if params.ef_search is not None:
+            # ef_search below the number of wanted rows cannot return them from the index
+            wanted = options.top_k
+            if self._shortlist_mode(options) is not None:
+                wanted *= settings.rag_shortlist_multiplier
+            search_settings["hnsw.ef_search"] = str(max(params.ef_search, wanted))
+        if params.iterative_scan and settings.rag_hnsw_iterative_scan:
+            search_settings["hnsw.iterative_scan"] = params.iterative_scan
+            if params.max_scan_tuples is not None:
+                search_settings["hnsw.max_scan_tuples"] = str(params.max_scan_tuples)
+        return search_settings
+
+    async def _apply_recall_profile(self, session, options: RetrievalOptions) -> None:
+        """Apply the recall profile for the current transaction (SET LOCAL semantics)."""
+        search_settings = self._search_settings(options)
+        if not search_settings:
+            return
+        await session.execute(
+            select(
+                *(
+                    func.set_config(name, value, True)
+                    for name, value in search_settings.items()
+                )
             )
-            merged.append(merged_result)
+        )
+
+    @staticmethod
+    def _query_vector(query_embedding: List[float]):
+        return bindparam(
+            "query_embedding",
+            value=query_embedding,
+            type_=Vector(settings.embedding_dimension),
+        )
+
+    @staticmethod
+    def _apply_filters(stmt: Select, filters: Optional[Dict]) -> Select:
+        """Apply metadata filters (doc_type, destination, tags) on the indexed filter columns."""
+        if not filters:
+            return stmt
+
+        if "doc_type" in filters:
+            doc_type = filters["doc_type"]
+            if isinstance(doc_type, list):
+                stmt = stmt.where(ContentEmbedding.doc_type.in_(doc_type))
+            else:
+                stmt = stmt.where(ContentEmbedding.doc_type == doc_type)
+
+        if "destination" in filters:
+            stmt = stmt.where(ContentEmbedding.destination == filters["destination"])
+
+        if "tags" in filters and filters["tags"]:
+            # Every requested tag must be present (tags @> ARRAY[...], GIN indexed)
+            stmt = stmt.where(ContentEmbedding.tags.contains(list(filters["tags"])))
 
-        return merged
+        return stmt
@@ -3,7 +3,11 @@ Type definitions for RAG services.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
+
+# Recall/latency trade-off for the vector leg: "fast" and "balanced" use the
+# HNSW index with increasing ef_search, "exact" bypasses it for a full scan.
+RecallProfile = Literal["fast", "balanced", "exact"]
 
 
 @dataclass
@@ -47,6 +51,7 @@ class RetrievalOptions:
     top_k: int = 5
     min_similarity: float = 0.0
     filters: Dict[str, Any] = field(default_factory=dict)
+    recall_profile: Optional[RecallProfile] = None  # None: settings.rag_recall_profile
 
 
 @dataclass
@@ -58,3 +63,4 @@ class RAGContext:
     formatted_context: str
     citations: List[str] = field(default_factory=list)  # Source citations for RAF
     has_data: bool = True  # False when NO_DATA signal returned
+    packing: Optional[Dict[str, int]] = None  # PackingStats.to_dict() when packing is enabled
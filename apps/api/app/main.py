@@ -1,3 +1,4 @@
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -12,12 +13,30 @@ from app.api.routes import lead as lead_routes
 from app.api.routes import session as session_routes
 from app.core.config import settings
 from app.core.rate_limit import limiter
+from app.domain.orchestration.components import get_orchestration_components
 from app.infrastructure.db.session import get_session, init_db
 
+logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     await init_db()
+    try:
+        # Build heavy orchestration components once; requests only bind a DB session.
+        components = get_orchestration_components()
+    except Exception:
+        logger.warning(
+            "Orchestration components unavailable at startup; will retry on first request",
+            exc_info=True,
+        )
+    else:
+        try:
+            await components.rag_pipeline.warm_up()
+        except Exception:
+            logger.warning(
+                "RAG retriever warm-up failed; it will load on first query", exc_info=True
+            )
     yield
 
 
@@ -0,0 +1,200 @@
+"""Embedding cache memory benchmark.
+
+Fills an embedding cache with N random vectors and reports the memory it
+holds, comparing:
+- list: vectors kept as Python lists of floats (the previous EmbeddingCache layout)
+- slab: the float32 slab-backed EmbeddingCache
+
+Each variant runs in a fresh worker process so RSS deltas do not mix.
+
+It also times cache hits: the slab copies a slot into a new list on every
+read, while a memoryview slice (zero-copy, but unsafe once the slot is
+recycled) is shown as the lower bound.
+"""
+
+import argparse
+import gc
+import json
+import random
+import resource
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict
+
+from app.infrastructure.services.embeddings.cache import EmbeddingCache
+from scripts.common import info, success
+
+VARIANTS = ("list", "slab")
+
+
+def _rss_bytes() -> int:
+    """Current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _fill(variant: str, entries: int, dimension: int) -> Any:
+    rng = random.Random(0)
+    if variant == "list":
+        cache: OrderedDict = OrderedDict()
+        for i in range(entries):
+            cache[f"text {i}"] = ([rng.random() for _ in range(dimension)], time.time())
+        return cache
+
+    cache = EmbeddingCache(max_size=entries, ttl_seconds=3600, dimension=dimension)
+    for i in range(entries):
+        cache.set(f"text {i}", [rng.random() for _ in range(dimension)])
+    return cache
+
+
+def measure_cache_memory(
+    variant: str, *, entries: int, dimension: int, trace: bool = False
+) -> Dict[str, Any]:
+    """Fill one cache variant and measure the memory it retains.
+
+    Args:
+        variant: "list" or "slab"
+        entries: Number of cached vectors
+        dimension: Vector dimension
+        trace: Also count Python allocations with tracemalloc (slower)
+
+    Returns:
+        RSS growth (and traced bytes when ``trace``) for the filled cache
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown variant {variant!r}, expected one of {VARIANTS}")
+
+    gc.collect()
+    if trace:
+        tracemalloc.start()
+    rss_before = _rss_bytes()
+    cache = _fill(variant, entries, dimension)
+    gc.collect()
+    rss_after = _rss_bytes()
+
+    result: Dict[str, Any] = {
+        "variant": variant,
+        "entries": entries,
+        "dimension": dimension,
+        "rss_bytes": rss_after - rss_before,
+    }
+    if trace:
+        result["traced_bytes"] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    del cache
+    return result
+
+
+def measure_cache_reads(*, entries: int, dimension: int, reads: int = 20_000) -> Dict[str, Any]:
+    """Time cache hits on the slab cache.
+
+    Args:
+        entries: Number of cached vectors
+        dimension: Vector dimension
+        reads: Number of timed hits
+
+    Returns:
+        Microseconds per hit for ``EmbeddingCache.get`` (hash, lookup and copy),
+        for the slot-to-list copy alone, and for a zero-copy memoryview slice
+    """
+    cache = _fill("slab", entries, dimension)
+    keys = [f"text {i % entries}" for i in range(reads)]
+
+    start_time = time.perf_counter()
+    for key in keys:
+        cache.get(key)
+    get_us = (time.perf_counter() - start_time) / reads * 1e6
+
+    slab = cache._slab
+    width = cache._width
+    slots = [cache.cache[cache._key(cache._hash_text(key))][0] for key in keys]
+    start_time = time.perf_counter()
+    for slot in slots:
+        slab[slot * width : (slot + 1) * width].tolist()
+    copy_us = (time.perf_counter() - start_time) / reads * 1e6
+
+    view = memoryview(slab)
+    start_time = time.perf_counter()
+    for slot in slots:
+        view[slot * width : (slot + 1) * width]
+    view_us = (time.perf_counter() - start_time) / reads * 1e6
+    view.release()
+
+    return {
+        "entries": entries,
+        "dimension": dimension,
+        "get_us": get_us,
+        "copy_us": copy_us,
+        "view_us": view_us,
+    }
+
+
+def main():
+    """Main entry point for the embedding cache memory benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark embedding cache memory: Python lists vs float32 slab",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # RSS at 10k cached 768-d vectors
+  python -m scripts.benchmark_cache_memory
+
+  # Smaller run with exact allocation counts
+  python -m scripts.benchmark_cache_memory --entries 1000 --trace
+        """,
+    )
+    parser.add_argument("--entries", type=int, default=10_000, help="Cached vectors (default: 10000)")
+    parser.add_argument("--dimension", type=int, default=768, help="Vector dimension (default: 768)")
+    parser.add_argument("--trace", action="store_true", help="Also report tracemalloc bytes")
+    parser.add_argument("--output", type=Path, default=None, help="Optional JSON output file")
+    args = parser.parse_args()
+
+    runs = []
+    for variant in VARIANTS:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            run = pool.submit(
+                measure_cache_memory,
+                variant,
+                entries=args.entries,
+                dimension=args.dimension,
+                trace=args.trace,
+            ).result()
+        runs.append(run)
+        line = (
+            f"{variant:>5}: {run['rss_bytes'] / 2**20:.1f} MiB RSS "
+            f"({run['rss_bytes'] / args.entries / 1024:.1f} KiB/entry)"
+        )
+        if "traced_bytes" in run:
+            line += f", {run['traced_bytes'] / 2**20:.1f} MiB traced"
+        info(line)
+
+    by_variant = {run["variant"]: run for run in runs}
+    if by_variant["slab"]["rss_bytes"] > 0:
+        info(f"slab uses {by_variant['list']['rss_bytes'] / by_variant['slab']['rss_bytes']:.1f}x less RSS")
+
+    reads = measure_cache_reads(entries=args.entries, dimension=args.dimension)
+    info(
+        f"hit: {reads['get_us']:.1f} µs get(), of which {reads['copy_us']:.1f} µs "
+        f"slot-to-list copy; memoryview slice {reads['view_us']:.2f} µs"
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"entries": args.entries, "dimension": args.dimension, "runs": runs, "reads": reads},
+                f,
+                indent=2,
+            )
+        success(f"Results written to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
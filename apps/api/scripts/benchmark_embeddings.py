@@ -0,0 +1,175 @@
+"""Embedding concurrency benchmark.
+
+Measures GeminiEmbeddingProvider.embed_batch throughput as the number of
+in-flight requests varies, against a stub client that injects per-request
+latency (no API key or network needed):
+- Requests/minute and texts/second per concurrency level
+- Peak in-flight requests (bounded by the provider's semaphore)
+- Optional quota enforcement to show throughput capping at the RPM limit
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.quota_manager import QuotaManager
+from app.infrastructure.services.embeddings.gemini import GeminiEmbeddingProvider
+from app.infrastructure.services.genai_clients import reset_request_pools
+from scripts.common import info, success
+
+
+class StubEmbeddingClient:
+    """Stands in for ``genai.Client``: sleeps, then returns constant vectors."""
+
+    def __init__(self, latency_seconds: float, dimension: int):
+        self.latency_seconds = latency_seconds
+        self.dimension = dimension
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.aio = SimpleNamespace(models=SimpleNamespace(embed_content=self.embed_content))
+
+    async def embed_content(self, model: str, contents: Any, config: Any = None) -> SimpleNamespace:
+        items = [contents] if isinstance(contents, str) else list(contents)
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency_seconds)
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(
+            embeddings=[SimpleNamespace(values=[0.1] * self.dimension) for _ in items]
+        )
+
+
+async def run_concurrency_benchmark(
+    concurrency: int,
+    *,
+    texts: List[str],
+    latency_seconds: float,
+    rpm_limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Embed ``texts`` once with ``concurrency`` in-flight requests.
+
+    Args:
+        concurrency: Provider max_concurrency
+        texts: Distinct texts to embed (uncached)
+        latency_seconds: Injected latency per API request
+        rpm_limit: Enforce this embedding RPM through a QuotaManager (None: no enforcement)
+
+    Returns:
+        Throughput statistics for this concurrency level
+    """
+    reset_request_pools()
+    provider = GeminiEmbeddingProvider(
+        api_key="stub", use_cache=False, max_concurrency=concurrency
+    )
+    client = StubEmbeddingClient(latency_seconds, provider.dimension)
+    provider.client = client
+    provider.quota_manager = QuotaManager(
+        llm_rpm_limit=settings.llm_rpm_limit,
+        llm_tpm_limit=settings.llm_tpm_limit,
+        llm_rpd_limit=settings.llm_rpd_limit,
+        embedding_rpm_limit=rpm_limit or settings.embedding_rpm_limit,
+        embedding_tpm_limit=10**9,
+        embedding_rpd_limit=10**9,
+        window_seconds=settings.rate_window_seconds,
+        enforcement_enabled=rpm_limit is not None,
+    )
+
+    start_time = time.perf_counter()
+    await provider.embed_batch(texts)
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        "concurrency": concurrency,
+        "requests": client.requests,
+        "peak_in_flight": client.peak_in_flight,
+        "elapsed_s": elapsed,
+        "requests_per_min": client.requests / elapsed * 60 if elapsed else None,
+        "texts_per_s": len(texts) / elapsed if elapsed else None,
+        "pool": provider._request_slots.get_stats(),
+    }
+
+
+async def main():
+    """Main entry point for the embedding concurrency benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark embedding throughput vs request concurrency (stub client)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # 2000 texts (20 requests of 100), 300ms per request, concurrency 1..16
+  python -m scripts.benchmark_embeddings
+
+  # Show throughput capping at a 100 RPM quota
+  python -m scripts.benchmark_embeddings --rpm-limit 100 --texts 20000
+        """,
+    )
+    parser.add_argument("--texts", type=int, default=2000, help="Texts to embed (default: 2000)")
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=300.0,
+        help="Injected latency per request in ms (default: 300)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, 16],
+        help="Concurrency levels to measure (default: 1 2 4 8 16)",
+    )
+    parser.add_argument(
+        "--rpm-limit",
+        type=int,
+        default=None,
+        help="Enforce this embedding RPM via QuotaManager (default: no enforcement)",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Optional JSON output file")
+    args = parser.parse_args()
+
+    texts = [f"benchmark text {i}" for i in range(args.texts)]
+    runs = []
+    for concurrency in args.concurrency:
+        run = await run_concurrency_benchmark(
+            concurrency,
+            texts=texts,
+            latency_seconds=args.latency_ms / 1000,
+            rpm_limit=args.rpm_limit,
+        )
+        runs.append(run)
+        info(
+            f"concurrency={concurrency:>3}: {run['requests']} requests in {run['elapsed_s']:.2f}s "
+            f"→ {run['requests_per_min']:.0f} req/min, {run['texts_per_s']:.0f} texts/s "
+            f"(peak in flight {run['peak_in_flight']}, "
+            f"{run['pool']['saturated']} requests queued for a slot)"
+        )
+
+    baseline = runs[0]["elapsed_s"]
+    for run in runs:
+        run["speedup"] = baseline / run["elapsed_s"] if run["elapsed_s"] else None
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "texts": args.texts,
+                    "latency_ms": args.latency_ms,
+                    "rpm_limit": args.rpm_limit,
+                    "runs": runs,
+                },
+                f,
+                indent=2,
+            )
+        success(f"Results written to: {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,6 +4,8 @@ Benchmarks RAG pipeline performance by:
 - Running test queries
 - Measuring latency (P50, P95, P99)
 - Measuring retrieval accuracy (if ground truth provided)
+- Comparing retriever backends (pgvector vs in-process local index)
+- Measuring HNSW recall@k per recall profile against exact search
 - Outputting results as JSON
 """
 
@@ -15,12 +17,24 @@ import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from app.infrastructure.db.session import init_db
+from sqlalchemy import text
+
+from app.infrastructure.db.session import get_session, init_db
 from app.infrastructure.services.rag.pipeline import RAGPipeline
+from app.infrastructure.services.rag.retriever import RECALL_PROFILES, VectorRetriever
+from app.infrastructure.services.rag.types import RetrievalOptions
 from scripts.common import error, info, progress_bar, success, warning
 
+# HNSW index searched by each RAG_VECTOR_SEARCH_MODE
+VECTOR_MODE_INDEXES = {
+    "full": "idx_content_embeddings_hnsw",
+    "halfvec": "idx_content_embeddings_half_hnsw",
+    "binary": "idx_content_embeddings_bit_hnsw",
+    "matryoshka": "idx_content_embeddings_256_hnsw",
+}
+
 
 class BenchmarkResult:
     """Results from a single query benchmark."""
@@ -155,6 +169,338 @@ def calculate_percentile(values: List[float], percentile: int) -> float:
         return lower + (upper - lower) * (index - int(index))
 
 
+def summarize_run(
+    results: List[BenchmarkResult], latencies: List[float]
+) -> Dict[str, Any]:
+    """Build the statistics block (latency, error rate, accuracy) for one run.
+
+    Args:
+        results: Per-query results (median iteration)
+        latencies: Latencies of every run in milliseconds
+
+    Returns:
+        Statistics dictionary as written to the output JSON
+    """
+    error_count = sum(1 for r in results if r.error)
+    summary: Dict[str, Any] = {
+        "latency": {
+            "mean_ms": statistics.mean(latencies) if latencies else None,
+            "median_ms": calculate_percentile(latencies, 50) if latencies else None,
+            "p95_ms": calculate_percentile(latencies, 95) if latencies else None,
+            "p99_ms": calculate_percentile(latencies, 99) if latencies else None,
+            "min_ms": min(latencies) if latencies else None,
+            "max_ms": max(latencies) if latencies else None,
+        },
+        "error_rate": (error_count / len(results)) if results else None,
+    }
+
+    accuracy_results = [
+        accuracy for accuracy in (r.calculate_accuracy() for r in results) if accuracy is not None
+    ]
+    if accuracy_results:
+        summary["accuracy"] = {
+            "mean": statistics.mean(accuracy_results),
+            "median": statistics.median(accuracy_results),
+            "min": min(accuracy_results),
+            "max": max(accuracy_results),
+        }
+    return summary
+
+
+def compare_backends(
+    baseline: Tuple[Dict[str, Any], List[BenchmarkResult]],
+    candidate: Tuple[Dict[str, Any], List[BenchmarkResult]],
+) -> Dict[str, Any]:
+    """Compare a candidate backend run against a baseline run.
+
+    Args:
+        baseline: (statistics, results) of the baseline backend
+        candidate: (statistics, results) of the candidate backend
+
+    Returns:
+        Latency speedups (baseline / candidate) and mean result-path overlap
+    """
+    base_stats, base_results = baseline
+    cand_stats, cand_results = candidate
+
+    def _speedup(key: str) -> Optional[float]:
+        base = base_stats["latency"].get(key)
+        cand = cand_stats["latency"].get(key)
+        return base / cand if base and cand else None
+
+    overlaps = []
+    for base, cand in zip(base_results, cand_results, strict=False):
+        if base.error or cand.error:
+            continue
+        expected = set(base.result_paths)
+        if not expected:
+            continue
+        overlaps.append(len(expected & set(cand.result_paths)) / len(expected))
+
+    return {
+        "p50_speedup": _speedup("median_ms"),
+        "p95_speedup": _speedup("p95_ms"),
+        "mean_result_overlap": statistics.mean(overlaps) if overlaps else None,
+    }
+
+
+def create_benchmark_pipeline(
+    backend: str, embedding_provider=None
+) -> RAGPipeline:
+    """Create an uncached pipeline for one retriever backend.
+
+    Args:
+        backend: "pgvector" or "local"
+        embedding_provider: Shared embedding provider (so backends embed identically)
+
+    Returns:
+        RAGPipeline with the result cache disabled
+    """
+    if backend == "local":
+        from app.infrastructure.services.rag.local_retriever import LocalVectorRetriever
+
+        retriever = LocalVectorRetriever(embedding_provider=embedding_provider)
+    else:
+        retriever = VectorRetriever(embedding_provider=embedding_provider)
+
+    pipeline = RAGPipeline(retriever=retriever)
+    # Measure the backend, not the result cache
+    pipeline.cache = None
+    return pipeline
+
+
+async def run_benchmark_suite(
+    pipeline: RAGPipeline,
+    queries_data: List[Any],
+    *,
+    iterations: int,
+    top_k: int,
+    description: str = "Running benchmarks",
+) -> Tuple[List[BenchmarkResult], List[float]]:
+    """Run every query ``iterations`` times against one pipeline.
+
+    Returns:
+        (median result per query, latencies of every run)
+    """
+    all_results: List[BenchmarkResult] = []
+    all_latencies: List[float] = []
+
+    with progress_bar(total=len(queries_data) * iterations, description=description) as bar:
+        for query_data in queries_data:
+            # Extract query and ground truth
+            if isinstance(query_data, str):
+                query = query_data
+                ground_truth = None
+            else:
+                query = query_data.get("query", "")
+                ground_truth = query_data.get("expected_paths")
+
+            if not query:
+                warning("Skipping empty query")
+                continue
+
+            # Run multiple iterations
+            iteration_results = []
+            for _ in range(iterations):
+                result = await run_benchmark_query(pipeline, query, top_k=top_k)
+                iteration_results.append(result)
+
+                if result.latency_ms:
+                    all_latencies.append(result.latency_ms)
+
+                bar.update()
+
+            # Use median result if multiple iterations
+            if iterations > 1:
+                iteration_results.sort(key=lambda r: r.latency_ms or float("inf"))
+                median_result = iteration_results[len(iteration_results) // 2]
+            else:
+                median_result = iteration_results[0]
+
+            median_result.ground_truth = ground_truth
+            all_results.append(median_result)
+
+    return all_results, all_latencies
+
+
+async def run_throughput_benchmark(
+    pipeline: RAGPipeline,
+    queries: List[str],
+    *,
+    top_k: int,
+    batch_size: int,
+) -> Dict[str, Any]:
+    """Compare one-at-a-time retrieval against ``retrieve_context_many`` batches.
+
+    The embedding cache is cleared before each pass so both pay for query
+    embeddings (one call per query vs one batch call per batch).
+
+    Returns:
+        Queries/second for each pass and the batched speedup
+    """
+    embedding_cache = getattr(pipeline.retriever.embedding_provider, "cache", None)
+
+    if embedding_cache is not None:
+        embedding_cache.clear()
+    start_time = time.perf_counter()
+    with progress_bar(total=len(queries), description="Throughput (sequential)") as bar:
+        for query in queries:
+            await pipeline.retrieve_context(query, top_k=top_k)
+            bar.update()
+    sequential_s = time.perf_counter() - start_time
+
+    if embedding_cache is not None:
+        embedding_cache.clear()
+    batch_latencies: List[float] = []
+    start_time = time.perf_counter()
+    with progress_bar(total=len(queries), description="Throughput (batched)") as bar:
+        for i in range(0, len(queries), batch_size):
+            batch = queries[i : i + batch_size]
+            batch_start = time.perf_counter()
+            await pipeline.retrieve_context_many(batch, top_k=top_k)
+            batch_latencies.append((time.perf_counter() - batch_start) * 1000)
+            bar.update(len(batch))
+    batched_s = time.perf_counter() - start_time
+
+    return {
+        "queries": len(queries),
+        "batch_size": batch_size,
+        "sequential_qps": len(queries) / sequential_s if sequential_s else None,
+        "batched_qps": len(queries) / batched_s if batched_s else None,
+        "speedup": sequential_s / batched_s if batched_s else None,
+        "batch_p95_ms": calculate_percentile(batch_latencies, 95),
+    }
+
+
+def print_statistics(run_statistics: Dict[str, Any], results: List[BenchmarkResult]) -> None:
+    """Print latency, accuracy and error statistics for one run."""
+    latency = run_statistics["latency"]
+    if latency["mean_ms"] is not None:
+        info("Latency Statistics:")
+        info(f"  Mean: {latency['mean_ms']:.2f}ms")
+        info(f"  Median (P50): {latency['median_ms']:.2f}ms")
+        info(f"  P95: {latency['p95_ms']:.2f}ms")
+        info(f"  P99: {latency['p99_ms']:.2f}ms")
+        info(f"  Min: {latency['min_ms']:.2f}ms")
+        info(f"  Max: {latency['max_ms']:.2f}ms")
+
+    accuracy = run_statistics.get("accuracy")
+    if accuracy:
+        print()
+        info("Accuracy Statistics:")
+        info(f"  Mean: {accuracy['mean']:.2%}")
+        info(f"  Median: {accuracy['median']:.2%}")
+        info(f"  Min: {accuracy['min']:.2%}")
+        info(f"  Max: {accuracy['max']:.2%}")
+
+    error_count = sum(1 for r in results if r.error)
+    if error_count > 0:
+        print()
+        warning(f"Errors: {error_count}/{len(results)} queries failed")
+
+
+def recall_at_k(retrieved_ids: List[str], exact_ids: List[str]) -> Optional[float]:
+    """Fraction of the exact top-k that an approximate search returned.
+
+    Args:
+        retrieved_ids: Chunk ids from the approximate search
+        exact_ids: Chunk ids from exact (brute-force) search
+
+    Returns:
+        Recall in 0-1, or None when exact search returned nothing
+    """
+    if not exact_ids:
+        return None
+    return len(set(retrieved_ids) & set(exact_ids)) / len(exact_ids)
+
+
+async def run_recall_benchmark(
+    exact_retriever: VectorRetriever,
+    queries: List[str],
+    *,
+    top_k: int,
+    variants: Dict[str, Tuple[VectorRetriever, Optional[str]]],
+) -> Dict[str, Dict[str, Any]]:
+    """Measure semantic-search recall@k and latency per search variant.
+
+    Exact search on the full vector (``recall_profile="exact"``) is the
+    ground truth. The similarity threshold is disabled so recall reflects
+    the index only.
+
+    Args:
+        exact_retriever: Retriever used for the exact ground truth
+        queries: Query texts
+        top_k: Number of results per query
+        variants: Name -> (retriever, recall profile or None for the default)
+
+    Returns:
+        Per-variant mean recall@k and latency percentiles
+    """
+    latencies: Dict[str, List[float]] = {name: [] for name in variants}
+    recalls: Dict[str, List[float]] = {name: [] for name in variants}
+
+    with progress_bar(total=len(queries), description="Measuring recall@k") as bar:
+        for query in queries:
+            exact = await exact_retriever.retrieve(
+                query, RetrievalOptions(top_k=top_k, recall_profile="exact")
+            )
+            exact_ids = [r.chunk_id for r in exact]
+            for name, (retriever, profile) in variants.items():
+                start_time = time.perf_counter()
+                results = await retriever.retrieve(
+                    query, RetrievalOptions(top_k=top_k, recall_profile=profile)
+                )
+                latencies[name].append((time.perf_counter() - start_time) * 1000)
+                recall = recall_at_k([r.chunk_id for r in results], exact_ids)
+                if recall is not None:
+                    recalls[name].append(recall)
+            bar.update()
+
+    return {
+        name: {
+            f"mean_recall_at_{top_k}": statistics.mean(recalls[name]) if recalls[name] else None,
+            "median_ms": calculate_percentile(latencies[name], 50),
+            "p95_ms": calculate_percentile(latencies[name], 95),
+        }
+        for name in variants
+    }
+
+
+async def fetch_relation_sizes(relations: Dict[str, str]) -> Dict[str, Optional[int]]:
+    """Look up on-disk sizes (bytes) of tables/indexes; None if a relation is missing.
+
+    Args:
+        relations: Label -> relation name
+
+    Returns:
+        Label -> size in bytes
+    """
+    session_maker = get_session()
+    async with session_maker() as session:
+        sizes = {}
+        for label, relation in relations.items():
+            result = await session.execute(
+                text("SELECT pg_total_relation_size(to_regclass(:relation))"),
+                {"relation": relation},
+            )
+            sizes[label] = result.scalar()
+    return sizes
+
+
+def print_recall(title: str, recall: Dict[str, Dict[str, Any]], top_k: int) -> None:
+    """Print recall@k and latency per variant."""
+    info(title)
+    for name, variant_stats in recall.items():
+        mean_recall = variant_stats[f"mean_recall_at_{top_k}"]
+        recall_text = f"{mean_recall:.2%}" if mean_recall is not None else "n/a"
+        size = variant_stats.get("index_bytes")
+        size_text = f", index {size / 1_048_576:.1f} MiB" if size else ""
+        info(
+            f"  {name}: recall {recall_text}, P50 {variant_stats['median_ms']:.2f}ms, "
+            f"P95 {variant_stats['p95_ms']:.2f}ms{size_text}"
+        )
+
+
 def evaluate_quality_gates(
     *,
     statistics: Dict[str, Any],
@@ -221,6 +567,18 @@ Examples:
 
   # Save results to custom file
   python -m scripts.benchmark_rag --output results.json
+
+  # Compare pgvector against the in-process local index
+  python -m scripts.benchmark_rag --backend both --iterations 3
+
+  # Report recall@k of each HNSW recall profile against exact search
+  python -m scripts.benchmark_rag --recall-profiles
+
+  # Throughput: one query at a time vs retrieve_context_many in batches of 16
+  python -m scripts.benchmark_rag --batch-size 16
+
+  # Compare full / halfvec / binary / matryoshka shortlist search (index size, p95, recall drop)
+  python -m scripts.benchmark_rag --vector-modes
         """,
     )
     parser.add_argument(
@@ -247,6 +605,28 @@ Examples:
         default=5,
         help="Number of results to retrieve per query (default: 5)",
     )
+    parser.add_argument(
+        "--backend",
+        choices=["pgvector", "local", "both"],
+        default="pgvector",
+        help="Retriever backend to benchmark; 'both' adds a comparison (default: pgvector)",
+    )
+    parser.add_argument(
+        "--recall-profiles",
+        action="store_true",
+        help="Also measure pgvector recall@k per recall profile (fast, balanced) vs exact search",
+    )
+    parser.add_argument(
+        "--vector-modes",
+        action="store_true",
+        help="Also compare full, halfvec, binary and matryoshka vector search (index size, latency, recall)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help="Also measure throughput of batched retrieval (retrieve_context_many) with this batch size",
+    )
     parser.add_argument(
         "--min-mean-accuracy",
         type=float,
@@ -289,110 +669,148 @@ Examples:
     # Initialize database
     await init_db()
 
-    # Initialize pipeline (creates default VectorRetriever)
-    pipeline = RAGPipeline()
-
-    # Run benchmarks
-    all_results: List[BenchmarkResult] = []
-    all_latencies: List[float] = []
-
+    backends = ["pgvector", "local"] if args.backend == "both" else [args.backend]
     total_runs = len(queries_data) * args.iterations
+    embedding_provider = None
+    runs: Dict[str, Tuple[Dict[str, Any], List[BenchmarkResult]]] = {}
+    index_stats: Optional[Dict[str, Any]] = None
+
+    for backend in backends:
+        pipeline = create_benchmark_pipeline(backend, embedding_provider)
+        embedding_provider = pipeline.retriever.embedding_provider
+        await pipeline.warm_up()
+        if backend == "local":
+            index_stats = pipeline.retriever.get_index_stats()
+            info(
+                f"Local index: {index_stats['rows']} rows loaded in {index_stats['load_ms']:.0f}ms"
+            )
 
-    with progress_bar(total=total_runs, description="Running benchmarks") as bar:
-        for query_data in queries_data:
-            # Extract query and ground truth
-            if isinstance(query_data, str):
-                query = query_data
-                ground_truth = None
-            else:
-                query = query_data.get("query", "")
-                ground_truth = query_data.get("expected_paths")
-
-            if not query:
-                warning("Skipping empty query")
-                continue
-
-            # Run multiple iterations
-            iteration_results = []
-            for _ in range(args.iterations):
-                result = await run_benchmark_query(pipeline, query, top_k=args.top_k)
-                iteration_results.append(result)
-
-                if result.latency_ms:
-                    all_latencies.append(result.latency_ms)
-
-                bar.update()
-
-            # Use median result if multiple iterations
-            if args.iterations > 1:
-                iteration_results.sort(key=lambda r: r.latency_ms or float("inf"))
-                median_result = iteration_results[len(iteration_results) // 2]
-            else:
-                median_result = iteration_results[0]
-
-            median_result.ground_truth = ground_truth
-            all_results.append(median_result)
-
-    # Calculate statistics
-    print()
-    success(f"Completed {total_runs} benchmark run(s)")
-    print()
+        if len(backends) > 1 and not runs:
+            # Warm the shared embedding cache so backends compare retrieval only
+            for query_data in queries_data:
+                query = query_data if isinstance(query_data, str) else query_data.get("query", "")
+                if query:
+                    await pipeline.embed_query(query)
+
+        results, latencies = await run_benchmark_suite(
+            pipeline,
+            queries_data,
+            iterations=args.iterations,
+            top_k=args.top_k,
+            description=f"Running benchmarks ({backend})",
+        )
+        run_statistics = summarize_run(results, latencies)
+        runs[backend] = (run_statistics, results)
 
-    if all_latencies:
-        info("Latency Statistics:")
-        info(f"  Mean: {statistics.mean(all_latencies):.2f}ms")
-        info(f"  Median (P50): {calculate_percentile(all_latencies, 50):.2f}ms")
-        info(f"  P95: {calculate_percentile(all_latencies, 95):.2f}ms")
-        info(f"  P99: {calculate_percentile(all_latencies, 99):.2f}ms")
-        info(f"  Min: {min(all_latencies):.2f}ms")
-        info(f"  Max: {max(all_latencies):.2f}ms")
-
-    # Calculate accuracy if ground truth available
-    accuracy_results = [r.calculate_accuracy() for r in all_results if r.calculate_accuracy() is not None]
-    if accuracy_results:
         print()
-        info("Accuracy Statistics:")
-        info(f"  Mean: {statistics.mean(accuracy_results):.2%}")
-        info(f"  Median: {statistics.median(accuracy_results):.2%}")
-        info(f"  Min: {min(accuracy_results):.2%}")
-        info(f"  Max: {max(accuracy_results):.2%}")
-
-    # Count errors
-    error_count = sum(1 for r in all_results if r.error)
-    if error_count > 0:
+        success(f"Completed {total_runs} benchmark run(s) against {backend}")
+        print()
+        print_statistics(run_statistics, results)
         print()
-        warning(f"Errors: {error_count}/{len(all_results)} queries failed")
-    error_rate = (error_count / len(all_results)) if all_results else None
 
-    # Prepare output
+    # Prepare output (top-level statistics/results are for the first backend)
+    primary_statistics, primary_results = runs[backends[0]]
     output_data = {
         "timestamp": datetime.now().isoformat(),
         "queries_file": str(args.queries_file),
         "iterations": args.iterations,
         "top_k": args.top_k,
+        "backend": args.backend,
         "total_queries": len(queries_data),
         "total_runs": total_runs,
-        "statistics": {
-            "latency": {
-                "mean_ms": statistics.mean(all_latencies) if all_latencies else None,
-                "median_ms": calculate_percentile(all_latencies, 50) if all_latencies else None,
-                "p95_ms": calculate_percentile(all_latencies, 95) if all_latencies else None,
-                "p99_ms": calculate_percentile(all_latencies, 99) if all_latencies else None,
-                "min_ms": min(all_latencies) if all_latencies else None,
-                "max_ms": max(all_latencies) if all_latencies else None,
-            },
-            "error_rate": error_rate,
-        },
-        "results": [r.to_dict() for r in all_results],
+        "statistics": primary_statistics,
+        "results": [r.to_dict() for r in primary_results],
     }
-
-    if accuracy_results:
-        output_data["statistics"]["accuracy"] = {
-            "mean": statistics.mean(accuracy_results),
-            "median": statistics.median(accuracy_results),
-            "min": min(accuracy_results),
-            "max": max(accuracy_results),
+    if index_stats is not None:
+        output_data["local_index"] = index_stats
+
+    if len(backends) > 1:
+        output_data["backends"] = {
+            backend: {
+                "statistics": run_statistics,
+                "results": [r.to_dict() for r in results],
+            }
+            for backend, (run_statistics, results) in runs.items()
         }
+        comparison = compare_backends(runs["pgvector"], runs["local"])
+        output_data["comparison"] = comparison
+        info("Backend comparison (local vs pgvector):")
+        if comparison["p50_speedup"] is not None:
+            info(f"  P50 speedup: {comparison['p50_speedup']:.2f}x")
+        if comparison["p95_speedup"] is not None:
+            info(f"  P95 speedup: {comparison['p95_speedup']:.2f}x")
+        if comparison["mean_result_overlap"] is not None:
+            info(f"  Mean result overlap: {comparison['mean_result_overlap']:.2%}")
+        print()
+
+    queries = [q if isinstance(q, str) else q.get("query", "") for q in queries_data]
+    queries = [q for q in queries if q]
+
+    if args.batch_size > 0:
+        throughput = await run_throughput_benchmark(
+            create_benchmark_pipeline(backends[0], embedding_provider),
+            queries,
+            top_k=args.top_k,
+            batch_size=args.batch_size,
+        )
+        output_data["throughput"] = throughput
+        print()
+        info(f"Throughput ({backends[0]}, batch size {args.batch_size}):")
+        info(f"  Sequential: {throughput['sequential_qps']:.1f} queries/s")
+        info(f"  Batched: {throughput['batched_qps']:.1f} queries/s ({throughput['speedup']:.2f}x)")
+        print()
+
+    if args.recall_profiles or args.vector_modes:
+        exact_retriever = VectorRetriever(
+            embedding_provider=embedding_provider, vector_search_mode="full"
+        )
+
+    if args.recall_profiles:
+        recall = await run_recall_benchmark(
+            exact_retriever,
+            queries,
+            top_k=args.top_k,
+            variants={
+                profile: (exact_retriever, profile)
+                for profile in RECALL_PROFILES
+                if profile != "exact"
+            },
+        )
+        output_data["recall_profiles"] = recall
+        print()
+        print_recall(f"Recall@{args.top_k} vs exact search per recall profile:", recall, args.top_k)
+        print()
+
+    if args.vector_modes:
+        recall = await run_recall_benchmark(
+            exact_retriever,
+            queries,
+            top_k=args.top_k,
+            variants={
+                mode: (
+                    VectorRetriever(embedding_provider=embedding_provider, vector_search_mode=mode),
+                    None,
+                )
+                for mode in VECTOR_MODE_INDEXES
+            },
+        )
+        sizes = await fetch_relation_sizes(
+            {**VECTOR_MODE_INDEXES, "table": "content_embeddings"}
+        )
+        for mode, mode_stats in recall.items():
+            mode_stats["index_bytes"] = sizes[mode]
+        full_recall = recall["full"][f"mean_recall_at_{args.top_k}"]
+        for mode_stats in recall.values():
+            mode_recall = mode_stats[f"mean_recall_at_{args.top_k}"]
+            mode_stats["recall_drop"] = (
+                full_recall - mode_recall
+                if full_recall is not None and mode_recall is not None
+                else None
+            )
+        output_data["vector_modes"] = {"modes": recall, "table_bytes": sizes["table"]}
+        print()
+        print_recall(f"Recall@{args.top_k} vs exact search per vector mode:", recall, args.top_k)
+        print()
 
     # Write output file
     if args.output:
@@ -406,12 +824,16 @@ Examples:
 
     success(f"Results written to: {output_file}")
 
-    gate_failures = evaluate_quality_gates(
-        statistics=output_data["statistics"],
-        min_mean_accuracy=args.min_mean_accuracy,
-        max_error_rate=args.max_error_rate,
-        max_p95_latency_ms=args.max_p95_latency_ms,
-    )
+    gate_failures = []
+    for backend, (run_statistics, _) in runs.items():
+        failures = evaluate_quality_gates(
+            statistics=run_statistics,
+            min_mean_accuracy=args.min_mean_accuracy,
+            max_error_rate=args.max_error_rate,
+            max_p95_latency_ms=args.max_p95_latency_ms,
+        )
+        prefix = f"[{backend}] " if len(runs) > 1 else ""
+        gate_failures.extend(f"{prefix}{failure}" for failure in failures)
     if gate_failures:
         print()
         for failure in gate_failures:
@@ -2,12 +2,18 @@
 
 Evaluates factual-claim citation enforcement using fixture cases.
 Designed for deterministic CI gating without external API calls.
+
+With ``--compare-modes`` it instead runs live native-graph turns in both
+specialist grounding modes (``tool`` and ``pregrounded``) and reports
+latency, token use and grounding metrics side by side.
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
+import statistics
 import sys
 from pathlib import Path
 from types import SimpleNamespace
@@ -85,6 +91,75 @@ def evaluate_cases(cases: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+def summarize_mode_turns(turns: List[Any]) -> Dict[str, Any]:
+    """Aggregate latency, token and grounding metrics for one grounding mode.
+
+    An empty turn list yields the same keys with zeroed metrics.
+    """
+
+    def _mean(values: List[float]) -> float:
+        return statistics.mean(values) if values else 0.0
+
+    total_ms = [turn.trace.latency_ms.get("total_ms", 0.0) for turn in turns]
+    specialist_ms = [turn.trace.latency_ms.get("specialist_ms", 0.0) for turn in turns]
+    usage = [turn.trace.token_usage for turn in turns]
+    grounding = evaluate_cases(
+        [
+            {
+                "id": index,
+                "answer": turn.message,
+                "citations": turn.citations,
+                "safety_flags": turn.safety_classification.to_dict(),
+            }
+            for index, turn in enumerate(turns)
+        ]
+    )
+
+    return {
+        "turns": len(turns),
+        "mean_total_ms": _mean(total_ms),
+        "p95_total_ms": sorted(total_ms)[int(0.95 * (len(total_ms) - 1))] if total_ms else 0.0,
+        "mean_specialist_ms": _mean(specialist_ms),
+        "mean_llm_calls": _mean([u.get("llm_calls", 0) for u in usage]),
+        "mean_prompt_tokens": _mean([u.get("prompt_tokens", 0) for u in usage]),
+        "mean_output_tokens": _mean([u.get("output_tokens", 0) for u in usage]),
+        "policy_enforced_rate": _mean(
+            [1.0 if turn.policy_validation.policy_enforced else 0.0 for turn in turns]
+        ),
+        "citation_rate": grounding["citation_rate"],
+        "unsupported_claim_rate": grounding["unsupported_claim_rate"],
+    }
+
+
+async def compare_grounding_modes(queries: List[str]) -> Dict[str, Any]:
+    """Run each query through the native graph in both specialist grounding modes."""
+    from app.infrastructure.adk import ADKNativeGraphOrchestrator
+    from app.infrastructure.db.session import init_db
+
+    await init_db()
+    summary: Dict[str, Any] = {}
+    for mode in ("tool", "pregrounded"):
+        graph = ADKNativeGraphOrchestrator(grounding_mode=mode)
+        turns = []
+        for index, query in enumerate(queries):
+            turns.append(
+                await graph.run_turn(
+                    message=query,
+                    session_id=f"grounding-eval-{mode}-{index}",
+                    conversation_history=[],
+                )
+            )
+        summary[mode] = summarize_mode_turns(turns)
+    return summary
+
+
+def load_queries(path: Path) -> List[str]:
+    with open(path, "r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    items = payload["queries"] if isinstance(payload, dict) else payload
+    return [item if isinstance(item, str) else item.get("query", "") for item in items]
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Evaluate grounding policy heuristics")
     parser.add_argument(
@@ -111,8 +186,44 @@ def main() -> None:
         default=None,
         help="Fail if unsupported factual-claim rate exceeds this threshold (0-1)",
     )
+    parser.add_argument(
+        "--compare-modes",
+        action="store_true",
+        help="Run live turns in tool vs pregrounded specialist modes (needs Gemini + DB)",
+    )
+    parser.add_argument(
+        "--queries-file",
+        type=Path,
+        default=Path("../../tests/fixtures/benchmark_queries.json"),
+        help="Queries used by --compare-modes",
+    )
     args = parser.parse_args()
 
+    if args.compare_modes:
+        queries = [query for query in load_queries(args.queries_file) if query]
+        if not queries:
+            error(f"No queries found in {args.queries_file}")
+            sys.exit(1)
+        comparison = asyncio.run(compare_grounding_modes(queries))
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(comparison, handle, indent=2)
+        for mode, metrics in comparison.items():
+            info(
+                "%s: mean_total_ms=%.1f llm_calls=%.2f prompt_tokens=%.0f "
+                "output_tokens=%.0f citation_rate=%.3f policy_enforced_rate=%.3f"
+                % (
+                    mode,
+                    metrics["mean_total_ms"],
+                    metrics["mean_llm_calls"],
+                    metrics["mean_prompt_tokens"],
+                    metrics["mean_output_tokens"],
+                    metrics["citation_rate"],
+                    metrics["policy_enforced_rate"],
+                )
+            )
+        success(f"Results written to: {args.output}")
+        return
+
     cases = load_cases(args.cases)
     result = evaluate_cases(cases)
 
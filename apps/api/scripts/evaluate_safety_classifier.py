@@ -0,0 +1,248 @@
+"""Local safety classifier evaluation utility.
+
+Scores the local medical/emergency models on labeled fixture cases and
+replays the cases through ``EmergencyDetector`` + ``MedicalQueryDetector``
+(the ``safety_classification_tool`` sequence) with and without the local
+tier. The LLM is a stub that answers from the labels after a fixed latency,
+so the replay reports the LLM calls and milliseconds saved per turn without
+an API key.
+
+With ``--fit`` it instead fits the logistic weights (L2-regularised) on the
+fixture and prints them for ``app/domain/orchestration/safety_classifier.py``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from app.domain.orchestration.classifier_cache import reset_classifier_caches
+from app.domain.orchestration.emergency_detector_hybrid import EmergencyDetector
+from app.domain.orchestration.medical_detector import MedicalQueryDetector
+from app.domain.orchestration.safety_classifier import (
+    EMERGENCY_MODEL,
+    MEDICAL_MODEL,
+    LocalSafetyClassifier,
+    LogisticModel,
+)
+from app.infrastructure.services.llm.types import LLMMessage
+from scripts.common import info, success
+
+DEFAULT_CASES = Path("tests/fixtures/safety_classifier_cases.json")
+
+
+def load_cases(path: Path) -> List[Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    return payload["cases"] if isinstance(payload, dict) else payload
+
+
+def emergency_band(cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Cases that reach the hybrid detector's ambiguous (LLM) branch."""
+    band = []
+    for case in cases:
+        text = case["query"].lower()
+        has_symptom = any(keyword in text for keyword in EmergencyDetector.SYMPTOM_KEYWORDS)
+        clear = any(keyword in text for keyword in EmergencyDetector.FIRST_PERSON_KEYWORDS) and any(
+            keyword in text for keyword in EmergencyDetector.DIVE_CONTEXT_KEYWORDS
+        )
+        if has_symptom and not clear:
+            band.append(case)
+    return band
+
+
+def fit_logistic(
+    features: Dict[str, Pattern[str]],
+    samples: List[Tuple[str, bool]],
+    *,
+    l2: float = 0.01,
+    learning_rate: float = 0.5,
+    epochs: int = 8000,
+) -> Tuple[Dict[str, float], float]:
+    """Fit logistic weights over binary keyword features by gradient descent."""
+    model = LogisticModel(features, {name: 0.0 for name in features}, 0.0)
+    rows = [(set(model.extract(text)), 1.0 if label else 0.0) for text, label in samples]
+    weights = {name: 0.0 for name in features}
+    bias = 0.0
+    for _ in range(epochs):
+        grad = {name: l2 * weight for name, weight in weights.items()}
+        grad_bias = 0.0
+        for matched, target in rows:
+            logit = bias + sum(weights[name] for name in matched)
+            error = 1.0 / (1.0 + math.exp(-logit)) - target
+            grad_bias += error / len(rows)
+            for name in matched:
+                grad[name] += error / len(rows)
+        for name in weights:
+            weights[name] -= learning_rate * grad[name]
+        bias -= learning_rate * grad_bias
+    return {name: round(weight, 1) for name, weight in weights.items()}, round(bias, 1)
+
+
+def evaluate_local(
+    cases: List[Dict[str, Any]], classifier: Optional[LocalSafetyClassifier] = None
+) -> Dict[str, Any]:
+    """Coverage, accuracy and calibration of local decisions per model."""
+    classifier = classifier or LocalSafetyClassifier()
+    report: Dict[str, Any] = {}
+    for name, classify, label_key, subset in (
+        ("medical", classifier.classify_medical, "is_medical", cases),
+        ("emergency", classifier.classify_emergency, "is_emergency", emergency_band(cases)),
+    ):
+        decided = correct = 0
+        brier = 0.0
+        errors = []
+        for case in subset:
+            decision = classify(case["query"])
+            brier += (decision.probability - float(case[label_key])) ** 2
+            if decision.label is None:
+                continue
+            decided += 1
+            if decision.label == case[label_key]:
+                correct += 1
+            else:
+                errors.append(case["query"])
+        report[name] = {
+            "cases": len(subset),
+            "local_coverage": decided / len(subset) if subset else 0.0,
+            "local_accuracy": correct / decided if decided else 1.0,
+            "brier_score": brier / len(subset) if subset else 0.0,
+            "errors": errors,
+        }
+    return report
+
+
+class StubClassifierLLM:
+    """Answers classifier prompts from fixture labels after a fixed latency."""
+
+    def __init__(self, labels: Dict[str, Dict[str, bool]], key: str, latency_seconds: float):
+        self.labels = labels
+        self.key = key
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+
+    async def generate(self, messages: List[LLMMessage], **kwargs: Any) -> SimpleNamespace:
+        self.calls += 1
+        await asyncio.sleep(self.latency_seconds)
+        message = messages[-1].content.split("\n\n", 1)[-1]
+        return SimpleNamespace(content=json.dumps({self.key: self.labels[message][self.key]}))
+
+
+async def replay(
+    cases: List[Dict[str, Any]], *, local: bool, llm_latency_seconds: float
+) -> Dict[str, Any]:
+    """Run every case through emergency then medical classification."""
+    # Each replay starts cold so cached verdicts don't hide LLM calls
+    reset_classifier_caches()
+    labels = {case["query"]: case for case in cases}
+    emergency_llm = StubClassifierLLM(labels, "is_emergency", llm_latency_seconds)
+    medical_llm = StubClassifierLLM(labels, "is_medical", llm_latency_seconds)
+    emergency_detector = EmergencyDetector(use_local_classifier=local)
+    emergency_detector._llm = emergency_llm
+    medical_detector = MedicalQueryDetector(llm_provider=medical_llm, use_local_classifier=local)
+
+    correct = 0
+    start_time = time.perf_counter()
+    for case in cases:
+        is_emergency, _ = await emergency_detector.detect_emergency(case["query"])
+        is_medical = True if is_emergency else await medical_detector.is_medical_query(case["query"])
+        correct += (is_emergency, is_medical) == (case["is_emergency"], case["is_medical"])
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+    return {
+        "turns": len(cases),
+        "llm_calls": emergency_llm.calls + medical_llm.calls,
+        "ms_per_turn": elapsed_ms / len(cases),
+        "accuracy": correct / len(cases),
+    }
+
+
+def time_local_classifier(cases: List[Dict[str, Any]], repeats: int = 200) -> float:
+    """Mean microseconds for one medical + one emergency local classification."""
+    classifier = LocalSafetyClassifier()
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        for case in cases:
+            classifier.classify_medical(case["query"])
+            classifier.classify_emergency(case["query"])
+    return (time.perf_counter() - start_time) / (repeats * len(cases)) * 1e6
+
+
+async def run_replay(cases: List[Dict[str, Any]], *, llm_latency_seconds: float) -> Dict[str, Any]:
+    """Replay with and without the local tier and report the savings per turn."""
+    baseline = await replay(cases, local=False, llm_latency_seconds=llm_latency_seconds)
+    local = await replay(cases, local=True, llm_latency_seconds=llm_latency_seconds)
+    return {
+        "llm_only": baseline,
+        "local_first": local,
+        "llm_calls_saved_per_turn": (baseline["llm_calls"] - local["llm_calls"]) / len(cases),
+        "ms_saved_per_turn": baseline["ms_per_turn"] - local["ms_per_turn"],
+        "local_classifier_us": time_local_classifier(cases),
+    }
+
+
+def main():
+    """Main entry point for the safety classifier evaluation."""
+    parser = argparse.ArgumentParser(description="Evaluate the local safety classifier")
+    parser.add_argument("--cases", type=Path, default=DEFAULT_CASES, help="Labeled fixture")
+    parser.add_argument(
+        "--llm-latency-ms",
+        type=float,
+        default=400.0,
+        help="Stub LLM classifier latency in ms (default: 400)",
+    )
+    parser.add_argument("--fit", action="store_true", help="Fit and print model weights")
+    parser.add_argument("--output", type=Path, default=None, help="Optional JSON output file")
+    args = parser.parse_args()
+
+    cases = load_cases(args.cases)
+
+    if args.fit:
+        for name, model, label_key, subset in (
+            ("MEDICAL", MEDICAL_MODEL, "is_medical", cases),
+            ("EMERGENCY", EMERGENCY_MODEL, "is_emergency", emergency_band(cases)),
+        ):
+            weights, bias = fit_logistic(
+                model.features, [(case["query"], case[label_key]) for case in subset]
+            )
+            print(f"{name}_WEIGHTS = {weights!r}")
+            print(f"{name}_BIAS = {bias!r}")
+        return
+
+    report = {"local": evaluate_local(cases)}
+    for name, stats in report["local"].items():
+        info(
+            f"{name}: {stats['local_coverage']:.0%} decided locally, "
+            f"{stats['local_accuracy']:.0%} correct, Brier {stats['brier_score']:.3f}"
+        )
+
+    report["replay"] = asyncio.run(
+        run_replay(cases, llm_latency_seconds=args.llm_latency_ms / 1000)
+    )
+    replayed = report["replay"]
+    info(
+        f"LLM calls/turn {replayed['llm_only']['llm_calls'] / len(cases):.2f} → "
+        f"{replayed['local_first']['llm_calls'] / len(cases):.2f} "
+        f"(saved {replayed['llm_calls_saved_per_turn']:.2f}), "
+        f"{replayed['ms_saved_per_turn']:.0f} ms saved per turn, "
+        f"local classifier {replayed['local_classifier_us']:.0f} µs"
+    )
+    info(
+        f"Replay accuracy: {replayed['llm_only']['accuracy']:.0%} LLM-only, "
+        f"{replayed['local_first']['accuracy']:.0%} local-first"
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        success(f"Results written to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
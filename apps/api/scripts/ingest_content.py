@@ -6,6 +6,7 @@ Ingests markdown content files by:
 - Generating embeddings
 - Inserting into database
 - Supporting incremental mode (skip unchanged files)
+- Optionally exporting a memory-mapped index artifact for the local retriever
 """
 
 import argparse
@@ -20,6 +21,7 @@ from app.core.config import settings
 from app.infrastructure.db.session import SessionLocal
 from app.infrastructure.services.embeddings import create_embedding_provider_from_env
 from app.infrastructure.services.rag import chunk_text
+from app.infrastructure.services.rag.index_artifact import write_index_artifact
 from app.infrastructure.services.rag.repository import RAGRepository
 from app.infrastructure.services.rag.types import ChunkingOptions
 from scripts.common import (
@@ -251,6 +253,27 @@ async def ingest_file(
     }
 
 
+def export_index_artifact(repository: RAGRepository, root: Path) -> Dict[str, any]:
+    """Export all embedded chunks as a versioned index artifact.
+
+    Args:
+        repository: RAG repository
+        root: Artifact root directory (RAG_LOCAL_INDEX_PATH)
+
+    Returns:
+        The written manifest
+    """
+    generation = repository.get_content_generation()
+    rows = [row for row in repository.get_all() if row["embedding"] is not None]
+    return write_index_artifact(
+        root,
+        rows,
+        model=settings.embedding_model,
+        dimension=settings.embedding_dimension,
+        generation=generation,
+    )
+
+
 def main():
     """Main entry point for ingestion script."""
     parser = argparse.ArgumentParser(
@@ -269,6 +292,9 @@ Examples:
 
   # Clear existing embeddings first
   python -m scripts.ingest_content --clear
+
+  # Also export a memory-mapped index artifact for RAG_RETRIEVER_BACKEND=local
+  python -m scripts.ingest_content --export-index ../../.index
         """,
     )
     parser.add_argument(
@@ -304,6 +330,14 @@ Examples:
         default=10,
         help="Embedding batch size (default: 10)",
     )
+    parser.add_argument(
+        "--export-index",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Write a versioned index artifact (embeddings.npy, chunks.npy, texts.bin, "
+        "manifest.json) under DIR after ingestion",
+    )
 
     args = parser.parse_args()
 
@@ -383,6 +417,19 @@ Examples:
 
         # Print summary
         stats.print_summary()
+        if not args.dry_run:
+            # Every chunk write/delete bumps this; API retrieval caches key on it.
+            info(f"Content generation: {repository.get_content_generation()}")
+
+        if args.export_index:
+            if args.dry_run:
+                warning("DRY RUN MODE: skipping index artifact export")
+            else:
+                manifest = export_index_artifact(repository, args.export_index.resolve())
+                success(
+                    f"Exported index artifact {manifest['version']} "
+                    f"({manifest['rows']} rows) to {args.export_index}"
+                )
 
         # Exit with error if any errors occurred
         if stats.errors > 0:
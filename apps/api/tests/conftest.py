@@ -2,7 +2,10 @@ import asyncio
 
 import pytest
 
+from app.domain.orchestration.classifier_cache import reset_classifier_caches
 from app.infrastructure.db.session import init_db
+from app.infrastructure.services.genai_clients import reset_genai_clients, reset_request_pools
+from app.infrastructure.services.llm.factory import reset_llm_provider_pool
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -12,6 +15,21 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def shared_genai_state():
+    # SDK clients, LLM providers and classifier verdicts are process-wide;
+    # keep patched clients and cached verdicts from leaking across tests
+    reset_genai_clients()
+    reset_request_pools()
+    reset_llm_provider_pool()
+    reset_classifier_caches()
+    yield
+    reset_genai_clients()
+    reset_request_pools()
+    reset_llm_provider_pool()
+    reset_classifier_caches()
+
+
 @pytest.fixture(scope="session")
 async def db_engine():
     # Initialize DB engine (uses DATABASE_URL from env or .env)
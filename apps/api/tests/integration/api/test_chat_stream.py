@@ -35,7 +35,10 @@ async def test_chat_stream_emits_orchestrator_events_in_order():
     mock_orchestrator = MagicMock()
     mock_orchestrator.stream_chat = fake_stream_chat
 
-    with patch("app.api.routes.chat.ChatOrchestrator", return_value=mock_orchestrator):
+    with patch("app.api.routes.chat.get_orchestration_components"), patch(
+        "app.api.routes.chat.ChatOrchestrator",
+        return_value=mock_orchestrator,
+    ):
         async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
             async with client.stream(
                 "POST",
@@ -0,0 +1,383 @@
+"""Unit tests for the ADK native graph turn pipeline using stub runners."""
+
+import asyncio
+import random
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+from app.core.config import settings  # noqa: E402
+from app.core.quota_manager import QuotaManager  # noqa: E402
+from app.infrastructure.adk.graph_orchestrator import ADKNativeGraphOrchestrator  # noqa: E402
+from app.infrastructure.adk.tools import ADKToolbox  # noqa: E402
+from app.infrastructure.services.rag.types import RAGContext, RetrievalResult  # noqa: E402
+
+
+class _MockEmergencyDetector:
+    def __init__(
+        self, is_emergency: bool = False, delay: float | None = None, events: list | None = None
+    ):
+        self.is_emergency = is_emergency
+        self.delay = delay
+        self.events = events if events is not None else []
+
+    async def detect_emergency(self, message, conversation_history=None):
+        self.events.append("safety_start")
+        delay = self.delay if self.delay is not None else random.uniform(0, 0.005)
+        await asyncio.sleep(delay)
+        self.events.append("safety_end")
+        return self.is_emergency, ""
+
+
+class _MockMedicalDetector:
+    async def is_medical_query(self, message):
+        await asyncio.sleep(random.uniform(0, 0.005))
+        return False
+
+
+class _StubRagPipeline:
+    """Returns one citation derived from the query so leaks are detectable."""
+
+    async def retrieve_context(self, query, top_k=None, min_similarity=None, filters=None):
+        await asyncio.sleep(random.uniform(0, 0.01))
+        citation = f"content/{query}.md"
+        return RAGContext(
+            query=query,
+            results=[
+                RetrievalResult(
+                    chunk_id=query,
+                    text=f"Facts about {query}.",
+                    similarity=0.9,
+                    metadata={"content_path": citation},
+                )
+            ],
+            formatted_context=f"Facts about {query}.",
+            citations=[citation],
+            has_data=True,
+        )
+
+
+def _event(*, calls=None, text="", final=False):
+    parts = [SimpleNamespace(text=text)] if text else []
+    return SimpleNamespace(
+        get_function_calls=lambda: calls or [],
+        content=SimpleNamespace(parts=parts),
+        is_final_response=lambda: final,
+    )
+
+
+class _StubSessionService:
+    """Keeps per-session event lists, like ADK's InMemorySessionService."""
+
+    def __init__(self):
+        self.sessions: dict[str, list] = {}
+        self.created: list[str] = []
+        self.deleted: list[str] = []
+
+    async def create_session(self, *, app_name, user_id, session_id, state=None):
+        self.sessions[session_id] = []
+        self.created.append(session_id)
+
+    async def delete_session(self, *, app_name, user_id, session_id):
+        self.sessions.pop(session_id, None)
+        self.deleted.append(session_id)
+
+
+class _StubRouterRunner:
+    app_name = "stub_router"
+    session_service = _StubSessionService()
+
+    def __init__(self, delay: float | None = None, events: list | None = None):
+        self.delay = delay
+        self.events = events if events is not None else []
+        self.started_at: list[float] = []
+        self.cancelled = 0
+
+    async def run_async(self, *, user_id, session_id, new_message):
+        self.started_at.append(time.perf_counter())
+        self.events.append("route_start")
+        delay = self.delay if self.delay is not None else random.uniform(0, 0.01)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        self.events.append("route_end")
+        yield _event(calls=[SimpleNamespace(name="route_trip_specialist", args={})])
+
+
+class _StubSpecialistRunner:
+    """Mimics ADK by executing the RAG tool in a child task mid-stream."""
+
+    app_name = "stub_specialist"
+    session_service = _StubSessionService()
+
+    def __init__(self, toolbox: ADKToolbox):
+        self.toolbox = toolbox
+
+    async def run_async(self, *, user_id, session_id, new_message):
+        query = new_message.parts[0].text
+        yield _event(calls=[SimpleNamespace(name="rag_search_tool", args={"query": query})])
+        await asyncio.create_task(self.toolbox.rag_search_tool(query=query))
+        await asyncio.sleep(random.uniform(0, 0.01))
+        yield _event(text=f"Answer for {query}", final=True)
+
+
+def _build_graph(monkeypatch, *, emergency_detector=None, router=None, quota_manager=None):
+    monkeypatch.setattr(settings, "gemini_api_key", settings.gemini_api_key or "test-key")
+    toolbox = ADKToolbox(
+        rag_pipeline=_StubRagPipeline(),
+        emergency_detector=emergency_detector or _MockEmergencyDetector(),
+        medical_detector=_MockMedicalDetector(),
+    )
+    graph = ADKNativeGraphOrchestrator(tools=toolbox)
+    graph.quota_manager = quota_manager or SimpleNamespace(
+        reserve=AsyncMock(), release=lambda decision: False, snapshot_all=lambda: {}
+    )
+    toolbox.quota_manager = graph.quota_manager
+    graph.router_runner = router or _StubRouterRunner()
+    specialist = _StubSpecialistRunner(toolbox)
+    graph.specialist_runners = {name: specialist for name in graph.specialist_runners}
+    return graph
+
+
+@pytest.fixture
+def shared_graph(monkeypatch):
+    return _build_graph(monkeypatch)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_run_turns_never_leak_citations(shared_graph):
+    messages = [f"query-{i}" for i in range(300)]
+
+    results = await asyncio.gather(
+        *(
+            shared_graph.run_turn(
+                message=message,
+                session_id=f"session-{message}",
+                conversation_history=[],
+            )
+            for message in messages
+        )
+    )
+
+    for message, result in zip(messages, results, strict=True):
+        assert result.citations == [f"content/{message}.md"]
+        assert result.state_updates["rag_invoked"] is True
+        assert result.message.startswith(f"Answer for {message}")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_stream_turns_never_leak_citations(shared_graph):
+    async def collect(message: str):
+        citations = []
+        async for event in shared_graph.stream_turn(
+            message=message,
+            session_id=f"session-{message}",
+            conversation_history=[],
+        ):
+            if event["type"] == "citation":
+                citations.append(event["content"])
+        return citations
+
+    messages = [f"stream-{i}" for i in range(100)]
+    results = await asyncio.gather(*(collect(message) for message in messages))
+
+    for message, citations in zip(messages, results, strict=True):
+        assert citations == [f"content/{message}.md"]
+
+
+@pytest.mark.asyncio
+async def test_safety_and_routing_overlap(monkeypatch):
+    events: list[str] = []
+    router = _StubRouterRunner(delay=0.1, events=events)
+    graph = _build_graph(
+        monkeypatch,
+        emergency_detector=_MockEmergencyDetector(delay=0.1, events=events),
+        router=router,
+    )
+
+    result = await graph.run_turn(
+        message="Best sites in Tioman?",
+        session_id="overlap",
+        conversation_history=[],
+    )
+
+    latency = result.trace.latency_ms
+    assert result.route_decision.route == "trip_specialist"
+    assert latency["safety_classification_ms"] >= 100
+    assert latency["route_ms"] >= 100
+    # Both phases start before either finishes; serial execution would not interleave
+    assert sorted(events[:2]) == ["route_start", "safety_start"]
+    assert sorted(events[2:]) == ["route_end", "safety_end"]
+
+
+@pytest.mark.asyncio
+async def test_emergency_cancels_router_and_releases_quota(monkeypatch):
+    router = _StubRouterRunner(delay=30)
+    quota_manager = QuotaManager(
+        llm_rpm_limit=100,
+        llm_tpm_limit=1_000_000,
+        llm_rpd_limit=1_000,
+        embedding_rpm_limit=100,
+        embedding_tpm_limit=1_000_000,
+        embedding_rpd_limit=1_000,
+        window_seconds=60,
+        enforcement_enabled=True,
+    )
+    graph = _build_graph(
+        monkeypatch,
+        emergency_detector=_MockEmergencyDetector(is_emergency=True, delay=0.02),
+        router=router,
+        quota_manager=quota_manager,
+    )
+
+    result = await asyncio.wait_for(
+        graph.run_turn(
+            message="I feel dizzy after diving",
+            session_id="emergency",
+            conversation_history=[],
+        ),
+        timeout=5,
+    )
+
+    assert result.route_decision.route == "safety_specialist"
+    assert result.route_decision.reason == "emergency_safety_classification"
+    assert result.safety_classification.is_emergency is True
+    assert router.cancelled == 1
+    # Only the specialist reservation remains; the router's was released.
+    assert quota_manager.snapshot("text_generation").rpm_used == 1
+
+
+@pytest.mark.asyncio
+async def test_rag_prefetch_is_served_per_turn(monkeypatch):
+    monkeypatch.setattr(settings, "adk_rag_prefetch_enabled", True)
+    graph = _build_graph(monkeypatch)
+    messages = [f"query-{i}" for i in range(100)]
+
+    results = await asyncio.gather(
+        *(
+            graph.run_turn(
+                message=message,
+                session_id=f"session-{i}",
+                conversation_history=[],
+            )
+            for i, message in enumerate(messages)
+        )
+    )
+
+    for message, result in zip(messages, results, strict=True):
+        assert result.citations == [f"content/{message}.md"]
+        assert result.trace.rag_prefetch["status"] == "hit"
+    stats = graph.tools.get_prefetch_stats()
+    assert stats["started"] == 100
+    assert stats["hits"] == 100
+    assert stats["wasted"] == 0
+
+
+class _PregroundedSpecialistRunner:
+    """Answers in one generation from the context injected into the prompt."""
+
+    app_name = "stub_pregrounded_specialist"
+    session_service = _StubSessionService()
+
+    def __init__(self):
+        self.prompts: list[str] = []
+        self.history_seen: list[int] = []
+
+    async def run_async(self, *, user_id, session_id, new_message):
+        prompt = new_message.parts[0].text
+        self.prompts.append(prompt)
+        events = self.session_service.sessions[session_id]
+        self.history_seen.append(len(events))
+        events.append(new_message)
+        event = _event(text="Answer from context", final=True)
+        event.usage_metadata = SimpleNamespace(
+            prompt_token_count=len(prompt.split()), candidates_token_count=3
+        )
+        yield event
+
+
+@pytest.mark.asyncio
+async def test_pregrounded_mode_injects_filtered_context(monkeypatch):
+    graph = _build_graph(monkeypatch)
+    graph.grounding_mode = "pregrounded"
+    retrieve_calls = []
+    original_retrieve = graph.tools.rag_pipeline.retrieve_context
+
+    async def _recording_retrieve(query, top_k=None, min_similarity=None, filters=None):
+        retrieve_calls.append(filters)
+        return await original_retrieve(query, top_k=top_k, filters=filters)
+
+    graph.tools.rag_pipeline.retrieve_context = _recording_retrieve
+    specialist = _PregroundedSpecialistRunner()
+    graph.specialist_runners = {name: specialist for name in graph.specialist_runners}
+
+    result = await graph.run_turn(
+        message="tioman", session_id="s1", conversation_history=[]
+    )
+
+    assert retrieve_calls == [{"doc_type": ["destination", "dive_site"]}]
+    assert specialist.prompts[0].startswith("Verified context:\nFacts about tioman.")
+    assert result.citations == ["content/tioman.md"]
+    assert result.state_updates["rag_invoked"] is True
+    assert result.policy_validation.reason != "rag_not_invoked_for_factual_route"
+    assert result.trace.grounding_mode == "pregrounded"
+    assert result.trace.token_usage["llm_calls"] == 1
+    assert "rag_search_tool" not in result.trace.tools_called
+
+
+@pytest.mark.asyncio
+async def test_turns_on_one_session_id_do_not_share_adk_history(monkeypatch):
+    graph = _build_graph(monkeypatch)
+    graph.grounding_mode = "pregrounded"
+    specialist = _PregroundedSpecialistRunner()
+    specialist.session_service = _StubSessionService()
+    graph.specialist_runners = {name: specialist for name in graph.specialist_runners}
+
+    for message in ("tioman", "redang"):
+        await graph.run_turn(message=message, session_id="s1", conversation_history=[])
+
+    sessions = specialist.session_service
+    assert specialist.history_seen == [0, 0]
+    assert len(set(sessions.created)) == 2
+    assert all(session_id.startswith("s1:") for session_id in sessions.created)
+    assert sessions.deleted == sessions.created
+    assert sessions.sessions == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filtered_has_data", [True, False])
+async def test_pregrounded_filtered_route_with_prefetch(monkeypatch, filtered_has_data):
+    monkeypatch.setattr(settings, "adk_rag_prefetch_enabled", True)
+    graph = _build_graph(monkeypatch)
+    graph.grounding_mode = "pregrounded"
+    retrieve_calls = []
+    original_retrieve = graph.tools.rag_pipeline.retrieve_context
+
+    async def _recording_retrieve(query, top_k=None, min_similarity=None, filters=None):
+        retrieve_calls.append(filters)
+        context = await original_retrieve(query, top_k=top_k, filters=filters)
+        if filters and not filtered_has_data:
+            return RAGContext(query=query, results=[], formatted_context="", has_data=False)
+        return context
+
+    graph.tools.rag_pipeline.retrieve_context = _recording_retrieve
+    specialist = _PregroundedSpecialistRunner()
+    graph.specialist_runners = {name: specialist for name in graph.specialist_runners}
+
+    result = await graph.run_turn(message="tioman", session_id="s1", conversation_history=[])
+
+    # Prefetch (unfiltered) plus the route-filtered retrieval; the widen-once
+    # fallback is served from the prefetch instead of a third retrieval
+    assert retrieve_calls == [{}, {"doc_type": ["destination", "dive_site"]}]
+    assert result.citations == ["content/tioman.md"]
+    expected_status = "unused" if filtered_has_data else "hit"
+    assert result.trace.rag_prefetch["status"] == expected_status
+    stats = graph.tools.get_prefetch_stats()
+    assert stats["misses"] == 0
+    assert (stats["hits"], stats["wasted"]) == ((0, 1) if filtered_has_data else (1, 0))
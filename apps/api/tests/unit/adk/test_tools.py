@@ -133,3 +133,82 @@ def test_response_policy_allows_grounded_or_non_factual_answers():
 
     assert grounded["policy_enforced"] is False
     assert conversational["policy_enforced"] is False
+
+
+def _prefetch_pipeline(embeddings):
+    rag_context = RAGContext(
+        query="tioman",
+        results=[],
+        formatted_context="Tioman has sites from 9m to 25m.",
+        citations=["content/destinations/tioman.md"],
+        has_data=True,
+    )
+    return SimpleNamespace(
+        retrieve_context=AsyncMock(return_value=rag_context),
+        embed_query=AsyncMock(side_effect=lambda query: embeddings[query]),
+    )
+
+
+@pytest.mark.asyncio
+async def test_rag_prefetch_serves_close_query():
+    pipeline = _prefetch_pipeline(
+        {
+            "Where to dive in Tioman?": [1.0, 0.0],
+            "Tioman dive sites": [0.99, 0.05],
+        }
+    )
+    toolbox = ADKToolbox(
+        rag_pipeline=pipeline,
+        emergency_detector=_MockEmergencyDetector(),
+        medical_detector=_MockMedicalDetector(),
+    )
+    turn = toolbox.set_turn_context(
+        session_id="s1", message="Where to dive in Tioman?", history=[]
+    )
+    toolbox.start_rag_prefetch(turn, "Where to dive in Tioman?")
+
+    result = await toolbox.rag_search_tool("Tioman dive sites")
+    trace = toolbox.finish_rag_prefetch(turn)
+
+    assert result["citations"] == ["content/destinations/tioman.md"]
+    assert pipeline.retrieve_context.await_count == 1
+    assert trace["status"] == "hit"
+    assert trace["stats"]["hits"] == 1
+    assert trace["stats"]["hit_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_rag_prefetch_miss_and_waste_are_counted():
+    pipeline = _prefetch_pipeline(
+        {
+            "Where to dive in Tioman?": [1.0, 0.0],
+            "Open Water depth limit": [0.0, 1.0],
+        }
+    )
+    toolbox = ADKToolbox(
+        rag_pipeline=pipeline,
+        emergency_detector=_MockEmergencyDetector(),
+        medical_detector=_MockMedicalDetector(),
+    )
+
+    missed = toolbox.set_turn_context(
+        session_id="s1", message="Where to dive in Tioman?", history=[]
+    )
+    toolbox.start_rag_prefetch(missed, "Where to dive in Tioman?")
+    await toolbox.rag_search_tool("Open Water depth limit")
+    assert toolbox.finish_rag_prefetch(missed)["status"] == "miss"
+    assert pipeline.retrieve_context.await_count == 2
+
+    unused = toolbox.set_turn_context(
+        session_id="s2", message="Where to dive in Tioman?", history=[]
+    )
+    toolbox.start_rag_prefetch(unused, "Where to dive in Tioman?")
+    assert toolbox.finish_rag_prefetch(unused)["status"] == "unused"
+    # Finishing twice must not double count.
+    toolbox.finish_rag_prefetch(unused)
+
+    stats = toolbox.get_prefetch_stats()
+    assert stats["started"] == 2
+    assert stats["misses"] == 1
+    assert stats["wasted"] == 2
+    assert stats["waste_rate"] == 1.0
@@ -110,3 +110,35 @@ async def test_wait_for_capacity_tracks_wait_time(monkeypatch):
     assert second.wait_seconds >= 10.0
     assert sleep_calls
 
+
+
+@pytest.mark.asyncio
+async def test_release_returns_cancelled_reservation(monkeypatch):
+    now = {"value": 0.0}
+    monkeypatch.setattr("app.core.quota_manager.time.time", lambda: now["value"])
+
+    manager = QuotaManager(
+        llm_rpm_limit=1,
+        llm_tpm_limit=100,
+        llm_rpd_limit=10,
+        embedding_rpm_limit=10,
+        embedding_tpm_limit=100,
+        embedding_rpd_limit=100,
+        window_seconds=60,
+        enforcement_enabled=True,
+    )
+
+    reservation = await manager.reserve("text_generation", 40, wait_for_capacity=False)
+    assert reservation.allowed is True
+    assert manager.snapshot("text_generation").rpm_used == 1
+
+    assert manager.release(reservation) is True
+    snapshot = manager.snapshot("text_generation")
+    assert snapshot.rpm_used == 0
+    assert snapshot.tpm_used == 0
+    assert snapshot.rpd_used == 0
+
+    # Releasing twice is a no-op and capacity is usable again.
+    assert manager.release(reservation) is False
+    again = await manager.reserve("text_generation", 40, wait_for_capacity=False)
+    assert again.allowed is True
@@ -0,0 +1,92 @@
+"""Unit tests for single-flight coalescing."""
+
+import asyncio
+
+import pytest
+
+from app.core.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_execution():
+    flight = SingleFlight("test")
+    release = asyncio.Event()
+    executions = 0
+
+    async def call():
+        nonlocal executions
+        executions += 1
+        await release.wait()
+        return "result"
+
+    waiters = [asyncio.create_task(flight.do("key", call)) for _ in range(5)]
+    other = asyncio.create_task(flight.do("other", call))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters, other) == ["result"] * 6
+    assert executions == 2
+    assert flight.get_stats() == {"name": "test", "calls": 2, "coalesced": 4, "in_flight": 0}
+
+    # Finished calls are released; the next call runs fresh
+    await flight.do("key", call)
+    assert executions == 3
+
+
+@pytest.mark.asyncio
+async def test_exception_reaches_every_waiter():
+    flight = SingleFlight("test")
+
+    async def call():
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        flight.do("key", call), flight.do("key", call), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert flight.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_keeps_call_running_for_others():
+    flight = SingleFlight("test")
+    release = asyncio.Event()
+
+    async def call():
+        await release.wait()
+        return 42
+
+    leader = asyncio.create_task(flight.do("key", call))
+    follower = asyncio.create_task(flight.do("key", call))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await follower == 42
+    assert leader.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_call_is_cancelled_when_every_waiter_is_cancelled():
+    flight = SingleFlight("test")
+    cancelled = asyncio.Event()
+
+    async def call():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    waiters = [asyncio.create_task(flight.do("key", call)) for _ in range(2)]
+    await asyncio.sleep(0)
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    assert flight.get_stats()["in_flight"] == 0
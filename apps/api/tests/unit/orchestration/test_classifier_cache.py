@@ -0,0 +1,133 @@
+"""
+Unit tests for the classifier verdict cache.
+
+Tests normalized-message hits, prompt-version invalidation, TTL/LRU bounds,
+persistence and detector wiring.
+"""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.domain.orchestration.classifier_cache import (
+    ClassifierCache,
+    get_classifier_cache,
+    get_classifier_cache_stats,
+    prompt_version,
+    reset_classifier_caches,
+)
+from app.domain.orchestration.emergency_detector_hybrid import EmergencyDetector
+from app.domain.orchestration.medical_detector import MedicalQueryDetector
+
+
+class TestClassifierCache:
+    """Test cache keys, bounds and stats."""
+
+    def test_normalized_message_hits(self):
+        cache = ClassifierCache("medical_classifier", prompt_version("prompt", "model"))
+        cache.set("Tell me about Tioman", False)
+
+        assert cache.get("  tell me ABOUT tioman ") is False
+        assert cache.get("Tell me about Redang") is None
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_prompt_or_model_change_misses(self):
+        cache = get_classifier_cache("medical_classifier", "prompt v1", "model-a")
+        cache.set("Tell me about Tioman", True)
+
+        assert get_classifier_cache("medical_classifier", "prompt v1", "model-a") is cache
+        assert get_classifier_cache("medical_classifier", "prompt v2", "model-a").get("Tell me about Tioman") is None
+        assert get_classifier_cache("medical_classifier", "prompt v1", "model-b").get("Tell me about Tioman") is None
+
+    def test_ttl_and_lru_eviction(self):
+        cache = ClassifierCache("emergency_classifier", "v", max_size=2, ttl_seconds=60)
+        cache.set("a", True)
+        cache.set("b", False)
+        cache.get("a")
+        cache.set("c", True)
+
+        assert cache.get("b") is None
+        assert cache.get_stats()["evictions"] == 1
+
+        with patch("app.domain.orchestration.classifier_cache.time.time", return_value=10**12):
+            assert cache.get("a") is None
+
+    def test_verdicts_persist_across_restarts(self, tmp_path):
+        with patch.object(settings, "safety_classifier_cache_path", str(tmp_path / "classifier.sqlite3")):
+            get_classifier_cache("emergency_classifier", "prompt", "model").set("I feel dizzy", True)
+            reset_classifier_caches()
+
+            cache = get_classifier_cache("emergency_classifier", "prompt", "model")
+            assert cache.get("I feel dizzy") is True
+            assert cache.get_stats()["store_hits"] == 1
+            # Other classifiers and prompt versions don't see the entry
+            assert get_classifier_cache("medical_classifier", "prompt", "model").get("I feel dizzy") is None
+            assert get_classifier_cache("emergency_classifier", "prompt v2", "model").get("I feel dizzy") is None
+
+    @pytest.mark.asyncio
+    async def test_async_store_calls_run_off_the_event_loop(self, tmp_path):
+        with patch.object(settings, "safety_classifier_cache_path", str(tmp_path / "classifier.sqlite3")):
+            cache = get_classifier_cache("emergency_classifier", "prompt", "model")
+            threads = []
+            for name in ("get", "set"):
+                original = getattr(cache.store, name)
+
+                def record(*args, _original=original):
+                    threads.append(threading.get_ident())
+                    return _original(*args)
+
+                setattr(cache.store, name, record)
+
+            await cache.aset("I feel dizzy", True)
+            cache.clear()
+            assert await cache.aget("I feel dizzy") is True
+            assert len(threads) == 2
+            assert threading.get_ident() not in threads
+
+    def test_disabled(self):
+        with patch.object(settings, "safety_classifier_cache_enabled", False):
+            assert get_classifier_cache("medical_classifier", "prompt", "model") is None
+
+
+def _llm(content):
+    return SimpleNamespace(generate=AsyncMock(return_value=SimpleNamespace(content=content)))
+
+
+@pytest.mark.asyncio
+async def test_medical_detector_reuses_llm_verdict():
+    llm = _llm('{"is_medical": true}')
+    first = MedicalQueryDetector(llm_provider=llm, use_local_classifier=False)
+    second = MedicalQueryDetector(llm_provider=llm, use_local_classifier=False)
+
+    assert await first.is_medical_query("Tell me about Tioman") is True
+    assert await second.is_medical_query("tell me about tioman") is True
+    llm.generate.assert_awaited_once()
+    assert get_classifier_cache_stats()["medical_classifier"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_medical_detector_does_not_cache_error_fallback():
+    llm = SimpleNamespace(generate=AsyncMock(side_effect=RuntimeError("quota")))
+    detector = MedicalQueryDetector(llm_provider=llm, use_local_classifier=False)
+
+    assert await detector.is_medical_query("Tell me about Tioman") is False
+    assert await detector.is_medical_query("Tell me about Tioman") is False
+    assert llm.generate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_emergency_detector_reuses_llm_verdict():
+    detector = EmergencyDetector(use_local_classifier=False)
+    detector._llm = _llm('{"is_emergency": false}')
+
+    for _ in range(3):
+        is_emergency, _ = await detector.detect_emergency("Can diving cause hearing loss?")
+        assert is_emergency is False
+    detector._llm.generate.assert_awaited_once()
+    stats = detector.get_stats()
+    assert stats["llm_calls"] == 1
+    assert stats["cache"]["hits"] == 2
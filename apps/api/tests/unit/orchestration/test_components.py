@@ -0,0 +1,59 @@
+"""
+Unit tests for app-lifetime orchestration components.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from app.domain.orchestration import components as components_module
+from app.domain.orchestration.components import (
+    OrchestrationComponents,
+    get_orchestration_components,
+    reset_orchestration_components,
+)
+from app.domain.orchestration.orchestrator import ChatOrchestrator
+
+
+def _stub_components() -> OrchestrationComponents:
+    return OrchestrationComponents(
+        rag_pipeline=MagicMock(),
+        context_builder=MagicMock(),
+        agent_router=MagicMock(),
+        mode_detector=MagicMock(),
+        response_formatter=MagicMock(),
+        emergency_detector=MagicMock(),
+        native_graph_orchestrator=MagicMock(),
+        orchestrator=MagicMock(),
+    )
+
+
+def test_components_singleton_is_built_once():
+    """Test the container is built once and reused."""
+    reset_orchestration_components()
+    stub = _stub_components()
+    try:
+        with patch.object(
+            components_module.OrchestrationComponents, "build", return_value=stub
+        ) as mock_build:
+            first = get_orchestration_components()
+            second = get_orchestration_components()
+
+        assert first is stub
+        assert second is stub
+        assert mock_build.call_count == 1
+    finally:
+        reset_orchestration_components()
+
+
+def test_chat_orchestrator_binds_only_db_session_per_request():
+    """Test orchestrators share heavy components but not DB-bound state."""
+    shared = _stub_components()
+
+    first = ChatOrchestrator(MagicMock(), components=shared)
+    second = ChatOrchestrator(MagicMock(), components=shared)
+
+    assert first.native_graph_orchestrator is second.native_graph_orchestrator
+    assert first.orchestrator is second.orchestrator
+    assert first.context_builder is shared.context_builder
+    assert first.emergency_detector is shared.emergency_detector
+    assert first.session_manager is not second.session_manager
+    assert first.db_session is not second.db_session
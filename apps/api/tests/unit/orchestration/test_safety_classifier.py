@@ -0,0 +1,140 @@
+"""
+Unit tests for the local safety classifier tier.
+
+Tests confident local answers and LLM fallback in the ambiguous band.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.domain.orchestration.emergency_detector_hybrid import EmergencyDetector
+from app.domain.orchestration.medical_detector import MedicalQueryDetector
+from app.domain.orchestration.safety_classifier import LocalSafetyClassifier
+from scripts.evaluate_safety_classifier import DEFAULT_CASES, load_cases
+
+
+@pytest.fixture
+def classifier():
+    return LocalSafetyClassifier(medical_confidence=0.85, emergency_confidence=0.95)
+
+
+class TestLocalSafetyClassifier:
+    """Test local classifier decisions."""
+
+    def test_confident_medical_and_non_medical(self, classifier):
+        medical = classifier.classify_medical("Can I dive with asthma?")
+        assert medical.label is True
+        assert "condition" in medical.features
+
+        trip = classifier.classify_medical("What wetsuit should I pack for a trip to Sipadan?")
+        assert trip.label is False
+        assert trip.confidence >= 0.85
+
+    def test_unknown_wording_is_left_to_llm(self, classifier):
+        decision = classifier.classify_medical("Tell me about Tioman")
+        assert decision.label is None
+        assert 0.15 < decision.probability < 0.85
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Is the water cold in Bali in July?",
+            "Is Semporna the heart of Sabah diving?",
+            "Does my wetsuit fit too loosely for cold water?",
+        ],
+    )
+    def test_ambiguous_everyday_words_are_not_medical(self, classifier, message):
+        assert classifier.classify_medical(message).label is not True
+
+    def test_emergency_band(self, classifier):
+        assert classifier.classify_emergency("My buddy is unconscious on the boat").label is True
+        # Confirm-only: a low score never clears a symptom-bearing message
+        assert classifier.classify_emergency("What causes dizziness after a dive?").label is None
+        # First-person symptom without acute context stays with the LLM
+        assert classifier.classify_emergency("I have a severe headache and blurred vision").label is None
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "I am just curious what causes chest pain in divers",
+            "I am writing a help article about chest pain after diving",
+            "I read that dizzy spells are common after the dive, is that true?",
+        ],
+    )
+    def test_first_person_without_symptom_is_not_confirmed(self, classifier, message):
+        decision = classifier.classify_emergency(message)
+        assert decision.label is None
+        assert "first_person_symptom" not in decision.features
+
+    def test_no_fixture_non_emergency_reaches_confirm_threshold(self, classifier):
+        cases = load_cases(DEFAULT_CASES)
+        negatives = [case["query"] for case in cases if not case["is_emergency"]]
+        assert max(classifier.classify_emergency(query).probability for query in negatives) < 0.8
+
+
+def _llm(content):
+    return SimpleNamespace(generate=AsyncMock(return_value=SimpleNamespace(content=content)))
+
+
+@pytest.mark.asyncio
+async def test_medical_detector_calls_llm_only_when_ambiguous():
+    llm = _llm('{"is_medical": false}')
+    detector = MedicalQueryDetector(llm_provider=llm, use_local_classifier=True)
+
+    assert await detector.is_medical_query("Is it safe to dive if I have diabetes?") is True
+    assert await detector.is_medical_query("Which regulator should I buy for my Open Water course?") is False
+    llm.generate.assert_not_awaited()
+
+    assert await detector.is_medical_query("Tell me about Tioman") is False
+    llm.generate.assert_awaited_once()
+    stats = detector.get_stats()
+    assert (stats["local_decisions"], stats["llm_calls"]) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_curious_first_person_question_reaches_llm():
+    detector = EmergencyDetector(use_local_classifier=True)
+    detector._llm = _llm('{"is_emergency": false}')
+
+    is_emergency, _ = await detector.detect_emergency("I am just curious what causes chest pain in divers")
+
+    assert is_emergency is False
+    assert detector.get_stats()["local_decisions"] == 0
+    detector._llm.generate.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_emergency_detector_confirms_locally_and_never_clears():
+    detector = EmergencyDetector(use_local_classifier=True)
+    detector._llm = _llm('{"is_emergency": false}')
+
+    is_emergency, response = await detector.detect_emergency("My buddy is unconscious on the boat")
+    assert is_emergency is True
+    assert "EMERGENCY" in response
+    detector._llm.generate.assert_not_awaited()
+
+    # Educational questions go to the LLM
+    is_emergency, _ = await detector.detect_emergency("Can diving cause hearing loss?")
+    assert is_emergency is False
+    assert detector.get_stats()["llm_calls"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "message",
+    [
+        "What should we do? diver unconscious, not breathing",
+        "Is it normal to feel dizzy and numb in my arm after surfacing?",
+        "Does weakness in my legs mean DCS? Surfaced 20 min ago",
+    ],
+)
+async def test_question_phrased_emergencies_reach_llm(message):
+    detector = EmergencyDetector(use_local_classifier=True)
+    detector._llm = SimpleNamespace(generate=AsyncMock(side_effect=RuntimeError("unavailable")))
+
+    # LLM failure falls back to emergency; the local tier must not pre-empt it
+    is_emergency, _ = await detector.detect_emergency(message)
+    assert is_emergency is True
+    detector._llm.generate.assert_awaited_once()
@@ -0,0 +1,25 @@
+"""Unit tests for benchmark_cache_memory script."""
+
+import pytest
+
+from scripts.benchmark_cache_memory import measure_cache_memory, measure_cache_reads
+
+
+def test_slab_cache_holds_less_memory_than_lists():
+    list_run = measure_cache_memory("list", entries=200, dimension=64, trace=True)
+    slab_run = measure_cache_memory("slab", entries=200, dimension=64, trace=True)
+
+    assert slab_run["traced_bytes"] < list_run["traced_bytes"] / 3
+    assert slab_run["entries"] == 200
+
+
+def test_unknown_variant_rejected():
+    with pytest.raises(ValueError, match="Unknown variant"):
+        measure_cache_memory("numpy", entries=1, dimension=1)
+
+
+def test_read_timings_reported():
+    reads = measure_cache_reads(entries=50, dimension=64, reads=200)
+
+    assert reads["get_us"] > reads["copy_us"] > 0
+    assert reads["view_us"] > 0
@@ -0,0 +1,20 @@
+"""Unit tests for benchmark_embeddings script."""
+
+import pytest
+
+from app.core.quota_manager import reset_quota_manager
+from scripts.benchmark_embeddings import run_concurrency_benchmark
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [1, 3])
+async def test_requests_run_concurrently_up_to_the_limit(concurrency):
+    reset_quota_manager()
+    texts = [f"text {i}" for i in range(500)]  # 5 requests of MAX_BATCH_SIZE
+
+    run = await run_concurrency_benchmark(concurrency, texts=texts, latency_seconds=0.05)
+
+    assert run["requests"] == 5
+    assert run["peak_in_flight"] == concurrency
+    assert run["texts_per_s"] > 0
+    reset_quota_manager()
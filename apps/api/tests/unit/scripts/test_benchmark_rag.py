@@ -10,9 +10,12 @@ import pytest
 from scripts.benchmark_rag import (
     BenchmarkResult,
     calculate_percentile,
+    compare_backends,
     evaluate_quality_gates,
     load_queries,
+    recall_at_k,
     run_benchmark_query,
+    summarize_run,
 )
 
 
@@ -210,3 +213,27 @@ def test_evaluate_quality_gates_reports_failures():
         max_p95_latency_ms=500.0,
     )
     assert len(failures) == 3
+
+
+def test_compare_backends_reports_speedup_and_overlap():
+    def _result(paths, latency):
+        result = BenchmarkResult("q")
+        result.result_paths = paths
+        result.latency_ms = latency
+        return result
+
+    pgvector_results = [_result(["a.md", "b.md"], 40.0), _result(["c.md"], 60.0)]
+    local_results = [_result(["a.md", "x.md"], 4.0), _result(["c.md"], 6.0)]
+
+    comparison = compare_backends(
+        (summarize_run(pgvector_results, [40.0, 60.0]), pgvector_results),
+        (summarize_run(local_results, [4.0, 6.0]), local_results),
+    )
+
+    assert comparison["p50_speedup"] == pytest.approx(10.0)
+    assert comparison["mean_result_overlap"] == pytest.approx(0.75)
+
+
+def test_recall_at_k():
+    assert recall_at_k(["a", "b", "x"], ["a", "b", "c"]) == pytest.approx(2 / 3)
+    assert recall_at_k(["a"], []) is None
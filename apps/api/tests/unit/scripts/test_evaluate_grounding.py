@@ -1,6 +1,9 @@
 """Unit tests for grounding evaluation script."""
 
-from scripts.evaluate_grounding import evaluate_cases
+from types import SimpleNamespace
+
+from app.infrastructure.adk.types import SafetyClassification
+from scripts.evaluate_grounding import evaluate_cases, summarize_mode_turns
 
 
 def test_evaluate_cases_metrics():
@@ -58,3 +61,39 @@ def test_evaluate_cases_quality_thresholds():
     result = evaluate_cases(cases)
     assert result["citation_rate"] >= 0.6
     assert result["unsupported_claim_rate"] <= 0.4
+
+
+def test_summarize_mode_turns():
+    def _turn(message, citations, total_ms, llm_calls, enforced):
+        return SimpleNamespace(
+            message=message,
+            citations=citations,
+            safety_classification=SafetyClassification(),
+            policy_validation=SimpleNamespace(policy_enforced=enforced),
+            trace=SimpleNamespace(
+                latency_ms={"total_ms": total_ms, "specialist_ms": total_ms / 2},
+                token_usage={"llm_calls": llm_calls, "prompt_tokens": 100, "output_tokens": 20},
+            ),
+        )
+
+    summary = summarize_mode_turns(
+        [
+            _turn("Open Water depth limit is 18 meters.", ["content/ow.md"], 800.0, 1, False),
+            _turn("This site has 30 meter visibility year round.", [], 1200.0, 2, True),
+        ]
+    )
+
+    assert summary["turns"] == 2
+    assert summary["mean_total_ms"] == 1000.0
+    assert summary["mean_llm_calls"] == 1.5
+    assert summary["citation_rate"] == 0.5
+    assert summary["policy_enforced_rate"] == 0.5
+
+
+def test_summarize_mode_turns_empty():
+    summary = summarize_mode_turns([])
+
+    assert summary["turns"] == 0
+    assert summary["mean_total_ms"] == 0.0
+    assert summary["p95_total_ms"] == 0.0
+    assert {"mean_llm_calls", "citation_rate", "policy_enforced_rate"} <= summary.keys()
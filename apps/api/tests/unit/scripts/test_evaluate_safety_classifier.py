@@ -0,0 +1,30 @@
+"""Unit tests for safety classifier evaluation script."""
+
+import pytest
+
+from scripts.evaluate_safety_classifier import (
+    DEFAULT_CASES,
+    evaluate_local,
+    load_cases,
+    run_replay,
+)
+
+
+def test_local_decisions_match_fixture_labels():
+    report = evaluate_local(load_cases(DEFAULT_CASES))
+
+    # The emergency model is confirm-only, so it decides fewer cases locally
+    for model, min_coverage in (("medical", 0.5), ("emergency", 0.25)):
+        assert report[model]["local_coverage"] > min_coverage
+        assert report[model]["errors"] == []
+
+
+@pytest.mark.asyncio
+async def test_replay_reports_llm_calls_saved():
+    cases = load_cases(DEFAULT_CASES)
+
+    report = await run_replay(cases, llm_latency_seconds=0.0)
+
+    assert report["local_first"]["llm_calls"] < report["llm_only"]["llm_calls"]
+    assert report["llm_calls_saved_per_turn"] > 0.5
+    assert report["local_first"]["accuracy"] >= report["llm_only"]["accuracy"]
@@ -4,9 +4,13 @@ Unit tests for embedding provider.
 Tests embedding generation with mocked API calls.
 """
 
+import asyncio
+import sqlite3
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from google.genai import errors as genai_errors
 
 from app.core.quota_manager import (
     QuotaExceededError,
@@ -18,6 +22,7 @@ from app.infrastructure.services.embeddings import (
     create_embedding_provider_from_env,
 )
 from app.infrastructure.services.embeddings.cache import EmbeddingCache
+from app.infrastructure.services.embeddings.persistent_cache import SqliteEmbeddingStore
 
 
 @pytest.fixture
@@ -73,13 +78,38 @@ class TestGeminiEmbeddingProvider:
         # Mock the embed_content method
         mock_response = MagicMock()
         mock_response.embeddings = [MagicMock(values=mock_embedding)]
-        gemini_provider.client.models.embed_content = MagicMock(return_value=mock_response)
+        gemini_provider.client.aio.models.embed_content = AsyncMock(return_value=mock_response)
 
         result = await gemini_provider.embed_text("test text")
 
         assert result == mock_embedding
         assert len(result) == 768
-        gemini_provider.client.models.embed_content.assert_called_once()
+        gemini_provider.client.aio.models.embed_content.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_embed_text_calls_coalesce(self, mock_embedding):
+        """A burst of identical uncached queries makes one API request."""
+        with patch("google.genai.Client"):
+            reset_quota_manager()
+            provider = GeminiEmbeddingProvider(api_key="test-key")
+            release = asyncio.Event()
+
+            async def embed(text):
+                await release.wait()
+                return mock_embedding
+
+            provider._embed_with_retry = AsyncMock(side_effect=embed)
+            coalesced_before = provider._in_flight.coalesced
+
+            burst = [asyncio.create_task(provider.embed_text("trending question")) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*burst)
+            reset_quota_manager()
+
+        assert results == [mock_embedding] * 3
+        provider._embed_with_retry.assert_awaited_once_with("trending question")
+        assert provider._in_flight.coalesced - coalesced_before == 2
 
     @pytest.mark.asyncio
     async def test_embed_text_empty_raises(self, gemini_provider):
@@ -113,26 +143,130 @@ class TestGeminiEmbeddingProvider:
         # Mock the embed_content method with wrong dimension
         mock_response = MagicMock()
         mock_response.embeddings = [MagicMock(values=[0.1] * 100)]
-        gemini_provider.client.models.embed_content = MagicMock(return_value=mock_response)
+        gemini_provider.client.aio.models.embed_content = AsyncMock(return_value=mock_response)
 
         with pytest.raises(ValueError, match="Expected embedding dimension"):
             await gemini_provider.embed_text("test")
 
     @pytest.mark.asyncio
     async def test_embed_batch_success(self, gemini_provider, mock_embedding):
-        """Test successful batch embedding."""
-        texts = ["text1", "text2", "text3"]
+        """Uncached texts go out as one multi-content request with one quota reservation."""
+        texts = ["text1", "text2", "text3", "text2"]
 
-        # Mock the embed_content method
         mock_response = MagicMock()
-        mock_response.embeddings = [MagicMock(values=mock_embedding)]
-        gemini_provider.client.models.embed_content = MagicMock(return_value=mock_response)
+        mock_response.embeddings = [MagicMock(values=[float(i)] * 768) for i in range(3)]
+        gemini_provider.client.aio.models.embed_content = AsyncMock(return_value=mock_response)
+        reserve = AsyncMock(wraps=gemini_provider.quota_manager.reserve)
+        gemini_provider.quota_manager.reserve = reserve
 
         results = await gemini_provider.embed_batch(texts)
 
-        assert len(results) == 3
-        assert all(len(emb) == 768 for emb in results)
-        assert gemini_provider.client.models.embed_content.call_count == 3
+        assert [emb[0] for emb in results] == [0.0, 1.0, 2.0, 1.0]
+        gemini_provider.client.aio.models.embed_content.assert_called_once()
+        call = gemini_provider.client.aio.models.embed_content.call_args
+        assert call.kwargs["contents"] == ["text1", "text2", "text3"]
+        reserve.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_retries_only_failed_items(self, gemini_provider):
+        """Items missing or invalid in a response are re-sent on their own."""
+        responses = [
+            MagicMock(embeddings=[MagicMock(values=[1.0] * 768), MagicMock(values=[0.1] * 3)]),
+            MagicMock(embeddings=[MagicMock(values=[2.0] * 768)]),
+            MagicMock(embeddings=[MagicMock(values=[3.0] * 768)]),
+        ]
+        gemini_provider.client.aio.models.embed_content = AsyncMock(side_effect=responses)
+
+        results = await gemini_provider.embed_batch(["first", "second", "third"])
+
+        calls = gemini_provider.client.aio.models.embed_content.call_args_list
+        assert calls[0].kwargs["contents"] == ["first", "second", "third"]
+        assert calls[1].kwargs["contents"] == ["second", "third"]
+        assert calls[2].kwargs["contents"] == "third"
+        assert [emb[0] for emb in results] == [1.0, 2.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_splits_rejected_request(self, gemini_provider):
+        """A request rejected outright is bisected so only the bad item fails."""
+
+        def _embed(model, contents, config):
+            items = [contents] if isinstance(contents, str) else contents
+            if "bad" in items:
+                raise genai_errors.ClientError(400, {"error": {"message": "bad item", "status": "INVALID_ARGUMENT"}})
+            return MagicMock(embeddings=[MagicMock(values=[0.5] * 768) for _ in items])
+
+        gemini_provider.client.aio.models.embed_content = AsyncMock(side_effect=_embed)
+
+        with pytest.raises(genai_errors.ClientError, match="INVALID_ARGUMENT"):
+            await gemini_provider.embed_batch(["ok1", "ok2", "ok3", "bad"])
+        # ok1/ok2 succeeded as one half and were not re-sent individually
+        sent = [call.kwargs["contents"] for call in gemini_provider.client.aio.models.embed_content.call_args_list]
+        assert sent == [["ok1", "ok2", "ok3", "bad"], ["ok1", "ok2"], ["ok3", "bad"], "ok3", "bad"]
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_does_not_split_on_server_error(self, gemini_provider):
+        """Transient failures are re-raised without fanning out into more requests."""
+        gemini_provider.client.aio.models.embed_content = AsyncMock(
+            side_effect=genai_errors.ServerError(503, {"error": {"status": "UNAVAILABLE"}})
+        )
+
+        with pytest.raises(genai_errors.ServerError):
+            await gemini_provider.embed_batch(["a", "b", "c", "d"])
+        gemini_provider.client.aio.models.embed_content.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_failure_keeps_finished_requests_and_cancels_rest(
+        self, gemini_provider
+    ):
+        """A failed request cancels pending siblings; finished ones stay cached."""
+        cancelled = asyncio.Event()
+
+        async def _embed(model, contents, config):
+            if contents == "ok":
+                return MagicMock(embeddings=[MagicMock(values=[0.5] * 768)])
+            if contents == "slow":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            await asyncio.sleep(0.01)
+            raise genai_errors.ServerError(503, {"error": {"status": "UNAVAILABLE"}})
+
+        gemini_provider.client.aio.models.embed_content = AsyncMock(side_effect=_embed)
+        gemini_provider._plan_requests = lambda texts: [[index] for index in range(len(texts))]
+        gemini_provider.cache = EmbeddingCache(model="text-embedding-004", dimension=768)
+
+        with pytest.raises(genai_errors.ServerError):
+            await gemini_provider.embed_batch(["ok", "slow", "down"])
+
+        assert cancelled.is_set()
+        assert gemini_provider.cache.get("ok") == [0.5] * 768
+        assert gemini_provider.cache.get("slow") is None
+
+    def test_concurrency_derives_from_quota_profile(self):
+        from app.infrastructure.services.embeddings.gemini import resolve_embedding_concurrency
+
+        with patch("app.infrastructure.services.embeddings.gemini.settings") as mock_settings:
+            mock_settings.embedding_max_concurrency = None
+            mock_settings.embedding_rpm_limit = 100
+            assert resolve_embedding_concurrency() == 10
+            mock_settings.embedding_rpm_limit = 5
+            assert resolve_embedding_concurrency() == 1
+            mock_settings.embedding_rpm_limit = 3000
+            assert resolve_embedding_concurrency() == 16
+            mock_settings.embedding_max_concurrency = 4
+            assert resolve_embedding_concurrency() == 4
+
+    def test_plan_requests_bounds_count_and_tokens(self, gemini_provider):
+        with patch(
+            "app.infrastructure.services.embeddings.gemini.settings"
+        ) as mock_settings:
+            mock_settings.embedding_batch_size = 3
+            mock_settings.embedding_tpm_limit = 100
+            plan = gemini_provider._plan_requests(["a"] * 7 + ["long text " * 200, "b"])
+
+        assert plan == [[0, 1, 2], [3, 4, 5], [6], [7], [8]]
 
     @pytest.mark.asyncio
     async def test_embed_batch_empty_raises(self, gemini_provider):
@@ -182,7 +316,7 @@ class TestEmbeddingCache:
     def test_cache_set_and_get(self):
         """Test setting and getting from cache."""
         cache = EmbeddingCache(max_size=100, ttl_seconds=3600)
-        embedding = [0.1, 0.2, 0.3]
+        embedding = [0.5, 0.25, 0.125]  # exact in float32
 
         cache.set("test", embedding)
         result = cache.get("test")
@@ -204,13 +338,32 @@ class TestEmbeddingCache:
         """Test LRU eviction when cache is full."""
         cache = EmbeddingCache(max_size=2, ttl_seconds=3600)
 
-        cache.set("key1", [0.1])
-        cache.set("key2", [0.2])
-        cache.set("key3", [0.3])  # Should evict key1
+        cache.set("key1", [0.5])
+        cache.set("key2", [0.25])
+        cache.set("key3", [0.125])  # Should evict key1
 
         assert cache.get("key1") is None  # Evicted
-        assert cache.get("key2") == [0.2]
-        assert cache.get("key3") == [0.3]
+        assert cache.get("key2") == [0.25]
+        assert cache.get("key3") == [0.125]
+
+    def test_cache_stores_float32_in_fixed_slab(self):
+        """Vectors share one preallocated float32 slab; evicted slots are reused."""
+        cache = EmbeddingCache(max_size=2, ttl_seconds=3600, dimension=3)
+
+        cache.set("key1", [0.1, 0.2, 0.3])
+        cache.set("key2", [1.0, 2.0, 3.0])
+        cache.set("key3", [4.0, 5.0, 6.0])  # Evicts key1, reuses its slot
+
+        assert cache.get("key2") == [1.0, 2.0, 3.0]
+        assert cache.get("key3") == [4.0, 5.0, 6.0]
+        assert cache.get_stats()["slab_bytes"] == 2 * 3 * 4
+        assert sorted(slot for slot, _ in cache.cache.values()) == [0, 1]
+
+        cache.set("key2", [0.1, 0.2, 0.3])
+        assert cache.get("key2") == pytest.approx([0.1, 0.2, 0.3])
+
+        with pytest.raises(ValueError, match="dimension"):
+            cache.set("key4", [0.1])
 
     def test_cache_stats(self):
         """Test cache statistics."""
@@ -236,3 +389,86 @@ class TestEmbeddingCache:
         assert len(cache.cache) == 0
         assert cache.hits == 0
         assert cache.misses == 0
+
+
+class TestPersistentEmbeddingCache:
+    """Test the SQLite tier behind the in-memory cache."""
+
+    def test_store_survives_restart_and_promotes_to_memory(self, tmp_path):
+        path = tmp_path / "embeddings.sqlite3"
+        store = SqliteEmbeddingStore(path)
+        EmbeddingCache(model="m", dimension=3, store=store).set_many(
+            [("a", [0.5, 0.25, 1.0]), ("b", [1.0, 2.0, 3.0])]
+        )
+        store.close()
+
+        # A fresh process opens the same file with an empty L1
+        cache = EmbeddingCache(model="m", dimension=3, store=SqliteEmbeddingStore(path))
+        assert cache.get_many(["a", "b", "c"]) == [[0.5, 0.25, 1.0], [1.0, 2.0, 3.0], None]
+        assert cache.get_stats()["store_hits"] == 2
+        assert len(cache.cache) == 2
+        assert cache.get("a") == [0.5, 0.25, 1.0]
+        assert cache.store_hits == 2  # served from memory this time
+
+    def test_store_is_keyed_by_model_and_dimension(self, tmp_path):
+        store = SqliteEmbeddingStore(tmp_path / "embeddings.sqlite3")
+        EmbeddingCache(model="m", dimension=3, store=store).set("a", [0.1, 0.2, 0.3])
+
+        assert EmbeddingCache(model="other", dimension=3, store=store).get("a") is None
+        assert EmbeddingCache(model="m", dimension=2, store=store).get("a") is None
+        assert store.count("m", 3) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_store_calls_run_off_the_event_loop(self, tmp_path):
+        store = SqliteEmbeddingStore(tmp_path / "embeddings.sqlite3")
+        cache = EmbeddingCache(model="m", dimension=3, store=store)
+        threads = []
+        for name in ("get_many", "set_many"):
+            original = getattr(store, name)
+
+            def record(*args, _original=original, **kwargs):
+                threads.append(threading.get_ident())
+                return _original(*args, **kwargs)
+
+            setattr(store, name, record)
+
+        await cache.aset_many([("a", [0.5, 0.25, 1.0])])
+        cache.clear()
+        assert await cache.aget_many(["a", "b"]) == [[0.5, 0.25, 1.0], None]
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+    def test_locked_store_degrades_to_miss(self, tmp_path):
+        path = tmp_path / "embeddings.sqlite3"
+        cache = EmbeddingCache(model="m", dimension=3, store=SqliteEmbeddingStore(path))
+        writer = sqlite3.connect(str(path), isolation_level=None)
+        writer.execute("BEGIN EXCLUSIVE")
+        try:
+            cache.set("a", [0.1, 0.2, 0.3])  # write skipped, L1 still updated
+            cache.clear()
+            assert cache.get("a") is None
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_skips_api_for_stored_texts(self, tmp_path, mock_embedding):
+        store = SqliteEmbeddingStore(tmp_path / "embeddings.sqlite3")
+        EmbeddingCache(model="text-embedding-004", dimension=768, store=store).set(
+            "stored", mock_embedding
+        )
+
+        with patch("google.genai.Client"), patch(
+            "app.infrastructure.services.embeddings.gemini.get_embedding_store",
+            return_value=store,
+        ):
+            reset_quota_manager()
+            provider = GeminiEmbeddingProvider(api_key="test-key", model="text-embedding-004")
+            provider._embed_request = AsyncMock(return_value=[[0.2] * 768])
+
+            embeddings = await provider.embed_batch(["stored", "fresh"])
+            reset_quota_manager()
+
+        assert embeddings[0] == pytest.approx(mock_embedding)
+        provider._embed_request.assert_awaited_once_with(["fresh"])
+        assert store.count("text-embedding-004", 768) == 2
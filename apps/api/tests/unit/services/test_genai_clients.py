@@ -0,0 +1,128 @@
+"""
+Unit tests for shared Gemini clients and request pools.
+
+Tests in-flight limits, saturation stats and slot release on cancellation.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.core.quota_manager import reset_quota_manager
+from app.infrastructure.services.genai_clients import (
+    RequestPool,
+    get_genai_client,
+    get_request_pool,
+    get_request_pool_stats,
+)
+from app.infrastructure.services.llm import GeminiLLMProvider, LLMMessage
+
+
+class TestRequestPool:
+    """Test request pool."""
+
+    @pytest.mark.asyncio
+    async def test_limits_in_flight_and_counts_saturation(self):
+        pool = RequestPool("test", 2)
+        in_flight = 0
+        peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            async with pool.slot():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(5)))
+
+        stats = pool.get_stats()
+        assert peak == 2
+        assert stats["peak_in_flight"] == 2
+        assert stats["requests"] == 5
+        assert stats["saturated"] == 3
+        assert stats["in_flight"] == 0 and stats["waiting"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancellation_frees_slot_and_queue_position(self):
+        pool = RequestPool("test", 1)
+        hold = asyncio.Event()
+
+        async def request():
+            async with pool.slot():
+                await hold.wait()
+
+        running = asyncio.create_task(request())
+        queued = asyncio.create_task(request())
+        await asyncio.sleep(0)
+        assert pool.get_stats()["waiting"] == 1
+
+        queued.cancel()
+        running.cancel()
+        await asyncio.gather(running, queued, return_exceptions=True)
+
+        assert pool.get_stats()["in_flight"] == 0
+        assert pool.get_stats()["waiting"] == 0
+        assert pool.cancelled == 2
+        async with pool.slot():  # capacity is available again
+            pass
+
+    @pytest.mark.asyncio
+    async def test_resize_admits_waiters(self):
+        pool = RequestPool("test", 1)
+        hold = asyncio.Event()
+
+        async def request():
+            async with pool.slot():
+                await hold.wait()
+
+        tasks = [asyncio.create_task(request()) for _ in range(3)]
+        await asyncio.sleep(0)
+        pool.resize(3)
+        await asyncio.sleep(0)
+
+        assert pool.in_flight == 3
+        hold.set()
+        await asyncio.gather(*tasks)
+
+
+def test_clients_and_pools_are_shared_process_wide():
+    with patch("google.genai.Client", side_effect=lambda api_key: MagicMock()) as client_class:
+        assert get_genai_client("key") is get_genai_client("key")
+        assert get_genai_client("key") is not get_genai_client("other")
+        assert client_class.call_count == 2
+
+    pool = get_request_pool("gemini_llm", 4)
+    assert get_request_pool("gemini_llm", 4) is pool
+    assert get_request_pool_stats()["gemini_llm"]["limit"] == 4
+
+
+@pytest.mark.asyncio
+async def test_llm_timeout_releases_pool_slot(monkeypatch):
+    """A timed-out generate call is cancelled and its slot freed (no stuck worker thread)."""
+    monkeypatch.setattr(settings, "llm_timeout_ms", 20)
+    with patch("google.genai.Client"):
+        reset_quota_manager()
+        provider = GeminiLLMProvider(api_key="test-key")
+        cancelled = asyncio.Event()
+
+        async def hang(**kwargs):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        provider.client.aio.models.generate_content = hang
+
+        with pytest.raises(TimeoutError):
+            await provider.generate([LLMMessage(role="user", content="Hello!")])
+        reset_quota_manager()
+
+    assert cancelled.is_set()
+    stats = get_request_pool_stats()["gemini_llm"]
+    assert stats["in_flight"] == 0
+    assert stats["cancelled"] == 1
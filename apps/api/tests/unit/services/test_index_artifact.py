@@ -0,0 +1,83 @@
+"""
+Unit tests for the memory-mapped index artifact.
+
+Tests writing, mapping and versioning artifacts in a temporary directory.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.infrastructure.services.rag.index_artifact import (  # noqa: E402
+    CURRENT_FILE,
+    load_index_artifact,
+    write_index_artifact,
+)
+from app.infrastructure.services.rag.local_retriever import LocalIndex  # noqa: E402
+from app.infrastructure.services.rag.types import RetrievalOptions  # noqa: E402
+
+DIMENSION = 8
+
+
+def _rows():
+    document = {"content_path": "sipadan.md", "doc_type": "destination",
+                "destination": "Sipadan", "tags": ["turtles", "walls"], "title": "Sipadan"}
+    return [
+        {"id": uuid4(), "text": "Turtles at Barracuda Point",
+         "embedding": [2.0, 0, 0, 0, 0, 0, 0, 0],
+         "metadata": {**document, "chunk_index": 0, "section_header": "Marine life"}},
+        {"id": uuid4(), "text": "Currents can be strong — dive with a guide",
+         "embedding": [0, 1.0, 0, 0, 0, 0, 0, 0],
+         "metadata": {**document, "chunk_index": 1, "section_header": None}},
+        {"id": uuid4(), "text": "Open Water depth limit is 18 meters",
+         "embedding": [1.0, 1.0, 0, 0, 0, 0, 0, 0],
+         "metadata": {"content_path": "ow.md", "doc_type": "certification", "tags": []}},
+    ]
+
+
+def test_artifact_round_trips_through_memory_maps(tmp_path):
+    rows = _rows()
+    manifest = write_index_artifact(
+        tmp_path, rows, model="text-embedding-004", dimension=DIMENSION, generation=7
+    )
+
+    artifact = load_index_artifact(
+        tmp_path, model="text-embedding-004", dimension=DIMENSION, verify=True
+    )
+    assert artifact.manifest["content_hash"] == manifest["content_hash"]
+    assert artifact.manifest["vocabularies"]["tags"] == ["turtles", "walls"]
+    assert isinstance(artifact.matrix, np.memmap)
+    assert not artifact.matrix.flags.writeable
+
+    index = LocalIndex.from_artifact(artifact)
+    assert index.generation == 7
+    assert index.ids[1] == rows[1]["id"]
+    assert index.row_by_id[rows[2]["id"]] == 2
+    assert index.texts[1] == rows[1]["text"]
+    assert index.metadata[0] == rows[0]["metadata"]
+    assert index.metadata[1] == rows[1]["metadata"]
+    assert index.metadata[2] == rows[2]["metadata"]
+
+    rows_found, scores = index.search(
+        [1.0] + [0.0] * (DIMENSION - 1),
+        RetrievalOptions(top_k=3, filters={"tags": ["turtles"]}),
+    )
+    assert rows_found.tolist() == [0, 1]
+    assert scores[0] == pytest.approx(1.0)
+
+
+def test_new_version_becomes_current_and_old_versions_are_pruned(tmp_path):
+    rows = _rows()
+    for generation in (1, 2, 3):
+        manifest = write_index_artifact(
+            tmp_path, rows[:generation], model="m", dimension=DIMENSION, generation=generation
+        )
+
+    assert (tmp_path / CURRENT_FILE).read_text() == manifest["version"]
+    assert load_index_artifact(tmp_path).manifest["rows"] == 3
+    assert len([path for path in tmp_path.iterdir() if path.is_dir()]) == 2
+
+    with pytest.raises(ValueError, match="dimension"):
+        load_index_artifact(tmp_path, dimension=DIMENSION * 2)
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.core.config import settings
 from app.core.quota_manager import (
     QuotaDecision,
     QuotaExceededError,
@@ -98,7 +99,7 @@ class TestGeminiLLMProvider:
             candidates_token_count=12,
             total_token_count=22,
         )
-        gemini_provider.client.models.generate_content = MagicMock(return_value=mock_response)
+        gemini_provider.client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         gemini_provider.quota_manager.reserve = AsyncMock(
             return_value=QuotaDecision(
@@ -146,7 +147,7 @@ class TestGeminiLLMProvider:
         with pytest.raises(QuotaExceededError):
             await gemini_provider.generate(test_messages)
 
-        gemini_provider.client.models.generate_content.assert_not_called()
+        gemini_provider.client.aio.models.generate_content.assert_not_called()
 
 
 class TestLLMFactory:
@@ -182,6 +183,21 @@ class TestLLMFactory:
         # Should fallback to Gemini without recursive self-calls
         assert isinstance(provider, GeminiLLMProvider)
 
+    @patch("google.genai.Client")
+    def test_providers_share_pooled_client_per_model(self, mock_client):
+        """Handles differ only in per-call defaults; one client serves every model."""
+        classifier = create_llm_provider(api_key="key", temperature=0.0, max_tokens=10)
+        agent = create_llm_provider(api_key="key")
+        other_model = create_llm_provider(api_key="key", model="gemini-2.0-flash")
+
+        assert classifier is not agent
+        assert (classifier.temperature, classifier.max_tokens) == (0.0, 10)
+        assert agent.max_tokens == settings.llm_max_tokens
+        assert classifier.client is agent.client is other_model.client
+        assert classifier.quota_manager is agent.quota_manager
+        assert other_model.model == "gemini-2.0-flash"
+        mock_client.assert_called_once_with(api_key="key")
+
     @patch("app.infrastructure.services.llm.factory.settings")
     def test_create_provider_unknown_raises(self, mock_settings):
         """Test that unknown provider raises ValueError."""
@@ -0,0 +1,162 @@
+"""
+Unit tests for the in-process local vector retriever.
+
+Tests search, filters and index refresh against a hand-built index.
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.infrastructure.services.rag.local_retriever import (  # noqa: E402
+    LocalIndex,
+    LocalVectorRetriever,
+)
+from app.infrastructure.services.rag.types import RetrievalOptions  # noqa: E402
+
+DIMENSION = 768
+
+
+def _vector(*head):
+    return list(head) + [0.0] * (DIMENSION - len(head))
+
+
+def _build_index(generation=1):
+    ids = [uuid4() for _ in range(4)]
+    return LocalIndex.build(
+        generation,
+        ids,
+        ["Sipadan turtles", "Open Water limits", "Tioman reefs", "Nitrox basics"],
+        [
+            {"content_path": "sipadan.md", "doc_type": "destination", "destination": "Sipadan",
+             "tags": ["turtles", "walls"]},
+            {"content_path": "ow.md", "doc_type": "certification", "tags": ["depth"]},
+            {"content_path": "tioman.md", "doc_type": "site", "destination": "Tioman",
+             "tags": ["reef"]},
+            {"content_path": "nitrox.md", "doc_type": "certification"},
+        ],
+        [
+            _vector(3.0, 0.0),  # normalized to [1, 0]
+            _vector(0.6, 0.8),
+            _vector(0.8, 0.6),
+            _vector(0.0, 2.0),
+        ],
+        DIMENSION,
+    )
+
+
+@pytest.fixture
+def retriever():
+    provider = MagicMock()
+    provider.embed_text = AsyncMock(return_value=_vector(1.0, 0.0))
+    local = LocalVectorRetriever(embedding_provider=provider, refresh_seconds=3600)
+    local._index = _build_index()
+    local._checked_at = time.monotonic()
+    return local
+
+
+class TestLocalVectorRetriever:
+    """Test local vector retriever."""
+
+    @pytest.mark.asyncio
+    async def test_retrieve_orders_by_similarity_and_applies_min_similarity(self, retriever):
+        results = await retriever.retrieve(
+            "turtles", RetrievalOptions(top_k=3, min_similarity=0.5)
+        )
+
+        assert [r.source_citation for r in results] == ["sipadan.md", "tioman.md", "ow.md"]
+        assert results[0].similarity == pytest.approx(1.0)
+        assert results[1].similarity == pytest.approx(0.8)
+
+        results = await retriever.retrieve(
+            "turtles", RetrievalOptions(top_k=5, min_similarity=0.7)
+        )
+        assert [r.source_citation for r in results] == ["sipadan.md", "tioman.md"]
+
+    @pytest.mark.asyncio
+    async def test_retrieve_evaluates_filters_on_columns(self, retriever):
+        results = await retriever.retrieve(
+            "q", RetrievalOptions(top_k=5, filters={"doc_type": ["certification", "site"]})
+        )
+        assert [r.source_citation for r in results] == ["tioman.md", "ow.md", "nitrox.md"]
+
+        results = await retriever.retrieve(
+            "q", RetrievalOptions(top_k=5, filters={"destination": "Tioman"})
+        )
+        assert [r.source_citation for r in results] == ["tioman.md"]
+
+        results = await retriever.retrieve(
+            "q", RetrievalOptions(top_k=5, filters={"tags": ["turtles", "walls"]})
+        )
+        assert [r.source_citation for r in results] == ["sipadan.md"]
+
+        results = await retriever.retrieve(
+            "q", RetrievalOptions(top_k=5, filters={"tags": ["unknown"]})
+        )
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_hybrid_fuses_keyword_ranking_locally(self, retriever):
+        index = retriever._index
+        keyword_ids = [index.ids[3], index.ids[2], uuid4()]  # unknown id is skipped
+
+        with patch.object(retriever, "_keyword_search", AsyncMock(return_value=keyword_ids)):
+            results = await retriever.retrieve_hybrid(
+                "nitrox", RetrievalOptions(top_k=3), keyword_weight=0.5, rrf_k=60
+            )
+
+        # tioman: 0.5/62 + 0.5/62 beats sipadan's 0.5/61 semantic-only score
+        assert [r.source_citation for r in results] == ["tioman.md", "sipadan.md", "nitrox.md"]
+        assert results[0].similarity == pytest.approx(1 / 62)
+
+    @pytest.mark.asyncio
+    async def test_index_reloads_when_content_generation_changes(self, retriever):
+        retriever.refresh_seconds = 0
+        reloaded = _build_index(generation=2)
+
+        with patch(
+            "app.infrastructure.services.rag.local_retriever.read_content_generation",
+            AsyncMock(side_effect=[1, 2, RuntimeError("db down")]),
+        ), patch.object(retriever, "_load_index", AsyncMock(return_value=reloaded)) as load:
+            assert (await retriever._ensure_index()).generation == 1
+            assert (await retriever._ensure_index()) is reloaded
+            # A failed refresh keeps serving the last snapshot
+            assert (await retriever._ensure_index()) is reloaded
+
+        load.assert_awaited_once_with(2)
+        assert retriever.get_index_stats()["generation"] == 2
+
+    @pytest.mark.asyncio
+    async def test_index_artifact_is_mapped_when_generation_matches(self, tmp_path):
+        from app.infrastructure.services.rag.index_artifact import write_index_artifact
+
+        write_index_artifact(
+            tmp_path,
+            [{"id": uuid4(), "text": "Sipadan turtles", "embedding": _vector(1.0),
+              "metadata": {"content_path": "sipadan.md"}}],
+            model="text-embedding-004",
+            dimension=DIMENSION,
+            generation=3,
+        )
+        provider = MagicMock()
+        provider.embed_text = AsyncMock(return_value=_vector(1.0))
+        local = LocalVectorRetriever(embedding_provider=provider, index_path=tmp_path)
+        database_load = AsyncMock(return_value=_build_index(generation=4))
+
+        with patch(
+            "app.infrastructure.services.rag.local_retriever.read_content_generation",
+            AsyncMock(side_effect=[3, 4]),
+        ), patch.object(local, "_load_from_database", database_load):
+            results = await local.retrieve("turtles")
+            assert [r.source_citation for r in results] == ["sipadan.md"]
+            assert local.get_index_stats()["source"].startswith(str(tmp_path))
+            database_load.assert_not_awaited()
+
+            # Stale artifact (generation 3 < 4) falls back to the database
+            local._checked_at = 0.0
+            assert (await local._ensure_index()).generation == 4
+            database_load.assert_awaited_once_with(4)
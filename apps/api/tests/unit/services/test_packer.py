@@ -0,0 +1,91 @@
+"""
+Unit tests for context packing.
+
+Tests dedupe, adjacent-chunk merging and MMR budget filling.
+"""
+
+from app.infrastructure.services.rag.chunker import chunk_text, count_tokens
+from app.infrastructure.services.rag.packer import ContextPacker, merge_chunk_texts
+from app.infrastructure.services.rag.types import ChunkingOptions, RetrievalResult
+
+
+def _result(chunk_id, text, similarity, path="tioman.md", chunk_index=None):
+    metadata = {"content_path": path}
+    if chunk_index is not None:
+        metadata["chunk_index"] = chunk_index
+    return RetrievalResult(chunk_id=chunk_id, text=text, similarity=similarity, metadata=metadata)
+
+
+class TestContextPacker:
+    """Test context packer."""
+
+    def test_adjacent_chunks_merge_without_repeating_overlap(self):
+        sites = ["Renggis", "Chebeh", "Labas", "Tiger Reef", "Soyak", "Malang Rocks"]
+        paragraphs = [
+            f"{site} lies off Tioman. Visibility at {site} reaches {10 + i} meters "
+            f"and divers often meet species number {i} there."
+            for i, site in enumerate(sites)
+        ]
+        chunks = chunk_text(
+            "## Dive sites\n\n" + "\n\n".join(paragraphs),
+            "tioman.md",
+            options=ChunkingOptions(target_tokens=60, max_tokens=70, overlap_tokens=30),
+        )
+        assert len(chunks) >= 3
+        results = [
+            _result(str(i), chunk.text, 0.9 - i / 100, chunk_index=chunk.metadata["chunk_index"])
+            for i, chunk in enumerate(chunks[:3])
+        ]
+
+        ranked = [results[1], results[2], results[0]]
+        packed, stats = ContextPacker(token_budget=2000).pack(ranked)
+
+        assert len(packed) == 1
+        merged = packed[0]
+        assert merged.metadata["merged_chunk_indices"] == [0, 1, 2]
+        assert merged.text.count("## Dive sites") == 1
+        for paragraph in paragraphs[:4]:
+            assert merged.text.count(paragraph) == 1
+        # Merged passage keeps the best-ranked chunk's id and score
+        assert (merged.chunk_id, merged.similarity) == ("1", results[1].similarity)
+        assert stats.chunks_merged == 2
+        assert stats.output_tokens < stats.input_tokens
+        assert stats.to_dict()["tokens_saved"] == stats.input_tokens - stats.output_tokens
+
+    def test_contained_chunk_from_same_document_is_dropped(self):
+        results = [
+            _result("1", "Tioman has calm reefs and turtles near Renggis.", 0.9, chunk_index=4),
+            _result("2", "calm reefs and turtles near Renggis", 0.8, chunk_index=9),
+            _result("3", "calm reefs and turtles near Renggis", 0.7, path="other.md"),
+        ]
+
+        packed, stats = ContextPacker(token_budget=2000).pack(results)
+
+        assert [r.chunk_id for r in packed] == ["1", "3"]
+        assert stats.duplicates_dropped == 1
+
+    def test_budget_fill_prefers_novel_content(self):
+        text = "Nitrox extends no-decompression limits for recreational divers."
+        results = [
+            _result("1", text, 1.0, path="a.md"),
+            _result("2", text + " Always analyse your tank.", 0.95, path="b.md"),
+            _result("3", "Tioman monsoon season runs from November to February.", 0.9, path="c.md"),
+        ]
+        budget = count_tokens(results[0].text) + count_tokens(results[2].text)
+
+        packed, stats = ContextPacker(token_budget=budget, mmr_lambda=0.5).pack(results)
+
+        assert [r.chunk_id for r in packed] == ["1", "3"]
+        assert stats.over_budget_dropped == 1
+        assert stats.output_tokens <= budget
+
+    def test_top_passage_is_kept_even_over_budget(self):
+        packed, stats = ContextPacker(token_budget=1).pack(
+            [_result("1", "Sipadan requires a permit.", 0.9), _result("2", "Other", 0.8, path="b.md")]
+        )
+        assert [r.chunk_id for r in packed] == ["1"]
+        assert stats.output_chunks == 1
+
+    def test_merge_chunk_texts_without_shared_paragraphs_concatenates(self):
+        assert merge_chunk_texts("A\n\nB", "C") == "A\n\nB\n\nC"
+        assert merge_chunk_texts("H\n\nA\n\nB", "H\n\nB\n\nC") == "H\n\nA\n\nB\n\nC"
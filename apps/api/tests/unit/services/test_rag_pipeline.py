@@ -8,6 +8,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.core.config import settings
+from app.infrastructure.services.rag.cache import RetrievalCache
 from app.infrastructure.services.rag.pipeline import RAGPipeline
 from app.infrastructure.services.rag.types import RAGContext, RetrievalResult
 
@@ -55,6 +57,8 @@ class TestRAGPipeline:
         assert context.query == "test query"
         assert len(context.results) == 2
         assert context.formatted_context != ""
+        assert context.packing["input_chunks"] == 2
+        assert context.packing["output_chunks"] == 2
         mock_retriever.retrieve_hybrid.assert_called_once()
 
     @pytest.mark.asyncio
@@ -135,6 +139,16 @@ class TestRAGPipeline:
         assert len(results) == 2
         assert all(isinstance(r, RetrievalResult) for r in results)
 
+    @pytest.mark.asyncio
+    async def test_retrieve_context_raw_skips_packing(self, pipeline, mock_retriever):
+        """Raw results are the retriever's top-k, not the packed context."""
+        pipeline.packer = MagicMock()
+
+        results = await pipeline.retrieve_context_raw("test query")
+
+        assert len(results) == 2
+        pipeline.packer.pack.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_citations_are_deduped_with_stable_order(self, pipeline, mock_retriever):
         mock_retriever.retrieve_hybrid = AsyncMock(
@@ -162,3 +176,141 @@ class TestRAGPipeline:
 
         context = await pipeline.retrieve_context("query")
         assert context.citations == ["content/path/a.md", "content/path/b.md"]
+
+
+class _GenerationSource:
+    """Stands in for the content_generation table."""
+
+    def __init__(self, generation: int = 1):
+        self.generation = generation
+
+    def session_maker(self):
+        session = MagicMock()
+        result = MagicMock()
+        result.scalar.return_value = self.generation
+        session.execute = AsyncMock(return_value=result)
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=None)
+        return session
+
+
+class TestRetrievalCache:
+    """Test retrieval result caching in the pipeline."""
+
+    @pytest.fixture
+    def generation_source(self):
+        source = _GenerationSource()
+        with patch(
+            "app.infrastructure.services.rag.cache.get_session",
+            return_value=source.session_maker,
+        ):
+            yield source
+
+    @pytest.mark.asyncio
+    async def test_normalized_query_served_from_cache(
+        self, mock_retriever, generation_source
+    ):
+        pipeline = RAGPipeline(
+            retriever=mock_retriever,
+            cache=RetrievalCache(max_size=10, generation_check_seconds=0),
+        )
+
+        first = await pipeline.retrieve_context("Best dive sites in Tioman?")
+        second = await pipeline.retrieve_context("  best dive SITES in tioman ")
+        await pipeline.retrieve_context("best dive sites in tioman", filters={"doc_type": "dive_site"})
+
+        assert [r.chunk_id for r in second.results] == [r.chunk_id for r in first.results]
+        assert mock_retriever.retrieve_hybrid.await_count == 2
+        stats = pipeline.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_generation_bump_invalidates(self, mock_retriever, generation_source):
+        pipeline = RAGPipeline(
+            retriever=mock_retriever,
+            cache=RetrievalCache(max_size=10, generation_check_seconds=0),
+        )
+
+        await pipeline.retrieve_context("what is open water")
+        generation_source.generation += 1
+        await pipeline.retrieve_context("what is open water")
+
+        assert mock_retriever.retrieve_hybrid.await_count == 2
+        assert pipeline.get_cache_stats()["invalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bypasses_cache_when_generation_unavailable(self, mock_retriever):
+        pipeline = RAGPipeline(retriever=mock_retriever, cache=RetrievalCache(max_size=10))
+
+        with patch(
+            "app.infrastructure.services.rag.cache.get_session",
+            side_effect=RuntimeError("DB not initialized"),
+        ):
+            await pipeline.retrieve_context("what is open water")
+            await pipeline.retrieve_context("what is open water")
+
+        assert mock_retriever.retrieve_hybrid.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_generation_read_is_not_retried_within_interval(self):
+        cache = RetrievalCache(max_size=10, generation_check_seconds=60)
+        read = AsyncMock(side_effect=RuntimeError("DB not initialized"))
+
+        with patch("app.infrastructure.services.rag.cache.read_content_generation", read):
+            assert await cache.refresh_generation() is None
+            assert await cache.refresh_generation() is None
+
+        read.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_retrieve_context_many_batches_misses_only(
+        self, mock_retriever, generation_source
+    ):
+        pipeline = RAGPipeline(
+            retriever=mock_retriever,
+            cache=RetrievalCache(max_size=10, generation_check_seconds=0),
+        )
+        cached_query = "what is open water"
+        await pipeline.retrieve_context(cached_query)
+        result = RetrievalResult(chunk_id="7", text="Tioman reefs", similarity=0.9)
+        mock_retriever.retrieve_hybrid_many = AsyncMock(return_value=[[result], []])
+
+        contexts = await pipeline.retrieve_context_many(
+            ["tioman reefs", cached_query, "tioman reefs", "nitrox"]
+        )
+
+        # Cached and duplicate queries are not sent to the retriever again
+        retrieved_queries, options = mock_retriever.retrieve_hybrid_many.await_args[0]
+        assert retrieved_queries == ["tioman reefs", "nitrox"]
+        assert options.top_k == settings.rag_top_k
+        assert [context.query for context in contexts] == [
+            "tioman reefs", cached_query, "tioman reefs", "nitrox"
+        ]
+        assert contexts[0].results == [result] and contexts[2].results == [result]
+        assert contexts[1].has_data and not contexts[3].has_data
+        assert contexts[3].formatted_context == "NO_DATA"
+
+        # Batched results populate the cache for single-query lookups
+        await pipeline.retrieve_context("Tioman reefs")
+        assert mock_retriever.retrieve_hybrid.await_count == 1
+
+    def test_negative_entries_use_shorter_ttl_and_lru_evicts(self):
+        cache = RetrievalCache(max_size=2, ttl_seconds=600, negative_ttl_seconds=60)
+        result = RetrievalResult(chunk_id="1", text="chunk", similarity=0.9)
+
+        with patch("app.infrastructure.services.rag.cache.time.monotonic", return_value=0.0):
+            cache.set("no-data", [])
+            cache.set("found", [result])
+            assert cache.get("no-data") == []
+
+        with patch("app.infrastructure.services.rag.cache.time.monotonic", return_value=61.0):
+            assert cache.get("no-data") is None
+            assert cache.get("found") == [result]
+            cache.set("a", [result])
+            cache.set("b", [result])
+
+        stats = cache.get_stats()
+        assert stats["negative_hits"] == 1
+        assert stats["evictions"] == 1
+        assert "found" not in cache.cache
@@ -103,8 +103,98 @@ class TestVectorRetriever:
             results = await retriever.retrieve("test query", options)
 
             assert isinstance(results, list)
-            # Verify that execute was called (filters applied)
-            mock_session.execute.assert_called_once()
+            # Recall profile settings, then the filtered search
+            assert mock_session.execute.await_count == 2
+            search_sql = str(mock_session.execute.call_args_list[-1][0][0])
+            assert "content_embeddings.doc_type =" in search_sql
+            assert "ORDER BY content_embeddings.embedding <=>" in search_sql
+            assert "<= :param" in search_sql  # min_similarity pushed into SQL
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "profile, expected",
+        [
+            ("fast", {"hnsw.ef_search": "40"}),
+            (
+                "balanced",
+                {
+                    "hnsw.ef_search": "100",
+                    "hnsw.iterative_scan": "strict_order",
+                    "hnsw.max_scan_tuples": "20000",
+                },
+            ),
+            ("exact", {"enable_indexscan": "off"}),
+        ],
+    )
+    async def test_recall_profile_sets_transaction_local_search_settings(
+        self, retriever, profile, expected
+    ):
+        """Each recall profile issues set_config(..., is_local=true) before the search."""
+        options = RetrievalOptions(top_k=5, recall_profile=profile)
+        assert retriever._search_settings(options) == expected
+
+        mock_session = MagicMock()
+        mock_session.execute = AsyncMock()
+        await retriever._apply_recall_profile(mock_session, options)
+
+        compiled = mock_session.execute.call_args[0][0].compile()
+        assert str(compiled).count("set_config(") == len(expected)
+        assert set(expected.values()) <= set(compiled.params.values())
+        assert True in compiled.params.values()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "mode, operator, query_param",
+        [
+            ("halfvec", "embedding_half <=>", "query_half"),
+            ("binary", "embedding_bit <~>", "query_bits"),
+            ("matryoshka", "embedding_256 <=>", "query_prefix"),
+        ],
+    )
+    async def test_compact_mode_shortlists_then_reranks_on_full_vector(
+        self, mock_embedding_provider, mode, operator, query_param
+    ):
+        """Compact modes shortlist top_k * multiplier rows, then order by exact cosine."""
+        from sqlalchemy.dialects import postgresql
+
+        compact = VectorRetriever(
+            embedding_provider=mock_embedding_provider, vector_search_mode=mode
+        )
+        options = RetrievalOptions(top_k=5, filters={"doc_type": "faq"}, recall_profile="fast")
+        mock_session = self._hybrid_session([], [])
+
+        with patch("app.infrastructure.services.rag.retriever.get_session") as mock_get_session:
+            mock_get_session.return_value = MagicMock(return_value=mock_session)
+            await compact.retrieve("test query", options)
+
+        compiled = mock_session.execute.call_args_list[-1][0][0].compile(
+            dialect=postgresql.dialect()
+        )
+        sql = str(compiled)
+        assert "WITH shortlist AS" in sql
+        assert operator in sql
+        assert "ORDER BY content_embeddings.embedding <=>" in sql
+        assert 20 in compiled.params.values()  # shortlist: 5 * rag_shortlist_multiplier
+        assert query_param in compiled.params
+        # ef_search must cover the shortlist, not just top_k
+        assert compact._search_settings(options) == {"hnsw.ef_search": "40"}
+        assert compact._shortlist_mode(RetrievalOptions(recall_profile="exact")) is None
+
+    def test_binary_quantize_matches_pgvector_sign_rule(self):
+        from app.infrastructure.services.rag.quantization import binary_quantize
+
+        assert binary_quantize([0.3, -0.1, 0.0, 2.0]) == "1001"
+
+    def test_matryoshka_prefix_truncates_and_normalizes(self):
+        from app.infrastructure.services.rag.quantization import matryoshka_prefix
+
+        prefix = matryoshka_prefix([3.0, 4.0, 100.0], dimensions=2)
+        assert prefix == pytest.approx([0.6, 0.8])
+        assert matryoshka_prefix([0.0] * 4, dimensions=2) == [0.0, 0.0]
+
+    def test_recall_profile_raises_ef_search_to_top_k(self, retriever):
+        options = RetrievalOptions(top_k=64, recall_profile="fast")
+        assert retriever._search_settings(options) == {"hnsw.ef_search": "64"}
 
     @pytest.mark.asyncio
     async def test_retrieve_filters_by_min_similarity(self, retriever):
@@ -178,6 +268,167 @@ class TestVectorRetriever:
             executed_stmt = mock_session.execute.call_args[0][0]
             compiled_sql = str(executed_stmt)
             compiled_params = executed_stmt.compile().params
-            assert "metadata" in compiled_sql
-            assert "destination" in compiled_params.values()
-            assert '"reef"' in compiled_params.values()
+            assert "content_embeddings.doc_type =" in compiled_sql
+            assert "content_embeddings.destination =" in compiled_sql
+            assert "content_embeddings.tags @>" in compiled_sql
+            assert "metadata" not in compiled_sql.split("WHERE", 1)[1]
+            assert "Tioman Island, Malaysia" in compiled_params.values()
+            assert ["reef"] in compiled_params.values()
+
+    @staticmethod
+    def _hybrid_session(keyword_ids, rows):
+        """Session whose execute answers the keyword leg and the fused/body query."""
+        mock_session = MagicMock()
+
+        async def _execute(stmt):
+            result = MagicMock()
+            if "ts_rank" in str(stmt):
+                result.scalars.return_value.all.return_value = keyword_ids
+            else:
+                result.all.return_value = rows
+            return result
+
+        mock_session.execute = AsyncMock(side_effect=_execute)
+        mock_session.__aenter__.return_value = mock_session
+        mock_session.__aexit__.return_value = None
+        return mock_session
+
+    @pytest.mark.asyncio
+    async def test_retrieve_hybrid_fuses_keyword_ranking_in_sql(self, retriever):
+        """Hybrid search should fuse the keyword ranking with the vector leg in SQL."""
+        from sqlalchemy.dialects import postgresql
+
+        chunk_id = uuid4()
+        mock_rows = [
+            MagicMock(
+                id=chunk_id,
+                chunk_text="Tioman reef chunk",
+                metadata_={"content_path": "content/destinations/tioman.md"},
+                score=0.0161,
+            )
+        ]
+        options = RetrievalOptions(top_k=3, filters={"doc_type": "dive_site"})
+        mock_session = self._hybrid_session([chunk_id, uuid4()], mock_rows)
+
+        with patch("app.infrastructure.services.rag.retriever.get_session") as mock_get_session:
+            mock_get_session.return_value = MagicMock(return_value=mock_session)
+
+            results = await retriever.retrieve_hybrid(
+                "tioman reef", options, keyword_weight=0.4, rrf_k=30
+            )
+
+        # keyword ids, recall profile settings, fused statement
+        assert mock_session.execute.await_count == 3
+        compiled = mock_session.execute.call_args_list[-1][0][0].compile(
+            dialect=postgresql.dialect()
+        )
+        sql = str(compiled)
+        assert "WITH semantic AS" in sql
+        assert "VALUES" in sql
+        assert "FULL OUTER JOIN" in sql
+        assert "row_number() OVER" in sql
+        assert "ts_rank" not in sql
+        assert chunk_id in compiled.params.values()
+        assert compiled.params["rrf_k"] == 30
+        assert compiled.params["keyword_weight"] == 0.4
+        assert compiled.params["semantic_weight"] == pytest.approx(0.6)
+        assert results[0].chunk_id == str(chunk_id)
+        assert results[0].similarity == pytest.approx(0.0161)
+        assert results[0].source_citation == "content/destinations/tioman.md"
+
+    @pytest.mark.asyncio
+    async def test_retrieve_hybrid_falls_back_to_keyword_on_embedding_timeout(
+        self, retriever, monkeypatch
+    ):
+        """A slow embedding should degrade to keyword-only results, not fail."""
+        import asyncio
+
+        from app.infrastructure.services.rag import retriever as retriever_module
+
+        monkeypatch.setattr(retriever_module.settings, "rag_embedding_timeout_ms", 20)
+        embedding_cancelled = asyncio.Event()
+
+        async def _slow_embed(query):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                embedding_cancelled.set()
+                raise
+            return [0.1] * 768
+
+        retriever.embedding_provider.embed_text = _slow_embed
+        first_id, second_id = uuid4(), uuid4()
+        mock_rows = [
+            MagicMock(id=second_id, chunk_text="Second", metadata_={"content_path": "b.md"}),
+            MagicMock(id=first_id, chunk_text="First", metadata_={"content_path": "a.md"}),
+        ]
+        mock_session = self._hybrid_session([first_id, second_id], mock_rows)
+
+        with patch("app.infrastructure.services.rag.retriever.get_session") as mock_get_session:
+            mock_get_session.return_value = MagicMock(return_value=mock_session)
+
+            results = await retriever.retrieve_hybrid(
+                "tioman reef", RetrievalOptions(top_k=5), keyword_weight=0.3, rrf_k=60
+            )
+
+        assert embedding_cancelled.is_set()
+        assert [result.text for result in results] == ["First", "Second"]
+        assert results[0].similarity == pytest.approx(0.3 / 61)
+
+    @pytest.mark.asyncio
+    async def test_retrieve_hybrid_reraises_embedding_error_when_keyword_leg_is_empty(
+        self, retriever
+    ):
+        """Embedding failure plus an empty keyword leg is an error, not "no data"."""
+        retriever.embedding_provider.embed_text = AsyncMock(side_effect=RuntimeError("embed down"))
+        retriever._keyword_search = AsyncMock(return_value=[])
+
+        with pytest.raises(RuntimeError, match="embed down"):
+            await retriever.retrieve_hybrid("tioman reef", RetrievalOptions(top_k=5))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["full", "matryoshka"])
+    async def test_retrieve_many_embeds_once_and_searches_in_one_statement(
+        self, mock_embedding_provider, mode
+    ):
+        """Batched retrieval: one embed_batch call, one LATERAL statement, rows split per query."""
+        from sqlalchemy.dialects import postgresql
+
+        mock_embedding_provider.embed_batch = AsyncMock(return_value=[[0.1] * 768, [0.2] * 768])
+        batched = VectorRetriever(
+            embedding_provider=mock_embedding_provider, vector_search_mode=mode
+        )
+        mock_rows = [
+            MagicMock(ord=0, id=uuid4(), chunk_text="Tioman", metadata_={}, similarity=0.9),
+            MagicMock(ord=1, id=uuid4(), chunk_text="Nitrox", metadata_={}, similarity=0.8),
+            MagicMock(ord=1, id=uuid4(), chunk_text="Below", metadata_={}, similarity=0.1),
+        ]
+        mock_session = self._hybrid_session([], mock_rows)
+
+        with patch("app.infrastructure.services.rag.retriever.get_session") as mock_get_session:
+            mock_get_session.return_value = MagicMock(return_value=mock_session)
+            results = await batched.retrieve_many(
+                ["tioman reefs", "nitrox limits"],
+                RetrievalOptions(top_k=3, min_similarity=0.5, recall_profile="fast"),
+            )
+
+        mock_embedding_provider.embed_batch.assert_awaited_once_with(
+            ["tioman reefs", "nitrox limits"]
+        )
+        mock_embedding_provider.embed_text.assert_not_called()
+        assert [[r.text for r in per_query] for per_query in results] == [["Tioman"], ["Nitrox"]]
+
+        # One recall-profile SELECT plus the single batched search
+        assert mock_session.execute.await_count == 2
+        sql = str(
+            mock_session.execute.call_args_list[-1][0][0].compile(dialect=postgresql.dialect())
+        )
+        assert "VALUES" in sql
+        assert "JOIN LATERAL" in sql
+        assert "CAST(queries.query_embedding AS VECTOR(768))" in sql
+        assert ("embedding_256 <=> CAST(queries.query_compact" in sql) == (mode == "matryoshka")
+
+    @pytest.mark.asyncio
+    async def test_retrieve_many_rejects_empty_query(self, retriever):
+        with pytest.raises(ValueError, match="cannot be empty"):
+            await retriever.retrieve_many(["tioman", " "])